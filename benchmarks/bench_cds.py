@@ -0,0 +1,103 @@
+"""Time to main menu with and without the per-version AppCDS archive, on a real Minecraft install.
+
+Launches the version REPEAT times without class data sharing, once more to dump
+the archive, then REPEAT times with it. Each game is stopped (SIGTERM, an
+orderly JVM shutdown) as soon as it logs its first frame. Needs Java 21, a
+display and a POSIX system; the version is downloaded first if needed, into
+CATCLIENT_HOME like a normal launch.
+
+    python benchmarks/bench_cds.py --version 1.21.1 --repeat 3 --output cds_results.json
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catclient_core as core  # noqa: E402
+
+
+def time_to_first_frame(launcher, version, command, timeout):
+    """Launch command, return seconds until the first-frame log line (None if it never came), then stop the game."""
+    session = launcher.start_game(version, command)
+    deadline = time.monotonic() + timeout
+    while session.poll() is None and time.monotonic() < deadline:
+        if "first_frame" in session.status()["milestones"]:
+            break
+        time.sleep(0.05)
+    first_frame = session.status()["milestones"].get("first_frame")
+    if session.poll() is None:
+        session.process.terminate()
+    session.wait()
+    return first_frame
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CatClientHDR AppCDS benchmark")
+    parser.add_argument("--version", required=True, help="Minecraft version to launch, e.g. 1.21.1")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--ram", type=int, default=4, help="max heap in GB")
+    parser.add_argument("--timeout", type=float, default=180, help="seconds to wait for the first frame")
+    parser.add_argument("--output", default="cds_results.json")
+    args = parser.parse_args(argv)
+    if platform.system() == "Windows":
+        parser.error("stopping the game cleanly (so it dumps its archive) needs SIGTERM; run this on Linux or macOS")
+
+    launcher = core.LauncherCore()
+    if not launcher.ensure_version_manifest() or args.version not in launcher.versions:
+        print(f"Version {args.version} is not in the manifest")
+        return 1
+    launcher.install_java_if_needed()
+    if not launcher.download_version_files(args.version, launcher.versions[args.version]):
+        return 1
+    shutil.rmtree(os.path.join(core.VERSIONS_DIR, args.version, "cds"), ignore_errors=True)
+
+    def run(name, cds, count):
+        for _ in range(count):
+            command = launcher.build_launch_command(args.version, "BenchCat", args.ram, cds=cds)
+            seconds = time_to_first_frame(launcher, args.version, command, args.timeout)
+            if seconds is None:
+                raise RuntimeError(f"{name}: no first frame within {args.timeout:.0f}s; see {launcher.games.latest().log_path}")
+            results.setdefault(name, []).append(seconds)
+            print(f"{name}: {seconds:.2f}s", file=sys.stderr)
+
+    results = {}
+    run("without_cds", False, args.repeat)
+    run("archive_dump", True, 1)  # First CDS launch: runs normally and dumps the archive at exit
+    if not any(name.endswith(".jsa") and not name.endswith(".pending.jsa")
+               for name in os.listdir(os.path.join(core.VERSIONS_DIR, args.version, "cds"))):
+        print("The JVM did not leave a class-data archive; check the game log for [cds] warnings")
+        return 1
+    run("with_cds", True, args.repeat)
+
+    scenarios = {name: {"runs": [round(s, 3) for s in samples], "median": round(statistics.median(samples), 3),
+                        "min": round(min(samples), 3)} for name, samples in results.items()}
+    java = launcher.find_java()
+    report = {
+        "meta": {
+            "version": args.version,
+            "java": java["version"] if java else None,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "scenarios": scenarios,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'time to main menu':<20}{'median':>10}{'min':>10}")
+    for name, stats in scenarios.items():
+        print(f"{name:<20}{stats['median']:>9.2f}s{stats['min']:>9.2f}s")
+    baseline, cached = scenarios["without_cds"]["median"], scenarios["with_cds"]["median"]
+    print(f"AppCDS saves {baseline - cached:.2f}s ({(baseline - cached) / baseline * 100:.0f}%) per launch")
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,184 @@
+"""Benchmark the launcher pipeline against a local stand-in for Mojang and Adoptium.
+
+Times the manifest load, a cold install (Java + version files into an empty
+data folder), how soon a cold launch is ready when assets finish in the
+background, a warm relaunch with everything cached, and the launch-command
+build with and without its cached plan. Results are written as JSON; pass
+--compare with an earlier results file to print the change per scenario.
+
+    python benchmarks/bench_launcher.py --repeat 5 --latency-ms 20 --bandwidth-kbps 20000
+    python benchmarks/bench_launcher.py --output new.json --compare old.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import catclient_core as core  # noqa: E402
+from stand_in import ADOPTIUM_PATH, StandInServer  # noqa: E402
+
+
+def point_core_at(home, base_url):
+    """Redirect the launcher's data folder and endpoints to a scratch home and the stand-in."""
+    core.CATCLIENT_DIR = home
+    core.VERSIONS_DIR = os.path.join(home, "versions")
+    core.JAVA_DIR = os.path.join(home, "java")
+    core.ASSETS_DIR = os.path.join(home, "assets")
+    core.MANIFEST_CACHE_PATH = os.path.join(home, "version_manifest.json")
+    core.MANIFEST_META_PATH = os.path.join(home, "version_manifest.meta.json")
+    core.VERSION_MANIFEST_URL = f"{base_url}/meta/version_manifest.json"
+    core.ASSET_OBJECTS_URL = f"{base_url}/files/objects"
+    core.ADOPTIUM_API_URL = f"{base_url}{ADOPTIUM_PATH}"
+    core.MIRRORS = core.MirrorList(os.path.join(home, "mirrors.json"))  # No mirrors; only the stand-in is timed
+
+
+def timed(results, name, fn):
+    """Run fn, append its wall time to results[name], and fail loudly if the launcher reported failure."""
+    start = time.perf_counter()
+    ok = fn()
+    results.setdefault(name, []).append(time.perf_counter() - start)
+    if ok is False or ok == []:
+        raise RuntimeError(f"{name} failed; rerun with --verbose for the launcher's output")
+    return ok
+
+
+def run_once(server, scratch, version_id, results):
+    """One cold install into a fresh home followed by warm relaunches and launch-command builds."""
+    home = tempfile.mkdtemp(prefix="home-", dir=scratch)
+    point_core_at(home, server.base_url)
+    core.HTTP.close()  # A cold start also pays for new connections
+    core.TRACER.reset()  # Spans are not exported here; keep them from piling up across runs
+
+    launcher = core.LauncherCore()
+    timed(results, "manifest_cold", launcher.ensure_version_manifest)
+    version_url = launcher.versions[version_id]
+    timed(results, "cold_java", lambda: launcher.install_java_if_needed() or launcher.find_java() is not None)
+    timed(results, "cold_version_files", lambda: launcher.download_version_files(version_id, version_url))
+    results.setdefault("cold_install", []).append(results["cold_java"][-1] + results["cold_version_files"][-1])
+
+    # A new launcher object stands in for a restarted process; only on-disk caches carry over
+    launcher = core.LauncherCore()
+
+    def warm_relaunch():
+        return (launcher.ensure_version_manifest()
+                and (launcher.install_java_if_needed() or launcher.find_java() is not None)
+                and launcher.download_version_files(version_id, version_url)
+                and launcher.build_launch_command(version_id, "BenchCat", 2))
+
+    timed(results, "warm_relaunch", warm_relaunch)
+    timed(results, "manifest_warm", launcher.ensure_version_manifest)
+
+    plan_path = os.path.join(core.VERSIONS_DIR, version_id, f"{version_id}.plan.json")
+    os.remove(plan_path)
+    launcher = core.LauncherCore()
+    timed(results, "launch_command_uncached", lambda: launcher.build_launch_command(version_id, "BenchCat", 2))
+    timed(results, "launch_command_cached", lambda: launcher.build_launch_command(version_id, "BenchCat", 2))
+    shutil.rmtree(home, ignore_errors=True)
+
+    # How soon a cold launch could start the game when assets are left to the background
+    home = tempfile.mkdtemp(prefix="home-", dir=scratch)
+    point_core_at(home, server.base_url)
+    launcher = core.LauncherCore()
+    launcher.ensure_version_manifest()
+    timed(results, "cold_ready_to_launch",
+          lambda: launcher.download_version_files(version_id, version_url, defer_assets=True))
+    launcher.wait_for_background_jobs()
+    shutil.rmtree(home, ignore_errors=True)
+
+
+def summarize(samples):
+    return {
+        "runs": [round(s, 6) for s in samples],
+        "median": round(statistics.median(samples), 6),
+        "min": round(min(samples), 6),
+        "max": round(max(samples), 6),
+    }
+
+
+def print_table(scenarios, previous=None):
+    print(f"{'scenario':<26}{'median':>12}{'min':>12}" + (f"{'before':>12}{'change':>10}" if previous else ""))
+    for name, stats in scenarios.items():
+        line = f"{name:<26}{stats['median'] * 1000:>10.1f}ms{stats['min'] * 1000:>10.1f}ms"
+        old = (previous or {}).get(name)
+        if old:
+            change = (stats["median"] - old["median"]) / old["median"] * 100 if old["median"] else 0.0
+            line += f"{old['median'] * 1000:>10.1f}ms{change:>+9.1f}%"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CatClientHDR launcher benchmarks")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=0, help="delay added before every response")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0, help="total bandwidth cap in KiB/s (0 = unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="chance that an artifact response is a 503 or is cut off halfway")
+    parser.add_argument("--libraries", type=int, default=40)
+    parser.add_argument("--assets", type=int, default=400)
+    parser.add_argument("--client-mb", type=float, default=2)
+    parser.add_argument("--jdk-mb", type=float, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="earlier results file to diff against")
+    parser.add_argument("--verbose", action="store_true", help="show the launcher's own output")
+    args = parser.parse_args(argv)
+
+    if platform.system() == "Windows":
+        parser.error("the stand-in JDK is a POSIX shell script; run the benchmarks on Linux or macOS")
+    # Hide any system Java so the cold install really downloads and unpacks the JDK
+    os.environ["PATH"] = os.pathsep.join(d for d in os.environ.get("PATH", "").split(os.pathsep)
+                                         if not os.path.exists(os.path.join(d, "java")))
+
+    server = StandInServer(latency_ms=args.latency_ms, bandwidth_kbps=args.bandwidth_kbps, fail_rate=args.fail_rate,
+                           seed=args.seed, libraries=args.libraries, assets=args.assets,
+                           client_size=int(args.client_mb * 1024 * 1024), jdk_size=int(args.jdk_mb * 1024 * 1024)).start()
+    results = {}
+    traffic = []
+    scratch = tempfile.mkdtemp(prefix="catclient-bench-")
+    try:
+        for run in range(args.repeat):
+            quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+            with quiet:
+                run_once(server, scratch, "bench-1", results)
+            traffic.append(server.reset_stats())
+            print(f"run {run + 1}/{args.repeat}: cold install {results['cold_install'][-1]:.3f}s, "
+                  f"warm relaunch {results['warm_relaunch'][-1]:.3f}s", file=sys.stderr)
+    finally:
+        server.shutdown()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    scenarios = {name: summarize(samples) for name, samples in results.items()}
+    report = {
+        "meta": {
+            "launcher_version": core.LAUNCHER_VERSION,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "options": {k: v for k, v in vars(args).items() if k not in ("output", "compare", "verbose")},
+        },
+        "scenarios": scenarios,
+        "traffic": traffic,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    previous = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            previous = json.load(f)["scenarios"]
+    print_table(scenarios, previous)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Startup budget check: import cost of each launcher module (via `python -X importtime`) and time to first paint.
+
+Fails (exit code 1) when a module's best-of-N import time exceeds its budget,
+when startup pulls in a module that should only load on first use (Tk for the
+core and CLI, the network stack and archive modules for everything), or when
+the window takes longer than PAINT_BUDGET_MS to paint. The paint check is
+skipped when no display is available.
+
+    python benchmarks/bench_startup.py --repeat 7 --output startup_results.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that are only imported where they are used, never at startup
+LAZY_MODULES = ["ssl", "http.client", "urllib.request", "subprocess", "zipfile", "tarfile", "concurrent.futures",
+                "tempfile", "hashlib", "tkinter.filedialog"]
+
+IMPORT_BUDGETS_MS = {
+    "catclient_core": 60,
+    "catclient_cli": 70,
+    "catclient_ui": 120,
+}
+FORBIDDEN = {
+    "catclient_core": LAZY_MODULES + ["tkinter"],
+    "catclient_cli": LAZY_MODULES + ["tkinter"],
+    "catclient_ui": LAZY_MODULES,
+}
+PAINT_BUDGET_MS = 200
+
+PAINT_SCRIPT = """
+import time
+start = time.perf_counter()
+import tkinter
+try:
+    import catclient_ui
+    app = catclient_ui.CatClientHDRLauncher()
+except tkinter.TclError as e:
+    print("no-display", e)
+    raise SystemExit(0)
+app.update()
+print("painted", (time.perf_counter() - start) * 1000)
+app.destroy()
+"""
+
+
+def measure_import(module):
+    """Return (cumulative_ms, loaded_module_names) for one fresh-interpreter import of module."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"], cwd=ROOT,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True)
+    total_us = None
+    loaded = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue  # Header row
+        loaded.add(name.strip())
+        if name.strip() == module and not name.startswith("  "):
+            total_us = int(cumulative)
+    return total_us / 1000, loaded
+
+
+def measure_paint(home):
+    """Return milliseconds from interpreter start to the first painted frame, or None without a display."""
+    env = dict(os.environ, CATCLIENT_HOME=home)
+    result = subprocess.run([sys.executable, "-c", PAINT_SCRIPT], cwd=ROOT, env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=60)
+    for line in result.stdout.splitlines():
+        if line.startswith("painted"):
+            return float(line.split()[1])
+        if line.startswith("no-display"):
+            return None
+    raise RuntimeError(f"paint check failed:\n{result.stderr}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CatClientHDR startup budget check")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement; the best one counts")
+    parser.add_argument("--output", default="startup_results.json")
+    args = parser.parse_args(argv)
+
+    report = {"imports": {}, "paint": None, "violations": []}
+    for module, budget in IMPORT_BUDGETS_MS.items():
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        best = min(ms for ms, _ in runs)
+        loaded = runs[0][1]
+        eager = sorted(name for name in FORBIDDEN[module] if name in loaded)
+        report["imports"][module] = {"best_ms": round(best, 2), "budget_ms": budget, "eager_modules": eager,
+                                     "runs_ms": [round(ms, 2) for ms, _ in runs]}
+        print(f"{module:<16}{best:>8.1f} ms (budget {budget} ms)" + (f"  eager: {', '.join(eager)}" if eager else ""))
+        if best > budget:
+            report["violations"].append(f"{module} imports in {best:.1f} ms, over its {budget} ms budget")
+        if eager:
+            report["violations"].append(f"{module} imports {', '.join(eager)} at startup")
+
+    with tempfile.TemporaryDirectory(prefix="catclient-startup-") as home:
+        paints = [measure_paint(home) for _ in range(args.repeat)]
+    if None in paints:
+        print("first paint      skipped (no display)")
+    else:
+        best = min(paints)
+        report["paint"] = {"best_ms": round(best, 2), "budget_ms": PAINT_BUDGET_MS, "runs_ms": [round(ms, 2) for ms in paints]}
+        print(f"{'first paint':<16}{best:>8.1f} ms (budget {PAINT_BUDGET_MS} ms)")
+        if best > PAINT_BUDGET_MS:
+            report["violations"].append(f"first paint took {best:.1f} ms, over the {PAINT_BUDGET_MS} ms budget")
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    for violation in report["violations"]:
+        print(f"FAIL: {violation}")
+    return 1 if report["violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
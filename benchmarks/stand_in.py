@@ -0,0 +1,261 @@
+"""Local HTTP stand-in for the Mojang and Adoptium endpoints, with latency, bandwidth and failure knobs."""
+import gzip
+import hashlib
+import http.server
+import io
+import json
+import random
+import re
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+
+ADOPTIUM_PATH = "/adoptium/v3/assets/latest/21/hotspot"
+JDK_DIR_NAME = "jdk-21.0.5+11"
+SEND_CHUNK_SIZE = 16 * 1024
+FIXTURE_TIME = (2024, 1, 1, 0, 0, 0)
+
+# Answers the launcher's `java -XshowSettings:properties -version` probe, and writes the archive a game launch
+# asks for with -XX:ArchiveClassesAtExit as it exits
+FAKE_JAVA = """#!/bin/sh
+for arg in "$@"; do
+    case "$arg" in
+        -XX:ArchiveClassesAtExit=*) printf 'stand-in archive' > "${arg#*=}" ;;
+    esac
+done
+cat >&2 <<EOF
+Property settings:
+    java.vendor = Eclipse Adoptium
+    java.version = 21.0.5
+openjdk version "21.0.5" 2024-10-15 LTS
+EOF
+"""
+
+
+def sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+
+def build_fixture(base_url, versions=1, libraries=40, library_size=64 * 1024, assets=400, asset_size=2048,
+                  client_size=2 * 1024 * 1024, jdk_size=4 * 1024 * 1024, seed=0):
+    """Return {path: bytes} for a manifest, versions sharing libraries and assets, and a JDK archive.
+
+    Paths under /files/ are the artifacts the launcher downloads with retries;
+    only those are subject to failure injection.
+    """
+    rng = random.Random(seed)
+    files = {}
+
+    def blob(size):
+        return rng.getrandbits(8 * size).to_bytes(size, "little") if size else b""
+
+    libs = []
+    for i in range(libraries):
+        data = blob(library_size)
+        path = f"org/catbench/lib{i}/1.0/lib{i}-1.0.jar"
+        files[f"/files/libraries/{path}"] = data
+        libs.append({"name": f"org.catbench:lib{i}:1.0", "downloads": {"artifact": {
+            "path": path, "url": f"{base_url}/files/libraries/{path}", "sha1": sha1(data), "size": len(data)}}})
+
+    natives = io.BytesIO()
+    with zipfile.ZipFile(natives, "w") as zip_ref:
+        # Fixed timestamps, so every stand-in built from one seed serves the same bytes
+        zip_ref.writestr(zipfile.ZipInfo("liblwjgl.so", FIXTURE_TIME), blob(32 * 1024))
+        zip_ref.writestr(zipfile.ZipInfo("META-INF/MANIFEST.MF", FIXTURE_TIME), b"Manifest-Version: 1.0\n")
+    natives = natives.getvalue()
+    files["/files/natives/lwjgl-platform-natives.jar"] = natives
+    native_download = {"path": "org/lwjgl/lwjgl-platform-natives.jar", "url": f"{base_url}/files/natives/lwjgl-platform-natives.jar",
+                       "sha1": sha1(natives), "size": len(natives)}
+    libs.append({"name": "org.lwjgl:lwjgl-platform:2.9", "extract": {"exclude": ["META-INF/"]},
+                 "natives": {"linux": "natives-linux", "osx": "natives-osx", "windows": "natives-windows"},
+                 "downloads": {"classifiers": {f"natives-{name}": native_download for name in ("linux", "osx", "windows")}}})
+
+    objects = {}
+    for i in range(assets):
+        data = blob(asset_size)
+        obj_hash = sha1(data)
+        files[f"/files/objects/{obj_hash[:2]}/{obj_hash}"] = data
+        objects[f"minecraft/sounds/bench{i}.ogg"] = {"hash": obj_hash, "size": len(data)}
+    asset_index = json.dumps({"objects": objects}).encode()
+    files["/meta/assets/bench.json"] = asset_index
+
+    manifest_versions = []
+    for v in range(versions):
+        version_id = f"bench-{v + 1}"
+        client = blob(client_size)
+        files[f"/files/versions/{version_id}/client.jar"] = client
+        version_json = {
+            "id": version_id,
+            "type": "release",
+            "mainClass": "net.minecraft.client.main.Main",
+            "assetIndex": {"id": "bench", "url": f"{base_url}/meta/assets/bench.json",
+                           "sha1": sha1(asset_index), "size": len(asset_index)},
+            "downloads": {"client": {"url": f"{base_url}/files/versions/{version_id}/client.jar",
+                                     "sha1": sha1(client), "size": len(client)}},
+            "libraries": libs,
+            "arguments": {
+                "game": ["--username", "${auth_player_name}", "--uuid", "${auth_uuid}", "--gameDir", "${game_directory}",
+                         "--assetsDir", "${assets_root}", "--assetIndex", "${assets_index_name}", "--version", "${version_name}"],
+                "jvm": ["-Djava.library.path=${natives_directory}", "-cp", "${classpath}"],
+            },
+        }
+        files[f"/meta/versions/{version_id}.json"] = json.dumps(version_json).encode()
+        manifest_versions.append({"id": version_id, "type": "release", "url": f"{base_url}/meta/versions/{version_id}.json"})
+    latest = manifest_versions[-1]["id"]
+    files["/meta/version_manifest.json"] = json.dumps(
+        {"latest": {"release": latest, "snapshot": latest}, "versions": manifest_versions[::-1]}).encode()
+
+    jdk = io.BytesIO()
+    with gzip.GzipFile(fileobj=jdk, mode="wb", compresslevel=1, mtime=0) as gz, tarfile.open(fileobj=gz, mode="w") as tar:
+        for name, data, mode in ((f"{JDK_DIR_NAME}/bin/java", FAKE_JAVA.encode(), 0o755),
+                                 (f"{JDK_DIR_NAME}/lib/modules", blob(jdk_size), 0o644)):
+            info = tarfile.TarInfo(name)
+            info.size, info.mode = len(data), mode
+            tar.addfile(info, io.BytesIO(data))
+    jdk = jdk.getvalue()
+    files["/files/jdk/OpenJDK21U-jdk_x64.tar.gz"] = jdk
+    files[ADOPTIUM_PATH] = json.dumps([{
+        "binary": {"os": os_name, "architecture": "x64", "package": {
+            "link": f"{base_url}/files/jdk/OpenJDK21U-jdk_x64.tar.gz",
+            "checksum": hashlib.sha256(jdk).hexdigest(), "size": len(jdk)}},
+        "version": {"openjdk_version": "21.0.5+11"},
+    } for os_name in ("linux", "mac")]).encode()
+    return files
+
+
+class StandInHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.count("connections")
+
+    def do_HEAD(self):
+        """Answer the launcher's mirror probe after the same latency as a GET."""
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        body = self.server.files.get(self.path.split("?", 1)[0])
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.server.etags[self.path.split("?", 1)[0]])
+        self.end_headers()
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        location = server.redirects.get(self.path)
+        if location:
+            self.send_response(302)
+            self.send_header("Location", location)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = server.files.get(self.path.split("?", 1)[0])
+        if body is None:
+            self.send_error(404)
+            return
+        server.count("requests")
+
+        etag = server.etags[self.path.split("?", 1)[0]]
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        failure = None
+        if self.path.startswith("/files/") and server.fail_rate and server.rng.random() < server.fail_rate:
+            failure = server.rng.choice(("503", "truncate"))
+        if failure == "503":
+            server.count("failures")
+            self.send_error(503)
+            return
+
+        start = 0
+        match = re.match(r"bytes=(\d+)-$", self.headers.get("Range", ""))
+        if match and int(match.group(1)) >= len(body):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(body)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if match:
+            start = int(match.group(1))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.send_header("ETag", etag)
+        self.end_headers()
+
+        end = len(body)
+        if failure == "truncate":
+            server.count("failures")
+            end = start + (len(body) - start) // 2
+        for offset in range(start, end, SEND_CHUNK_SIZE):
+            chunk = body[offset:min(offset + SEND_CHUNK_SIZE, end)]
+            server.throttle(len(chunk))
+            server.count("bytes", len(chunk))  # Before the write, so a client that has read everything sees it counted
+            self.wfile.write(chunk)
+        if failure == "truncate":
+            self.close_connection = True
+
+
+class StandInServer(http.server.ThreadingHTTPServer):
+    """Serves a fixture from memory; latency is per request, bandwidth is shared by all connections."""
+
+    daemon_threads = True
+    request_queue_size = 128  # The default backlog of 5 drops SYNs when 32 asset workers connect at once
+
+    def __init__(self, latency_ms=0, bandwidth_kbps=0, fail_rate=0.0, seed=0, **fixture_options):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.latency = latency_ms / 1000
+        self.bandwidth = bandwidth_kbps * 1024
+        self.fail_rate = fail_rate
+        self.rng = random.Random(seed)
+        self.files = build_fixture(self.base_url, seed=seed, **fixture_options)
+        self.etags = {path: f'"{sha1(body)}"' for path, body in self.files.items()}
+        self.redirects = {}  # path -> Location answered with a 302
+        self.stats = {"requests": 0, "bytes": 0, "failures": 0, "connections": 0}
+        self.lock = threading.Lock()
+        self.next_send = 0.0
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)  # A client hanging up mid-body is expected
+
+    def count(self, key, amount=1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def throttle(self, nbytes):
+        """Sleep until nbytes fit under the shared bandwidth cap (a simple leaky bucket)."""
+        if not self.bandwidth:
+            return
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_send)
+            self.next_send = start + nbytes / self.bandwidth
+            delay = self.next_send - now
+        time.sleep(delay)
+
+    def reset_stats(self):
+        with self.lock:
+            stats, self.stats = self.stats, {"requests": 0, "bytes": 0, "failures": 0, "connections": 0}
+        return stats
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
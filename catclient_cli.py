@@ -0,0 +1,264 @@
+"""Headless CatClientHDR commands: prefetch versions, launch, manage instances, trim the shared store, probe mirrors and show JVM flags, all without Tk."""
+import argparse
+import sys
+import threading
+
+from catclient_core import (
+    DISK_BUDGET_GB,
+    DOWNLOAD_WORKERS,
+    JVM_PROFILES,
+    LAUNCHER_VERSION,
+    MIRRORS,
+    SCHEDULER,
+    DownloadCancelled,
+    LauncherCore,
+    ProgressReporter,
+    TRACER,
+    parse_cpu_list,
+)
+
+
+def run_job(core, label, target, *args):
+    """Run a pipeline call on a worker thread so Ctrl+C cancels it like the window's Cancel button."""
+    result = {"ok": False}
+
+    def body():
+        with TRACER.span("cli.job", label=label) as span:
+            try:
+                result["ok"] = target(*args)
+            except DownloadCancelled:
+                print("🛑 CatClientHDR: Cancelled.")
+            except Exception as e:
+                print(f"❌ CatClientHDR: Job failed: {e}")
+            span["ok"] = bool(result["ok"])
+        core.export_trace(label)
+
+    core.progress = ProgressReporter()
+    core.job_thread = threading.Thread(target=body, daemon=True)
+    core.job_thread.start()
+    while core.job_thread.is_alive():
+        try:
+            core.job_thread.join(0.2)
+        except KeyboardInterrupt:
+            print("🛑 CatClientHDR: Cancelling...")
+            core.progress.cancel_event.set()
+    return result["ok"]
+
+
+def cmd_prefetch(core, args):
+    """Download every requested version in one pass, sharing common files."""
+    if not core.ensure_version_manifest():
+        return 1
+    SCHEDULER.set_bandwidth(args.limit_kbps)
+    label = "prefetch-" + "_".join(args.versions)
+    ok = run_job(core, label, core.prefetch_versions, args.versions, args.workers, args.deep_verify)
+    return 0 if ok else 1
+
+
+def cmd_launch(core, args):
+    """Install Java if needed, download, start one version or several instances and supervise them until they exit."""
+    if not args.version and not args.instance:
+        print("❌ CatClientHDR: Pass --version or at least one --instance.")
+        return 2
+    missing = [name for name in args.instance if core.instances.get(name) is None]
+    if missing:
+        print(f"❌ CatClientHDR: No such instance: {', '.join(missing)}")
+        return 1
+    if not core.ensure_version_manifest():
+        return 1
+    username = core.validate_username(args.user)
+    SCHEDULER.set_bandwidth(args.limit_kbps)
+
+    launched = []  # The GameSession of each launch this command made, None where one failed
+
+    def launch():
+        core.install_java_if_needed()
+        if args.instance:
+            launched.extend(core.launch_instance(name, deep_verify=args.deep_verify) for name in args.instance)
+        else:
+            core.modify_options_txt(target_fps=60)
+            launched.append(core.download_and_launch(args.version, username, args.ram, deep_verify=args.deep_verify,
+                                                     cds=not args.no_cds, profile=args.profile))
+        if any(launched):
+            core.wait_for_background_jobs()  # Exiting now would abandon the assets still downloading
+        return all(launched)
+
+    label = "launch-" + ("_".join(args.instance) if args.instance else args.version)
+    ok = run_job(core, label, launch)
+    # Only this command's games, which may well have exited by now
+    sessions = [session for session in launched if session is not None]
+    if not sessions:
+        return 1
+    # Stay attached so the games' output keeps being logged, their exits get diagnosed and exit hooks finish
+    while not all(session.exited.is_set() for session in sessions):
+        try:
+            for session in sessions:
+                session.wait(0.5 / len(sessions))
+        except KeyboardInterrupt:
+            print("🛑 CatClientHDR: Stopping the game" + ("s..." if len(sessions) > 1 else "..."))
+            for session in sessions:
+                if session.poll() is None:
+                    session.process.terminate()
+    return 0 if ok and all(session.exit_code == 0 for session in sessions) else 1
+
+
+def cmd_instance(core, args):
+    """Create, update, list or delete named instances."""
+    store = core.instances
+    if args.action == "list":
+        for name in store.names():
+            instance = store.get(name)
+            placement = (f" cpus {','.join(map(str, instance['affinity']))}" if instance["affinity"] else "") + \
+                        (f" nice {instance['nice']}" if instance["nice"] else "")
+            running = " (running)" if store.is_running(name) else ""
+            print(f"{name:<20}{instance['version']:<16}{instance['username']:<16}{instance['ram']} GB "
+                  f"{instance['profile']}{placement}{running}")
+        return 0
+    if not args.name:
+        print(f"❌ CatClientHDR: instance {args.action} needs a NAME.")
+        return 2
+    if args.action == "delete":
+        if store.get(args.name) is None:
+            print(f"❌ CatClientHDR: No such instance: {args.name}")
+            return 1
+        try:
+            store.delete(args.name, delete_files=args.delete_files)
+        except ValueError as e:
+            print(f"❌ CatClientHDR: {e}")
+            return 1
+        print(f"🗑️ CatClientHDR: Deleted instance {args.name}" +
+              ("." if args.delete_files else f"; its game folder is kept in {store.game_dir(args.name)}."))
+        return 0
+    settings = {key: value for key, value in (("version", args.version), ("username", args.user), ("ram", args.ram),
+                                              ("profile", args.profile), ("nice", args.nice)) if value is not None}
+    if args.no_cds:
+        settings["cds"] = False
+    try:
+        if args.cpus is not None:
+            settings["affinity"] = parse_cpu_list(args.cpus) if args.cpus else None
+        if "username" in settings:
+            settings["username"] = core.validate_username(settings["username"])
+        instance = store.save(args.name, **settings)
+    except ValueError as e:
+        print(f"❌ CatClientHDR: {e}")
+        return 1
+    print(f"🐱 CatClientHDR: Saved instance {args.name} ({instance['version']}); game folder {store.game_dir(args.name)}")
+    return 0
+
+
+def cmd_versions(core, args):
+    """List manifest versions matching a search, newest first."""
+    if not core.ensure_version_manifest():
+        return 1
+    types = set(args.type) if args.type else None
+    matches = core.version_index.search(args.query or "", types=types, since=args.since, until=args.until)
+    for entry in matches[:args.limit] if args.limit else matches:
+        print(f"{entry['id']:<28}{entry.get('type', ''):<12}{entry.get('releaseTime', '')[:10]}")
+    return 0
+
+
+def cmd_gc(core, args):
+    """Evict least-recently-used versions until downloaded versions, libraries and assets fit the budget."""
+    freed, evicted = core.evict_versions(int(args.budget * 1024 ** 3), keep_versions=set(args.keep))
+    print(f"🧹 CatClientHDR: Freed {freed / (1024 * 1024):.1f} MB.")
+    if evicted:
+        print("🧹 CatClientHDR: Removed versions: " + ", ".join(evicted))
+    return 0
+
+
+def cmd_mirrors(core, args):
+    """Probe every host in the mirror list and show them fastest first."""
+    if not MIRRORS.load():
+        print(f"🐱 CatClientHDR: No mirrors configured; add some to {MIRRORS.config_path}.")
+        return 0
+    latency = MIRRORS.probe(force=True)
+    for origin, seconds in sorted(latency.items(), key=lambda item: (item[1] is None, item[1] or 0.0)):
+        print(f"{origin:<48}" + (f"{seconds * 1000:>8.0f} ms" if seconds is not None else "     unreachable"))
+    return 0
+
+
+def cmd_jvm(core, args):
+    """Show the detected hardware and the JVM flags a launch would use."""
+    java_runtime = core.find_java()
+    flags, notes, profile = core.resolve_jvm_flags(args.profile, args.ram, java_runtime)
+    hardware = core.hardware
+    available = f", {hardware['available'] / 1024 ** 3:.1f} GB free" if hardware["available"] is not None else ""
+    print(f"🖥️ CatClientHDR: {hardware['cores']} cores, {hardware['total'] / 1024 ** 3:.1f} GB RAM{available}")
+    print("☕ CatClientHDR: " + (f"Java {java_runtime['version']} at {java_runtime['path']}" if java_runtime
+                                else "No Java 21 found; flags assume one will be installed"))
+    for note in notes:
+        print(f"⚙️ CatClientHDR: {note}")
+    print(f"{profile}: {' '.join(flags)}")
+    return 0
+
+
+def build_parser():
+    """Build the argument parser for the headless commands."""
+    parser = argparse.ArgumentParser(prog="launchherhdrv0.py", description="CatClientHDR headless launcher 🐱🔥")
+    parser.add_argument("--version-info", action="version", version=f"CatClientHDR {LAUNCHER_VERSION}")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    prefetch = commands.add_parser("prefetch", help="download one or more versions without launching")
+    prefetch.add_argument("versions", nargs="+", metavar="VERSION")
+    prefetch.add_argument("--workers", type=int, default=DOWNLOAD_WORKERS, help="concurrent library downloads per host")
+    prefetch.add_argument("--deep-verify", action="store_true", help="re-hash every file instead of trusting the index")
+    prefetch.add_argument("--limit-kbps", type=float, default=0, help="download bandwidth cap in KiB/s (0 = unlimited)")
+    prefetch.set_defaults(func=cmd_prefetch)
+
+    launch = commands.add_parser("launch", help="download a version and start the game")
+    launch.add_argument("--version", help="version to launch in the shared game folder")
+    launch.add_argument("--instance", action="append", default=[], metavar="NAME",
+                        help="launch a named instance instead; repeat to start several at once")
+    launch.add_argument("--user", default="CatGamer")
+    launch.add_argument("--ram", type=int, default=4, help="max heap in GB")
+    launch.add_argument("--deep-verify", action="store_true", help="re-hash every file instead of trusting the index")
+    launch.add_argument("--no-cds", action="store_true", help="skip the class-data-sharing archive")
+    launch.add_argument("--profile", choices=list(JVM_PROFILES), default="auto", help="JVM tuning profile")
+    launch.add_argument("--limit-kbps", type=float, default=0, help="download bandwidth cap in KiB/s (0 = unlimited)")
+    launch.set_defaults(func=cmd_launch)
+
+    instance = commands.add_parser("instance", help="manage named instances with their own game folders")
+    instance.add_argument("action", choices=["save", "list", "delete"])
+    instance.add_argument("name", nargs="?")
+    instance.add_argument("--version")
+    instance.add_argument("--user")
+    instance.add_argument("--ram", type=int, help="max heap in GB")
+    instance.add_argument("--profile", choices=list(JVM_PROFILES))
+    instance.add_argument("--no-cds", action="store_true", help="skip the class-data-sharing archive")
+    instance.add_argument("--cpus", help="CPUs to pin the game to, e.g. 0-3,6 (empty to unpin)")
+    instance.add_argument("--nice", type=int, help="scheduling niceness, e.g. 10 to yield to other games")
+    instance.add_argument("--delete-files", action="store_true", help="with delete: also remove saves and options")
+    instance.set_defaults(func=cmd_instance)
+
+    versions = commands.add_parser("versions", help="search the version manifest")
+    versions.add_argument("query", nargs="?", help="id prefix or substring, e.g. 23w13")
+    versions.add_argument("--type", action="append", choices=["release", "snapshot", "old_beta", "old_alpha"])
+    versions.add_argument("--since", help="released on or after, e.g. 2023 or 2023-04-01")
+    versions.add_argument("--until", help="released on or before")
+    versions.add_argument("--limit", type=int, default=0, help="show at most this many (0 = all)")
+    versions.set_defaults(func=cmd_versions)
+
+    gc = commands.add_parser("gc", help="evict least-recently-used versions to fit a disk budget")
+    gc.add_argument("--budget", type=float, default=DISK_BUDGET_GB, help="budget in GB")
+    gc.add_argument("--keep", action="append", default=[], metavar="VERSION",
+                    help="version to never evict; those of running games and instances are always kept")
+    gc.set_defaults(func=cmd_gc)
+
+    mirrors = commands.add_parser("mirrors", help="probe the configured download mirrors")
+    mirrors.set_defaults(func=cmd_mirrors)
+
+    jvm = commands.add_parser("jvm", help="show the JVM flags a launch would use on this machine")
+    jvm.add_argument("--profile", choices=list(JVM_PROFILES), default="auto")
+    jvm.add_argument("--ram", type=int, default=4, help="requested max heap in GB")
+    jvm.set_defaults(func=cmd_jvm)
+    return parser
+
+
+def main(argv=None):
+    """Parse argv and run a headless command; returns the process exit code."""
+    args = build_parser().parse_args(argv)
+    return args.func(LauncherCore(), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
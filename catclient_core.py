@@ -0,0 +1,3153 @@
+"""Tk-free download, verification and launch pipeline shared by the CatClientHDR window and CLI."""
+import os
+import sys
+import bisect
+import collections
+import platform
+import json
+import shutil
+import re
+import contextlib
+import threading
+import time
+import random
+import io
+
+LAUNCHER_VERSION = "1.0"
+
+# Define constants for directories and URLs
+CATCLIENT_DIR = os.environ.get("CATCLIENT_HOME") or os.path.expanduser("~/.catclient")
+VERSIONS_DIR = os.path.join(CATCLIENT_DIR, "versions")
+JAVA_DIR = os.path.join(CATCLIENT_DIR, "java")
+ASSETS_DIR = os.path.join(CATCLIENT_DIR, "assets")
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+ASSET_OBJECTS_URL = "https://resources.download.minecraft.net"
+MANIFEST_CACHE_PATH = os.path.join(CATCLIENT_DIR, "version_manifest.json")
+MANIFEST_META_PATH = os.path.join(CATCLIENT_DIR, "version_manifest.meta.json")
+DISK_BUDGET_GB = 10  # Default disk budget that downloaded versions, libraries and assets are trimmed back to
+DOWNLOAD_WORKERS = 8  # Concurrent library/native downloads
+ASSET_WORKERS = 32  # Asset objects are small, so many more can be in flight
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes read from the network or disk per step
+DOWNLOAD_RETRIES = 4  # Extra attempts for transient network errors
+RETRY_BACKOFF = 1.0  # Seconds before the first retry; doubles per attempt, with jitter
+ADOPTIUM_API_URL = "https://api.adoptium.net/v3/assets/latest/21/hotspot"
+USER_AGENT = "CatClientHDR/1.0 (Minecraft Launcher)"
+HTTP_TIMEOUT = 30  # Seconds for connects and for each socket read
+HTTP_POOL_SIZE = 16  # Idle keep-alive connections kept per host
+TRACE_HISTORY = 20  # Trace and summary files kept under CATCLIENT_DIR/logs
+MIRRORS_PATH = os.path.join(CATCLIENT_DIR, "mirrors.json")
+INSTANCES_DIR = os.path.join(CATCLIENT_DIR, "instances")
+LAUNCH_PLAN_FORMAT = 3  # Bumped whenever resolve_launch_plan's output changes, so older cached plans are re-resolved
+MIRROR_PROBE_TIMEOUT = 3  # Seconds a mirror gets to answer the latency probe
+MIRROR_PROBE_TTL = 600  # Seconds before mirrors are probed again and failed ones get another chance
+MIRROR_RETRIES = 1  # Retries on a mirror before falling back to the next one
+HOST_CONNECTIONS = 32  # Downloads in flight per host, across every running job
+BANDWIDTH_CAP_KBPS = 0  # Download cap for all transfers together in KiB/s (0 = unlimited)
+PLAYING_BANDWIDTH_KBPS = 1024  # Cap on asset and background downloads while a launched game is running
+SCHEDULER_IDLE_SECONDS = 5  # Idle download workers exit after this long
+GAME_LOG_LINES = 2000  # Recent game output lines kept in memory for the window
+GAME_LOG_MAX_BYTES = 5 * 1024 * 1024  # A game log rolls over to .1, .2, ... past this size
+GAME_LOG_BACKUPS = 3  # Rolled-over parts kept per game log
+GAME_LOG_HISTORY = 10  # Game sessions whose logs are kept under CATCLIENT_DIR/logs
+GAME_SAMPLE_SECONDS = 2  # Interval between RSS/CPU samples of a running game
+GAME_SAMPLES = 1800  # Samples kept per game (an hour at the default interval)
+OS_RESERVE_MB = 2048  # Memory -Xmx always leaves to the OS and the launcher, or a quarter of RAM if that is more
+JVM_PROFILES = {
+    "auto": "Pick from this machine's cores, memory and Java version",
+    "balanced": "G1 with a 50 ms pause target; a safe choice everywhere",
+    "low-latency": "ZGC or Shenandoah for the steadiest frame times; uses more memory",
+    "low-memory": "Small heap that hands memory back; for machines with little RAM",
+}
+CDS_CLEAN_EXIT_CODES = (0, 130, 143)  # Orderly JVM shutdowns (normal, SIGINT, SIGTERM) that leave a complete archive
+# Download priority classes; lower runs first
+PRIORITY_CRITICAL = 0  # Client JAR, libraries and natives: the game cannot start without them
+PRIORITY_ASSETS = 1
+PRIORITY_BACKGROUND = 2  # Prefetching versions nobody is waiting to play
+
+
+class DownloadError(Exception):
+    """Raised when a streamed download does not match its expected size or SHA1."""
+
+
+class DownloadCancelled(Exception):
+    """Raised inside a worker when the user cancels the running job."""
+
+
+class ProgressReporter:
+    """Collect progress from worker threads and post throttled events to a queue the UI drains.
+
+    Without an events queue it only tracks cancellation, so pipeline code can
+    report unconditionally whether or not a UI is listening.
+    """
+
+    def __init__(self, events=None, cancel_event=None, interval=0.1):
+        self.events = events
+        self.cancel_event = cancel_event or threading.Event()
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.phase_name = ""
+        self.files_done = self.files_total = 0
+        self.bytes_done = self.bytes_total = 0
+        self.last_post = 0.0
+
+    def check_cancelled(self):
+        """Raise DownloadCancelled if the job has been cancelled."""
+        if self.cancel_event.is_set():
+            raise DownloadCancelled("Cancelled by user")
+
+    def phase(self, name, files_total=0, bytes_total=0):
+        """Start a new phase and reset the counters."""
+        with self.lock:
+            self.phase_name = name
+            self.files_done, self.files_total = 0, files_total
+            self.bytes_done, self.bytes_total = 0, bytes_total
+        self.post(force=True)
+
+    def add(self, nbytes=0, files=0):
+        """Count transferred bytes and finished files, checking for cancellation."""
+        self.check_cancelled()
+        with self.lock:
+            self.bytes_done += nbytes
+            self.files_done += files
+        self.post(force=bool(files) and self.files_done == self.files_total)
+
+    def rewind(self, nbytes):
+        """Take back bytes counted for a transfer that is about to be retried."""
+        with self.lock:
+            self.bytes_done -= nbytes
+
+    def post(self, force=False):
+        """Queue a progress snapshot, at most once per interval unless forced."""
+        if self.events is None:
+            return
+        now = time.monotonic()
+        with self.lock:
+            if not force and now - self.last_post < self.interval:
+                return
+            self.last_post = now
+            snapshot = ("progress", self.phase_name, self.files_done, self.files_total,
+                        self.bytes_done, self.bytes_total)
+        self.events.put(snapshot)
+
+
+class Tracer:
+    """Collect timing spans from any thread and export them as Chrome trace-event JSON plus a summary table.
+
+    Open the .json file in chrome://tracing or https://ui.perfetto.dev; each
+    span's args carry its bytes and cache-hit flag where they apply.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Drop recorded spans and restart the clock."""
+        with self.lock:
+            self.events = []
+            self.threads = {}
+            self.origin_ns = time.perf_counter_ns()
+
+    @contextlib.contextmanager
+    def span(self, name, /, **args):
+        """Time the enclosed block; the yielded dict can be filled with more args (bytes, cache_hit, ...)."""
+        start_ns = time.perf_counter_ns()
+        try:
+            yield args
+        except BaseException as e:
+            args["error"] = type(e).__name__
+            raise
+        finally:
+            end_ns = time.perf_counter_ns()
+            thread = threading.current_thread()
+            with self.lock:
+                self.threads.setdefault(thread.ident, thread.name)
+                self.events.append({
+                    "name": name, "ph": "X", "pid": os.getpid(), "tid": thread.ident,
+                    "ts": (start_ns - self.origin_ns) / 1000, "dur": (end_ns - start_ns) / 1000, "args": args,
+                })
+
+    def summary(self):
+        """Return a text table of spans grouped by name: count, summed and max time, bytes and cache hits."""
+        with self.lock:
+            events = list(self.events)
+        if not events:
+            return "No spans recorded.\n"
+        wall_ms = (max(e["ts"] + e["dur"] for e in events) - min(e["ts"] for e in events)) / 1000
+        groups = {}
+        for event in events:
+            group = groups.setdefault(event["name"], {"count": 0, "total": 0.0, "max": 0.0, "bytes": 0, "hits": 0})
+            group["count"] += 1
+            group["total"] += event["dur"] / 1000
+            group["max"] = max(group["max"], event["dur"] / 1000)
+            group["bytes"] += event["args"].get("bytes") or 0
+            group["hits"] += 1 if event["args"].get("cache_hit") else 0
+        lines = [f"Wall time {wall_ms:.1f} ms across {len(events)} spans (parallel spans overlap, so totals can exceed it)",
+                 f"{'span':<24}{'count':>7}{'total ms':>12}{'max ms':>10}{'MB':>9}{'cache hits':>12}"]
+        for name, group in sorted(groups.items(), key=lambda item: -item[1]["total"]):
+            lines.append(f"{name:<24}{group['count']:>7}{group['total']:>12.1f}{group['max']:>10.1f}"
+                         f"{group['bytes'] / (1024 * 1024):>9.2f}{group['hits']:>12}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, label="session"):
+        """Write trace-<time>-<label>.json and summary-<time>-<label>.txt under CATCLIENT_DIR/logs; returns the trace path."""
+        logs_dir = os.path.join(CATCLIENT_DIR, "logs")
+        os.makedirs(logs_dir, exist_ok=True)
+        with self.lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": name}}
+                    for tid, name in threads.items()]
+        now = time.time()
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}.{int(now * 1000) % 1000:03d}-{re.sub(r'[^A-Za-z0-9_.-]', '_', label)}"
+        trace_path = os.path.join(logs_dir, f"trace-{stamp}.json")
+        atomic_write_json(trace_path, {"traceEvents": metadata + events, "displayTimeUnit": "ms"})
+        with open(os.path.join(logs_dir, f"summary-{stamp}.txt"), "w") as f:
+            f.write(self.summary())
+
+        # Keep the newest TRACE_HISTORY traces and summaries
+        for prefix in ("trace-", "summary-"):
+            old = sorted(name for name in os.listdir(logs_dir) if name.startswith(prefix))
+            for name in old[:-TRACE_HISTORY]:
+                os.remove(os.path.join(logs_dir, name))
+        return trace_path
+
+
+TRACER = Tracer()
+
+
+def sha1_file(file_path, hash_name="sha1"):
+    """Compute the SHA1 (or another hashlib digest) of a file by reading it in fixed-size chunks."""
+    import hashlib
+    hasher = hashlib.new(hash_name)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class HttpResponse:
+    """A response from HttpClient that hands its keep-alive connection back to the pool when closed."""
+
+    def __init__(self, client, pool_key, conn, response, url):
+        self.client = client
+        self.pool_key = pool_key
+        self.conn = conn
+        self.response = response
+        self.url = url
+        self.status = response.status
+        self.reason = response.reason
+        self.headers = response.headers
+
+    def read(self, amt=None):
+        return self.response.read(amt)
+
+    def close(self):
+        """Return the connection to the pool if the body was fully consumed, otherwise drop it."""
+        if self.conn is None:
+            return
+        if self.response.isclosed() and not self.response.will_close:
+            self.client.release(self.pool_key, self.conn)
+        else:
+            self.response.close()
+            self.conn.close()
+        self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class HttpClient:
+    """Launcher-wide HTTP client: one TLS context, one User-Agent and keep-alive connections pooled per host.
+
+    Errors mirror urllib so callers can keep catching urllib.error.HTTPError
+    (including 304 Not Modified) and urllib.error.URLError.
+    """
+
+    def __init__(self, timeout=HTTP_TIMEOUT, pool_size=HTTP_POOL_SIZE):
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.ssl_context = None  # Built on first use; loading the CA store is slow and startup never needs it
+        self.proxies = None
+        self.pools = {}
+        self.lock = threading.Lock()
+
+    def setup(self):
+        """Create the shared TLS context and read the proxy settings the first time a connection is opened."""
+        import ssl
+        import urllib.request
+        with self.lock:
+            if self.ssl_context is not None:
+                return
+            # Single TLS context for every host; certificate checks stay relaxed as before and
+            # artifacts are still trusted only through their SHA1 from the version JSON
+            ssl_context = ssl.create_default_context()
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            self.proxies = urllib.request.getproxies()
+            self.ssl_context = ssl_context
+
+    def new_connection(self, scheme, host, port, timeout):
+        """Open a connection to host, tunnelling through the environment's proxy if one applies."""
+        import http.client
+        import urllib.parse
+        import urllib.request
+        self.setup()
+        proxy = self.proxies.get(scheme)
+        if proxy and not urllib.request.proxy_bypass(host):
+            if "://" not in proxy:
+                proxy = "http://" + proxy
+            proxy_url = urllib.parse.urlsplit(proxy)
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(proxy_url.hostname, proxy_url.port or 80, timeout=timeout,
+                                                   context=self.ssl_context)
+            else:
+                conn = http.client.HTTPConnection(proxy_url.hostname, proxy_url.port or 80, timeout=timeout)
+            conn.set_tunnel(host, port)  # CONNECT through the proxy, then talk to host directly
+            return conn
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=timeout)
+
+    def acquire(self, pool_key, timeout):
+        """Take an idle connection for pool_key, or open a new one; returns (conn, reused)."""
+        with self.lock:
+            idle = self.pools.get(pool_key)
+            conn = idle.pop() if idle else None
+        if conn is not None:
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            conn.timeout = timeout
+            return conn, True
+        return self.new_connection(*pool_key, timeout), False
+
+    def release(self, pool_key, conn):
+        """Park a connection whose response was fully read so the next request to the host can reuse it."""
+        with self.lock:
+            idle = self.pools.setdefault(pool_key, [])
+            if len(idle) < self.pool_size:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        """Close every idle connection."""
+        with self.lock:
+            pools, self.pools = self.pools, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    def open(self, url, headers=None, timeout=None, method="GET", max_redirects=5):
+        """Send a request and return an HttpResponse, following redirects and raising HTTPError for >= 300."""
+        import http.client
+        import ssl
+        import urllib.error
+        import urllib.parse
+        if timeout is None:
+            timeout = self.timeout
+        request_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+        request_headers.update(headers or {})
+        for _ in range(max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            scheme = parts.scheme.lower()
+            if scheme not in ("http", "https"):
+                raise urllib.error.URLError(f"unsupported URL scheme: {url}")
+            port = parts.port or (443 if scheme == "https" else 80)
+            pool_key = (scheme, parts.hostname, port)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+            conn, reused = self.acquire(pool_key, timeout)
+            try:
+                conn.request(method, path, headers=request_headers)
+                response = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server dropped an idle keep-alive connection; retry once on a fresh one
+                conn = self.new_connection(*pool_key, timeout)
+                conn.request(method, path, headers=request_headers)
+                response = conn.getresponse()
+            except ssl.SSLError:
+                conn.close()
+                raise
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                if isinstance(e, (TimeoutError, http.client.HTTPException)):
+                    raise
+                raise urllib.error.URLError(e) from e
+
+            result = HttpResponse(self, pool_key, conn, response, url)
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                response.read()
+                result.close()
+                url = urllib.parse.urljoin(url, response.getheader("Location"))
+                if response.status == 303:
+                    method = "GET"
+                continue
+            if response.status >= 300:
+                body = response.read()
+                result.close()
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+            return result
+        raise urllib.error.URLError(f"too many redirects for {url}")
+
+    def get_json(self, url, headers=None, timeout=None):
+        """GET url and parse the body as JSON."""
+        with self.open(url, headers=headers, timeout=timeout) as response:
+            return json.loads(response.read().decode())
+
+
+HTTP = HttpClient()
+
+
+def url_origin(url):
+    """Return the scheme://host[:port] part of a URL."""
+    import urllib.parse
+    parts = urllib.parse.urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class MirrorList:
+    """Mirrors from mirrors.json, ranked by probed latency, that every download falls back through.
+
+    The file holds {"mirrors": [{"name": ..., "rewrite": {upstream prefix: mirror prefix}}]},
+    e.g. "https://libraries.minecraft.net" -> "https://bmclapi2.bangbang93.com/maven".
+    A URL's candidates are the upstream URL plus each mirror's rewrite of it,
+    fastest first; a mirror that fails a download is skipped until the next
+    probe. Only artifacts go through mirrors; the manifest, version JSONs and
+    Adoptium metadata that carry their hashes always come from upstream, so a
+    mirror is trusted for speed, never for content.
+    """
+
+    def __init__(self, config_path):
+        self.config_path = config_path
+        self.mirrors = None  # [(name, [(prefix, replacement), ...])], read on first use
+        self.latency = {}  # origin -> seconds to answer the probe, None when unreachable
+        self.failed = set()  # Origins that failed a download since the last probe
+        self.probed_at = None
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Read the mirror list once; a missing file means upstream only."""
+        if self.mirrors is not None:
+            return self.mirrors
+        mirrors = []
+        try:
+            with open(self.config_path, "r") as f:
+                config = json.load(f)
+            for mirror in config.get("mirrors", []):
+                rules = sorted(((prefix.rstrip("/"), target.rstrip("/")) for prefix, target in mirror["rewrite"].items()),
+                               key=lambda rule: -len(rule[0]))  # Longest prefix wins
+                mirrors.append((mirror.get("name") or url_origin(rules[0][1]), rules))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Ignoring unreadable mirror list {self.config_path}: {e}")
+        self.mirrors = mirrors
+        return mirrors
+
+    def rewrite(self, url):
+        """Return [(name, url)] for the upstream URL and every mirror with a rule for its host."""
+        rewritten = [("upstream", url)]
+        for name, rules in self.load():
+            for prefix, target in rules:
+                if url == prefix or url.startswith(prefix + "/"):
+                    rewritten.append((name, target + url[len(prefix):]))
+                    break
+        return rewritten
+
+    def origins(self):
+        """Every host the mirror list can send a request to, upstream ones included."""
+        found = []
+        for _, rules in self.load():
+            for prefix, target in rules:
+                for origin in (url_origin(prefix), url_origin(target)):
+                    if origin not in found:
+                        found.append(origin)
+        return found
+
+    def probe(self, force=False):
+        """Time a HEAD request to each host in parallel and reset the failed set; returns {origin: seconds or None}."""
+        import concurrent.futures
+        import urllib.error
+        with self.lock:
+            if not force and self.probed_at is not None and time.monotonic() - self.probed_at < MIRROR_PROBE_TTL:
+                return dict(self.latency)
+
+            def probe_one(origin):
+                start = time.perf_counter()
+                try:
+                    with HTTP.open(origin + "/", method="HEAD", timeout=MIRROR_PROBE_TIMEOUT) as response:
+                        response.read()
+                except urllib.error.HTTPError:
+                    pass  # Any answer, even a 404 for "/", shows the host is up
+                except Exception:
+                    return None
+                return time.perf_counter() - start
+
+            origins = self.origins()
+            with TRACER.span("mirrors.probe", hosts=len(origins)):
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(origins))) as executor:
+                    self.latency = dict(zip(origins, executor.map(probe_one, origins)))
+            self.failed = set()
+            self.probed_at = time.monotonic()
+            return dict(self.latency)
+
+    def candidates(self, url):
+        """Return the URLs to try for url: reachable hosts fastest first, then failed or unreachable ones."""
+        rewritten = [candidate for _, candidate in self.rewrite(url)]
+        if len(rewritten) == 1:
+            return rewritten
+        latency = self.probe()
+        with self.lock:
+            failed = set(self.failed)
+
+        def rank(candidate):
+            origin = url_origin(candidate)
+            seconds = latency.get(origin)
+            return (origin in failed or seconds is None, seconds or 0.0)
+
+        return sorted(rewritten, key=rank)
+
+    def mark_failed(self, url):
+        """Push url's host behind the others until the next probe."""
+        with self.lock:
+            self.failed.add(url_origin(url))
+
+    def failover(self, url, attempt, retries):
+        """Call attempt(candidate_url, retries) for each candidate of url until one succeeds.
+
+        Every candidate but the last gets MIRROR_RETRIES so a slow or broken
+        mirror is abandoned quickly; the last one gets the full retry budget.
+        """
+        candidates = self.candidates(url)
+        for position, candidate in enumerate(candidates):
+            last = position == len(candidates) - 1
+            try:
+                return attempt(candidate, retries if last else min(retries, MIRROR_RETRIES))
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                if last or getattr(e, "code", 500) < 400:
+                    raise  # Out of mirrors, or an HTTP answer such as 304 Not Modified that another host would repeat
+                self.mark_failed(candidate)
+                print(f"⚠️ CatClientHDR: {url_origin(candidate)} failed ({e}); "
+                      f"falling back to {url_origin(candidates[position + 1])}")
+
+
+MIRRORS = MirrorList(MIRRORS_PATH)
+
+
+class DownloadScheduler:
+    """Run download jobs on a shared worker pool, highest priority class first, under per-host and bandwidth limits.
+
+    Within a class, jobs start in submission order, but a host that is at its
+    connection limit is skipped. The bandwidth cap is a leaky bucket shared by
+    every transfer. While a launched game is running, all but launch-critical
+    work is also held to PLAYING_BANDWIDTH_KBPS so it leaves the game room.
+    """
+
+    def __init__(self, workers=ASSET_WORKERS, host_limit=HOST_CONNECTIONS, bandwidth_kbps=BANDWIDTH_CAP_KBPS,
+                 playing_kbps=PLAYING_BANDWIDTH_KBPS):
+        self.workers = workers
+        self.host_limit = host_limit
+        self.bandwidth = bandwidth_kbps * 1024
+        self.playing_bandwidth = playing_kbps * 1024
+        self.queues = {}  # priority -> {host: deque of (fn, future, host limit)}
+        self.active = {}  # host -> jobs running
+        self.threads = 0
+        self.idle = 0
+        self.next_send = {"all": 0.0, "playing": 0.0}
+        self.games = []
+        self.cond = threading.Condition()
+
+    def set_bandwidth(self, kbps):
+        """Change the overall cap in KiB/s (0 = unlimited); applies to transfers already running."""
+        self.bandwidth = kbps * 1024
+
+    def submit(self, fn, priority, host, limit=None):
+        """Queue fn() and return a Future for its result; limit lowers the host's connection cap for this job."""
+        import concurrent.futures
+        future = concurrent.futures.Future()
+        with self.cond:
+            hosts = self.queues.setdefault(priority, {})
+            hosts.setdefault(host, collections.deque()).append((fn, future, min(limit or self.host_limit, self.host_limit)))
+            if self.idle:
+                self.cond.notify()
+            elif self.threads < self.workers:
+                self.threads += 1
+                threading.Thread(target=self.work, name=f"download-{self.threads}", daemon=True).start()
+        return future
+
+    def take(self):
+        """Pop the next job whose host has a free slot; the caller holds the lock. Returns (host, fn, future) or None."""
+        for priority in sorted(self.queues):
+            hosts = self.queues[priority]
+            for host, jobs in hosts.items():
+                if self.active.get(host, 0) < jobs[0][2]:
+                    fn, future, _ = jobs.popleft()
+                    if not jobs:
+                        del hosts[host]
+                        if not hosts:
+                            del self.queues[priority]
+                    self.active[host] = self.active.get(host, 0) + 1
+                    return host, fn, future
+        return None
+
+    def work(self):
+        """Worker loop: run jobs until none has been runnable for SCHEDULER_IDLE_SECONDS."""
+        while True:
+            with self.cond:
+                item = self.take()
+                while item is None:
+                    self.idle += 1
+                    woken = self.cond.wait(SCHEDULER_IDLE_SECONDS)
+                    self.idle -= 1
+                    item = self.take()
+                    if item is None and not woken:
+                        self.threads -= 1
+                        return
+            host, fn, future = item
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn())
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                with self.cond:
+                    self.active[host] -= 1
+                    self.cond.notify()
+
+    def add_game(self, process):
+        """Track a launched game (anything with poll()); background downloads slow down while any is running."""
+        with self.cond:
+            self.games = [game for game in self.games if game.poll() is None] + [process]
+
+    def game_running(self):
+        return any(game.poll() is None for game in self.games)
+
+    def throttle(self, nbytes, priority):
+        """Sleep until nbytes fit under the bandwidth caps that apply to priority."""
+        buckets = []
+        if self.bandwidth:
+            buckets.append(("all", self.bandwidth))
+        if priority > PRIORITY_CRITICAL and self.playing_bandwidth and self.game_running():
+            buckets.append(("playing", self.playing_bandwidth))
+        if not buckets:
+            return
+        delay = 0.0
+        with self.cond:
+            now = time.monotonic()
+            for name, rate in buckets:
+                self.next_send[name] = max(now, self.next_send[name]) + nbytes / rate
+                delay = max(delay, self.next_send[name] - now)
+        time.sleep(delay)
+
+
+SCHEDULER = DownloadScheduler()
+
+
+def is_transient_error(error):
+    """Return True for network failures worth retrying (timeouts, resets, 5xx, 408/429)."""
+    import http.client
+    import urllib.error
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code in (408, 429) or error.code >= 500
+    return isinstance(error, (urllib.error.URLError, ConnectionError, TimeoutError, http.client.HTTPException))
+
+
+class PartStream:
+    """Readable view of a download that replays bytes already in part_path, then tees the rest of the body into it.
+
+    Every byte handed out is hashed with hash_name and counted through on_bytes,
+    so a consumer (a plain copy loop, or tarfile in stream mode) always sees the
+    whole file while an interrupted transfer resumes with an HTTP Range request.
+    Falls back to a full download when the server ignores the Range header.
+    A 416 whose Content-Range total equals the part's size means the part is
+    already complete; any other 416 discards the part and starts over.
+    Network bytes (not replayed ones) are passed through throttle, if given.
+    """
+
+    def __init__(self, url, part_path, expected_size=None, timeout=30, on_bytes=None, hash_name="sha1",
+                 throttle=None):
+        import hashlib
+        import urllib.error
+        self.expected_size = expected_size
+        self.on_bytes = on_bytes
+        self.throttle = throttle
+        self.hasher = hashlib.new(hash_name)
+        self.size = 0
+        self.replay = self.out_file = self.response = None
+        self.content_length = None
+
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        if expected_size is not None and offset > expected_size:
+            offset = 0  # Stale part from a different file; start over
+        if expected_size is None or offset != expected_size:
+            headers = {'Range': f"bytes={offset}-"} if offset else {}
+            try:
+                self.response = HTTP.open(url, headers=headers, timeout=timeout)
+            except urllib.error.HTTPError as e:
+                if not offset or e.code != 416:
+                    raise
+                # Nothing lies past offset: the part is either the whole file or stale
+                if e.headers.get("Content-Range", "") != f"bytes */{offset}":
+                    offset = 0
+                    self.response = HTTP.open(url, timeout=timeout)
+        if self.response is not None:
+            try:
+                if offset and self.response.status != 206:
+                    offset = 0
+                if self.response.status == 206:
+                    content_range = self.response.headers.get("Content-Range", "")
+                    if not content_range.startswith(f"bytes {offset}-"):
+                        raise DownloadError(f"Unexpected Content-Range '{content_range}' when resuming at byte {offset}")
+                content_length = self.response.headers.get("Content-Length")
+                if content_length is not None:
+                    self.content_length = int(content_length)
+                    if expected_size is not None and offset + self.content_length != expected_size:
+                        raise DownloadError(f"Size mismatch: server sent {offset + self.content_length} bytes, "
+                                            f"expected {expected_size}")
+                self.out_file = open(part_path, "ab" if offset else "wb")
+            except BaseException:
+                self.close()
+                raise
+        # Otherwise every byte is already on disk and only needs replaying for the checksum
+        self.offset = offset
+        if offset:
+            self.replay = open(part_path, "rb")
+
+    def account(self, chunk):
+        self.size += len(chunk)
+        self.hasher.update(chunk)
+        if self.on_bytes is not None:
+            self.on_bytes(len(chunk))
+
+    def read(self, amt=None):
+        """Return up to amt bytes: first from the part file, then from the network."""
+        import http.client
+        if amt is None or amt < 0:
+            amt = DOWNLOAD_CHUNK_SIZE
+        if self.replay is not None:
+            chunk = self.replay.read(min(amt, self.offset - self.size))
+            if chunk:
+                self.account(chunk)
+                return chunk
+            self.replay.close()
+            self.replay = None
+        if self.response is None:
+            return b""
+        chunk = self.response.read(amt)
+        if not chunk:
+            if self.content_length is not None and self.size - self.offset < self.content_length:
+                # The connection closed early; the part file keeps what arrived so the caller can resume
+                raise http.client.IncompleteRead(b"", self.content_length - (self.size - self.offset))
+            return b""
+        if self.expected_size is not None and self.size + len(chunk) > self.expected_size:
+            raise DownloadError(f"Size mismatch: received more than {self.expected_size} bytes")
+        if self.throttle is not None:
+            self.throttle(len(chunk))
+        self.out_file.write(chunk)
+        self.account(chunk)
+        return chunk
+
+    def close(self):
+        for handle in (self.replay, self.out_file, self.response):
+            if handle is not None:
+                handle.close()
+        self.replay = self.out_file = self.response = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def fetch_into_part(url, part_path, expected_size=None, timeout=30, on_bytes=None, throttle=None):
+    """Complete part_path from url, resuming where it left off; returns (hasher, size) for the whole file."""
+    with PartStream(url, part_path, expected_size, timeout, on_bytes, throttle=throttle) as stream:
+        while stream.read(DOWNLOAD_CHUNK_SIZE):
+            pass
+        return stream.hasher, stream.size
+
+
+def wait_before_retry(error, attempt, retries, label, progress=None):
+    """Re-raise error unless it is transient and retries remain; otherwise sleep with exponential backoff and jitter."""
+    if attempt >= retries or not is_transient_error(error):
+        raise error
+    delay = RETRY_BACKOFF * (2 ** attempt) * random.uniform(0.5, 1.5)
+    print(f"⚠️ CatClientHDR: {error}; retrying {label} in {delay:.1f}s ({attempt + 1}/{retries})")
+    if progress is not None:
+        progress.cancel_event.wait(delay)
+        progress.check_cancelled()
+    else:
+        time.sleep(delay)
+
+
+def stream_download(url, dest_path, expected_sha1=None, expected_size=None, timeout=30,
+                    progress=None, retries=None, throttle=None):
+    """Stream a URL to disk chunk by chunk, hashing as bytes arrive; returns (sha1, size).
+
+    Bytes land in dest_path + ".part", which survives network failures so the
+    next attempt (or launch) resumes with an HTTP Range request. A FileLock on
+    dest_path keeps other threads and launcher processes off the same part
+    file; one that waited reuses the file the holder finished. Transient errors
+    are retried with exponential backoff and jitter, then the next mirror is
+    tried. The part file is promoted to dest_path only once its size and SHA1
+    check out; on a mismatch it is deleted and DownloadError is raised. Each
+    chunk is counted on progress, which also aborts the transfer once the job
+    is cancelled, and passed through throttle to hold it to a bandwidth cap.
+    """
+    if retries is None:
+        retries = DOWNLOAD_RETRIES
+    with FileLock(dest_path, progress) as lock:
+        if lock.contended and expected_sha1 and os.path.exists(dest_path):
+            size = os.path.getsize(dest_path)
+            if (expected_size is None or size == expected_size) and sha1_file(dest_path) == expected_sha1:
+                return expected_sha1, size
+        return MIRRORS.failover(url, lambda candidate, attempts: stream_download_from(
+            candidate, dest_path, expected_sha1, expected_size, timeout, progress, attempts, throttle), retries)
+
+
+def stream_download_from(url, dest_path, expected_sha1, expected_size, timeout, progress, retries, throttle=None):
+    """Download url into dest_path from this one host, retrying transient errors up to retries times."""
+    part_path = dest_path + ".part"
+    restarted = False
+    attempt = 0
+    counted = [0]
+
+    def on_bytes(nbytes):
+        counted[0] += nbytes
+        if progress is not None:
+            progress.add(nbytes)
+
+    while True:
+        resumed = os.path.exists(part_path)
+        try:
+            hasher, size = fetch_into_part(url, part_path, expected_size, timeout, on_bytes, throttle)
+            if expected_size is not None and size != expected_size:
+                raise DownloadError(f"Size mismatch: received {size} bytes, expected {expected_size}")
+            digest = hasher.hexdigest()
+            if expected_sha1 and digest != expected_sha1:
+                raise DownloadError("Checksum mismatch")
+            os.replace(part_path, dest_path)
+            return digest, size
+        except DownloadError:
+            if os.path.exists(part_path):
+                os.remove(part_path)  # Never resume from bytes that failed verification
+            if progress is not None:
+                progress.rewind(counted[0])
+            counted[0] = 0
+            if resumed and not restarted:
+                restarted = True  # The old part may have been the bad bit; try once from scratch
+                continue
+            raise
+        except Exception as e:
+            if progress is not None:
+                progress.rewind(counted[0])
+            counted[0] = 0
+            wait_before_retry(e, attempt, retries, os.path.basename(dest_path), progress)
+            attempt += 1
+
+
+def promote_staging_dir(staging_dir, dest_dir):
+    """Rename each top-level entry of staging_dir into dest_dir, replacing leftovers; returns the names moved."""
+    names = os.listdir(staging_dir)
+    for name in names:
+        target = os.path.join(dest_dir, name)
+        if os.path.isdir(target) and not os.path.islink(target):
+            shutil.rmtree(target)
+        elif os.path.lexists(target):
+            os.remove(target)
+        os.rename(os.path.join(staging_dir, name), target)
+    os.rmdir(staging_dir)
+    return names
+
+
+def stream_extract_tar(url, dest_dir, expected_sha256=None, expected_size=None, timeout=30, progress=None,
+                       retries=None):
+    """Extract a .tar.gz into dest_dir while it downloads, checking its SHA256 as bytes arrive; returns the top-level names.
+
+    Members are unpacked into a staging directory inside dest_dir and renamed
+    into place only after the whole archive has verified. The compressed bytes
+    are teed to a .part file so a failed attempt resumes instead of starting
+    over, from the next mirror if this one keeps failing. The part file is
+    locked against other threads and launcher processes for the whole attempt.
+    """
+    import urllib.parse
+    if retries is None:
+        retries = DOWNLOAD_RETRIES
+    os.makedirs(dest_dir, exist_ok=True)
+    # Named after the upstream URL so every mirror resumes the same part file
+    part_path = os.path.join(dest_dir, os.path.basename(urllib.parse.urlsplit(url).path) + ".part")
+    with FileLock(part_path, progress):
+        return MIRRORS.failover(url, lambda candidate, attempts: extract_tar_from(
+            candidate, dest_dir, part_path, expected_sha256, expected_size, timeout, progress, attempts), retries)
+
+
+def extract_tar_from(url, dest_dir, part_path, expected_sha256, expected_size, timeout, progress, retries):
+    """Stream-extract url into dest_dir from this one host, retrying transient errors up to retries times."""
+    import tempfile
+    import tarfile
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    attempt = 0
+    counted = [0]
+
+    def on_bytes(nbytes):
+        counted[0] += nbytes
+        if progress is not None:
+            progress.add(nbytes)
+
+    while True:
+        staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=dest_dir)
+        try:
+            with PartStream(url, part_path, expected_size, timeout, on_bytes, hash_name="sha256") as stream:
+                with tarfile.open(fileobj=stream, mode="r|gz") as tar_ref:
+                    for member in tar_ref:
+                        tar_ref.extract(member, staging_dir, **extract_kwargs)
+                while stream.read(DOWNLOAD_CHUNK_SIZE):
+                    pass  # Hash any trailing padding after the last tar block
+                digest, size = stream.hasher.hexdigest(), stream.size
+            if expected_size is not None and size != expected_size:
+                raise DownloadError(f"Size mismatch: received {size} bytes, expected {expected_size}")
+            if expected_sha256 and digest != expected_sha256:
+                raise DownloadError("Checksum mismatch")
+            names = promote_staging_dir(staging_dir, dest_dir)
+            os.remove(part_path)
+            return names
+        except BaseException as e:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if progress is not None:
+                progress.rewind(counted[0])
+            counted[0] = 0
+            if isinstance(e, (DownloadError, tarfile.TarError)) and os.path.exists(part_path):
+                os.remove(part_path)  # Corrupt bytes; never resume from them
+            if not isinstance(e, Exception):
+                raise
+            wait_before_retry(e, attempt, retries, os.path.basename(part_path), progress)
+            attempt += 1
+
+
+@contextlib.contextmanager
+def atomic_output(path, mode="wb"):
+    """Yield a temp file beside path that replaces path, fsynced, only if the block completes; otherwise it is removed."""
+    import tempfile
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path, data, indent=None):
+    """Write JSON to a temp file beside path and swap it in with os.replace."""
+    with atomic_output(path, "w") as f:
+        json.dump(data, f, indent=indent)
+
+
+def try_lock_fd(fd):
+    """Take an exclusive lock on an open file without blocking; returns False if someone else holds it."""
+    if os.name == "nt":
+        import msvcrt
+        try:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+    import fcntl
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+def unlock_fd(fd):
+    if os.name == "nt":
+        import msvcrt
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        import fcntl
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLock:
+    """Exclusive lock on one path, shared by every thread and launcher process using the same CATCLIENT_DIR.
+
+    The lock is a file in CATCLIENT_DIR/locks named after a hash of the path,
+    held with flock (POSIX) or msvcrt.locking (Windows) and deleted on release.
+    While waiting, progress.check_cancelled() is polled so a cancelled job
+    never hangs on another process. contended is set when someone else held
+    the lock first, so the holder can check whether they already did the work.
+    """
+
+    def __init__(self, path, progress=None):
+        import hashlib
+        self.path = path
+        self.progress = progress
+        name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:24]
+        self.lock_path = os.path.join(CATCLIENT_DIR, "locks", f"{name}.lock")
+        self.fd = None
+        self.contended = False
+
+    def acquire(self):
+        os.makedirs(os.path.dirname(self.lock_path), exist_ok=True)
+        while True:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                while not try_lock_fd(fd):
+                    self.contended = True
+                    if self.progress is not None:
+                        self.progress.check_cancelled()
+                    time.sleep(0.05)
+                # The previous holder deletes the file on release; a lock on a deleted file guards nothing
+                if os.fstat(fd).st_ino == os.stat(self.lock_path).st_ino:
+                    self.fd = fd
+                    return self
+            except FileNotFoundError:
+                pass
+            except BaseException:
+                os.close(fd)
+                raise
+            os.close(fd)
+
+    def release(self):
+        try:
+            os.remove(self.lock_path)  # Windows refuses while the file is open; the lock file is then reused
+        except OSError:
+            pass
+        unlock_fd(self.fd)
+        os.close(self.fd)
+        self.fd = None
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class VerifyIndex:
+    """Remember which files were already hashed so unchanged files are trusted without re-reading them.
+
+    Records are keyed by absolute path and hold [size, mtime_ns, inode, sha1];
+    a file is trusted only while all three stat fields still match.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.records = {}
+        self.lock = threading.Lock()
+        self.dirty = False
+        try:
+            with open(index_path, "r") as f:
+                self.records = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Ignoring unreadable verify index: {e}")
+
+    def record(self, file_path, sha1, stat_result=None):
+        """Store the SHA1 of a file along with its current stat tuple."""
+        if stat_result is None:
+            stat_result = os.stat(file_path)
+        with self.lock:
+            self.records[os.path.abspath(file_path)] = [stat_result.st_size, stat_result.st_mtime_ns,
+                                                        stat_result.st_ino, sha1]
+            self.dirty = True
+
+    def verify(self, file_path, expected_sha1, deep=False):
+        """Return True if file_path has expected_sha1, hashing only when its stat tuple changed or deep is set."""
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return False
+        key = os.path.abspath(file_path)
+        if not deep:
+            with self.lock:
+                record = self.records.get(key)
+            if record and record == [stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino, expected_sha1]:
+                return True
+        try:
+            digest = sha1_file(file_path)
+        except Exception as e:
+            print(f"❌ CatClientHDR: Failed to verify file {file_path}: {e}")
+            return False
+        self.record(file_path, digest, stat_result)
+        return digest == expected_sha1
+
+    def save(self):
+        """Persist the index atomically if anything changed, dropping records for files that are gone."""
+        with self.lock:
+            if not self.dirty:
+                return
+            self.records = {path: record for path, record in self.records.items() if os.path.exists(path)}
+            records = dict(self.records)
+            self.dirty = False
+        try:
+            atomic_write_json(self.index_path, records)
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Could not save verify index: {e}")
+
+
+def parse_java_major(version_string):
+    """Turn a java.version string ("1.8.0_412", "17.0.2", "21") into its major version number."""
+    match = re.match(r'(\d+)(?:\.(\d+))?', version_string)
+    if not match:
+        return None
+    major = int(match.group(1))
+    if major == 1 and match.group(2):
+        major = int(match.group(2))  # Pre-9 versions report themselves as 1.x
+    return major
+
+
+def detect_hardware():
+    """Return {"cores", "total", "available"} for this machine; memory is in bytes and available may be None.
+
+    Uses psutil when it is installed, otherwise /proc/meminfo, sysctl or the
+    Win32 API; falls back to assuming 8 GiB if memory cannot be read.
+    """
+    import subprocess
+    hardware = {"cores": os.cpu_count() or 2, "total": None, "available": None}
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    try:
+        if psutil is not None:
+            memory = psutil.virtual_memory()
+            hardware["total"], hardware["available"] = memory.total, memory.available
+        elif os.path.exists("/proc/meminfo"):
+            meminfo = {}
+            with open("/proc/meminfo", "r") as f:
+                for line in f:
+                    key, _, value = line.partition(":")
+                    meminfo[key] = int(value.split()[0]) * 1024
+            hardware["total"], hardware["available"] = meminfo["MemTotal"], meminfo.get("MemAvailable")
+        elif platform.system() == "Darwin":
+            result = subprocess.run(["sysctl", "-n", "hw.memsize"], stdout=subprocess.PIPE, text=True, timeout=5)
+            hardware["total"] = int(result.stdout.strip())
+        elif platform.system() == "Windows":
+            import ctypes
+
+            class MemoryStatus(ctypes.Structure):
+                _fields_ = [("length", ctypes.c_ulong), ("load", ctypes.c_ulong), ("total", ctypes.c_ulonglong),
+                            ("available", ctypes.c_ulonglong), ("total_page", ctypes.c_ulonglong),
+                            ("available_page", ctypes.c_ulonglong), ("total_virtual", ctypes.c_ulonglong),
+                            ("available_virtual", ctypes.c_ulonglong), ("available_extended", ctypes.c_ulonglong)]
+
+            status = MemoryStatus()
+            status.length = ctypes.sizeof(MemoryStatus)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                hardware["total"], hardware["available"] = status.total, status.available
+    except Exception as e:
+        print(f"⚠️ CatClientHDR: Could not read system memory: {e}")
+    if not hardware["total"]:
+        hardware["total"] = 8 * 1024 ** 3
+    return hardware
+
+
+class JavaProbeCache:
+    """Remember what each Java binary reported so `java -version` only runs again when the binary changes.
+
+    Records are keyed by the binary's resolved path and hold its mtime_ns and
+    size alongside the probed version, major version and vendor.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.records = {}
+        self.lock = threading.Lock()
+        try:
+            with open(cache_path, "r") as f:
+                self.records = json.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Ignoring unreadable Java probe cache: {e}")
+
+    def candidates(self):
+        """List Java binaries to consider: the one on PATH, then every JDK under JAVA_DIR."""
+        exe = "java.exe" if platform.system() == "Windows" else "java"
+        found = []
+        system_java = shutil.which("java")
+        if system_java:
+            found.append(system_java)
+        if os.path.isdir(JAVA_DIR):
+            for dir_name in sorted(os.listdir(JAVA_DIR), reverse=True):
+                if not dir_name.startswith("jdk-"):
+                    continue
+                for bin_dir in (("bin",), ("Contents", "Home", "bin")):
+                    java_bin = os.path.join(JAVA_DIR, dir_name, *bin_dir, exe)
+                    if os.path.exists(java_bin):
+                        found.append(java_bin)
+                        break
+        return found
+
+    def probe(self, java_bin):
+        """Return {path, mtime_ns, size, version, major, vendor} for java_bin, spawning it only if it changed."""
+        import subprocess
+        with TRACER.span("java.probe", path=java_bin) as span:
+            try:
+                real_path = os.path.realpath(java_bin)
+                stat_result = os.stat(real_path)
+            except OSError:
+                return None
+            with self.lock:
+                record = self.records.get(real_path)
+            span["cache_hit"] = bool(record and record["mtime_ns"] == stat_result.st_mtime_ns
+                                     and record["size"] == stat_result.st_size)
+            if span["cache_hit"]:
+                return dict(record, path=java_bin)
+
+            try:
+                result = subprocess.run([real_path, "-XshowSettings:properties", "-version"],
+                                        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30)
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Could not run {java_bin}: {e}")
+                return None
+            output = result.stderr + result.stdout
+            version = re.search(r'^\s*java\.version = (.+)$', output, re.MULTILINE)
+            vendor = re.search(r'^\s*java\.vendor = (.+)$', output, re.MULTILINE)
+            if version:
+                version = version.group(1).strip()
+            else:
+                fallback = re.search(r'version "([^"]+)"', output)
+                version = fallback.group(1) if fallback else None
+            major = parse_java_major(version) if version else None
+            if major is None:
+                return None
+
+            record = {
+                "mtime_ns": stat_result.st_mtime_ns,
+                "size": stat_result.st_size,
+                "version": version,
+                "major": major,
+                "vendor": vendor.group(1).strip() if vendor else "unknown",
+            }
+            with self.lock:
+                self.records[real_path] = record
+                records = dict(self.records)
+            try:
+                atomic_write_json(self.cache_path, records)
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Could not save Java probe cache: {e}")
+            print(f"☕ CatClientHDR: Found Java {version} ({record['vendor']}) at {java_bin}")
+            return dict(record, path=java_bin)
+
+    def supports(self, java_bin, *flags):
+        """Return True if java_bin starts with exactly these -XX flags (e.g. "-XX:+UseZGC"); cached with the binary's probe.
+
+        The flags are tried as the launch will pass them, with nothing unlocked
+        on the side, so a flag that only works behind an unlock is not supported.
+        """
+        import subprocess
+        real_path = os.path.realpath(java_bin)
+        key = " ".join(flags)
+        with self.lock:
+            record = self.records.get(real_path)
+            if record is not None and key in record.get("flags", {}):
+                return record["flags"][key]
+        try:
+            result = subprocess.run([real_path, *flags, "-version"],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=30)
+            supported = result.returncode == 0
+        except Exception:
+            return False
+        with self.lock:
+            if real_path not in self.records:
+                return supported  # Not probed yet, so there is no record to keep the answer with
+            self.records[real_path].setdefault("flags", {})[key] = supported
+            records = dict(self.records)
+        try:
+            atomic_write_json(self.cache_path, records)
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Could not save Java probe cache: {e}")
+        return supported
+
+
+def disk_usage(paths):
+    """Total bytes of the files under paths, counting a file hardlinked into several of them once."""
+    seen = set()
+    total = 0
+    for root in paths:
+        for dirpath, _, filenames in os.walk(root):
+            for name in filenames:
+                try:
+                    stat_result = os.lstat(os.path.join(dirpath, name))
+                except OSError:
+                    continue
+                if (stat_result.st_dev, stat_result.st_ino) not in seen:
+                    seen.add((stat_result.st_dev, stat_result.st_ino))
+                    total += stat_result.st_size
+    return total
+
+
+def remove_path(path):
+    """Delete a file or folder tree; returns the bytes freed, where a file still hardlinked elsewhere frees nothing."""
+    freed = 0
+    if os.path.isdir(path) and not os.path.islink(path):
+        files = [os.path.join(dirpath, name) for dirpath, _, filenames in os.walk(path) for name in filenames]
+    else:
+        files = [path]
+    for file_path in files:
+        try:
+            stat_result = os.lstat(file_path)
+            os.remove(file_path)
+        except OSError:
+            continue
+        if stat_result.st_nlink <= 1:
+            freed += stat_result.st_size
+    if files != [path]:
+        shutil.rmtree(path, ignore_errors=True)
+    return freed
+
+
+class BlobStore:
+    """Content-addressed store of shared files under objects/xx/<sha1>.
+
+    Libraries, client jars and extracted natives are hardlinks to their blob, so
+    identical files across versions use disk space once, and a blob whose link
+    count has dropped to 1 is no longer referenced by any version.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.objects_dir = os.path.join(root, "objects")
+
+    def blob_path(self, sha1):
+        return os.path.join(self.objects_dir, sha1[:2], sha1)
+
+    def adopt(self, file_path, sha1):
+        """Link a verified file into the store, or swap it for an existing identical blob.
+
+        Returns True when file_path now points at a different inode than before.
+        Filesystems without hardlink support simply keep their plain copies.
+        """
+        blob = self.blob_path(sha1)
+        try:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            try:
+                os.link(file_path, blob)
+                return False
+            except FileExistsError:
+                pass
+            if os.path.samefile(file_path, blob):
+                return False
+            tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.link"
+            os.link(blob, tmp_path)
+            os.replace(tmp_path, file_path)
+            return True
+        except OSError as e:
+            print(f"⚠️ CatClientHDR: Could not dedupe {os.path.basename(file_path)}: {e}")
+            return False
+
+    def blobs(self):
+        """Yield (sha1, path, stat_result) for every blob in the store."""
+        if not os.path.isdir(self.objects_dir):
+            return
+        for prefix in os.listdir(self.objects_dir):
+            prefix_dir = os.path.join(self.objects_dir, prefix)
+            for sha1 in os.listdir(prefix_dir):
+                blob = os.path.join(prefix_dir, sha1)
+                try:
+                    yield sha1, blob, os.stat(blob)
+                except OSError:
+                    continue
+
+    def collect_garbage(self):
+        """Delete blobs nothing links to any more; returns the bytes freed."""
+        freed = 0
+        for _, blob, stat_result in self.blobs():
+            if stat_result.st_nlink <= 1:
+                os.remove(blob)
+                freed += stat_result.st_size
+        return freed
+
+
+class VersionIndex:
+    """Searchable view of a version manifest, built once per manifest load.
+
+    Entries are kept newest first by releaseTime. Searches match ids by prefix
+    (ranked first) or substring, and can filter by type and release date;
+    a query that extends the previous one only rescans the previous hits.
+    """
+
+    def __init__(self, manifest):
+        self.latest = manifest.get("latest", {})
+        self.entries = sorted(manifest.get("versions", []), key=lambda v: v.get("releaseTime", ""), reverse=True)
+        self.by_id = {v["id"]: v for v in self.entries}
+        self.lower_ids = [v["id"].lower() for v in self.entries]
+        # (lowercase id, position) pairs in id order, for bisecting prefix matches
+        self.sorted_ids = sorted((lower_id, i) for i, lower_id in enumerate(self.lower_ids))
+        self.last_query = None
+        self.last_hits = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, version_id):
+        return self.by_id.get(version_id)
+
+    def match(self, query):
+        """Return positions of ids containing query: prefix matches first, each group newest first."""
+        if not query:
+            return list(range(len(self.entries)))
+        if self.last_query and query.startswith(self.last_query):
+            candidates = self.last_hits  # Typing another character can only narrow the previous hits
+        else:
+            candidates = range(len(self.entries))
+        start = bisect.bisect_left(self.sorted_ids, (query,))
+        prefix = set()
+        for lower_id, i in self.sorted_ids[start:]:
+            if not lower_id.startswith(query):
+                break
+            prefix.add(i)
+        hits = [i for i in candidates if i in prefix] + [i for i in candidates
+                                                         if i not in prefix and query in self.lower_ids[i]]
+        self.last_query, self.last_hits = query, sorted(hits)
+        return hits
+
+    def search(self, query="", types=None, since=None, until=None):
+        """Return matching manifest entries; since/until are date prefixes like "2023" or "2023-04-05"."""
+        results = []
+        for i in self.match(query.strip().lower()):
+            entry = self.entries[i]
+            released = entry.get("releaseTime", "")
+            if types and entry.get("type") not in types:
+                continue
+            if since and released[:len(since)] < since:
+                continue
+            if until and released[:len(until)] > until:
+                continue
+            results.append(entry)
+        return results
+
+
+# Log lines that mark how far a game has got through startup, first match wins
+GAME_MILESTONES = (
+    ("window", re.compile(r"Backend library: LWJGL|LWJGL Version: ")),
+    ("first_frame", re.compile(r"Sound engine started|Created: \d+x\d+x\d+ minecraft:textures/atlas|"
+                               r"Created: \d+x\d+ textures-atlas|OpenAL initialized")),
+)
+# Output that explains a failed exit, checked in order
+CRASH_CAUSES = (
+    (re.compile(r"Could not reserve enough space|Invalid maximum heap size|Could not create the Java Virtual Machine"),
+     "Java could not start with this much RAM; lower the RAM setting"),
+    (re.compile(r"java\.lang\.OutOfMemoryError"), "The game ran out of memory; raise the RAM setting"),
+    (re.compile(r"UnsupportedClassVersionError"), "This version needs a newer Java"),
+    (re.compile(r"ClassNotFoundException|NoClassDefFoundError|Could not find or load main class"),
+     "A library is missing or corrupt; launch again with deep verify"),
+    (re.compile(r"UnsatisfiedLinkError|Failed to locate library|Can't load library"),
+     "A native library failed to load; launch again with deep verify"),
+    (re.compile(r"Pixel format not accelerated|GLFW error 6554[23]|driver does not appear to support OpenGL"),
+     "The graphics driver does not support the OpenGL version the game needs"),
+    (re.compile(r"A fatal error has been detected by the Java Runtime Environment"),
+     "The JVM crashed; see the hs_err_pid log in the game directory"),
+)
+CRASH_REPORT_LINE = re.compile(r"Crash report saved to:\s*(?:#@!@#\s*)?(.+?)\s*$")
+
+
+def sample_process(pid):
+    """Return (rss_bytes, swap_bytes, cpu_seconds) for pid, or None when it cannot be read.
+
+    Uses psutil when it is installed, /proc on Linux and `ps` on other POSIX
+    systems; swap is only known on Linux and is None elsewhere.
+    """
+    import subprocess
+    try:
+        import psutil
+    except ImportError:
+        psutil = None
+    try:
+        if psutil is not None:
+            process = psutil.Process(pid)
+            cpu = process.cpu_times()
+            return process.memory_info().rss, None, cpu.user + cpu.system
+        if os.path.exists(f"/proc/{pid}/stat"):
+            with open(f"/proc/{pid}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            cpu_seconds = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")  # utime + stime
+            status = {}
+            with open(f"/proc/{pid}/status", "r") as f:
+                for line in f:
+                    key, _, value = line.partition(":")
+                    status[key] = value.split()
+            rss = int(status.get("VmRSS", ["0"])[0]) * 1024
+            swap = int(status.get("VmSwap", ["0"])[0]) * 1024
+            return rss, swap, cpu_seconds
+        if platform.system() != "Windows":
+            result = subprocess.run(["ps", "-o", "rss=,time=", "-p", str(pid)], stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL, text=True, timeout=5)
+            rss_kb, cpu_time = result.stdout.split()
+            days, _, clock = cpu_time.rpartition("-")
+            seconds = 0.0
+            for part in clock.split(":"):
+                seconds = seconds * 60 + float(part)
+            return int(rss_kb) * 1024, None, seconds + int(days or 0) * 86400
+    except Exception:
+        pass  # The process exited between samples, or the platform hides it
+    return None
+
+
+def process_alive(pid):
+    """Return whether a process with this PID is still running."""
+    if platform.system() == "Windows":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        code = ctypes.c_ulong()
+        alive = kernel32.GetExitCodeProcess(handle, ctypes.byref(code)) and code.value == 259  # STILL_ACTIVE
+        kernel32.CloseHandle(handle)
+        return bool(alive)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # Exists, but belongs to another user
+    return True
+
+
+class GameSession:
+    """One launched game: its process, captured output, resource samples, startup milestones and exit diagnosis.
+
+    stdout and stderr are read on their own threads into a rotating log file
+    and a ring buffer of the last GAME_LOG_LINES lines, so a chatty game never
+    blocks on a full pipe. A sampler thread records RSS, swap and CPU every
+    GAME_SAMPLE_SECONDS, and a watcher thread writes a JSON summary on exit
+    and then calls on_exit(session), if given. The summary is first written
+    at start, so other launcher processes can tell the game is running.
+    """
+
+    def __init__(self, command, version, log_dir, cwd=None, on_exit=None, instance=None, affinity=None, nice=0):
+        import subprocess
+        self.command = command
+        self.version = version
+        self.instance = instance
+        self.on_exit = on_exit
+        self.lines = collections.deque(maxlen=GAME_LOG_LINES)
+        self.line_count = 0  # Lines seen so far; lets the window skip redraws when nothing is new
+        self.samples = collections.deque(maxlen=GAME_SAMPLES)  # (seconds since start, rss, swap, cpu %)
+        self.milestones = {}  # Name -> seconds since start
+        self.cause = None
+        self.crash_report = None
+        self.exit_code = None
+        self.ended = None
+        self.peak_rss = 0
+        self.swap_warned = False
+        self.lock = threading.Lock()
+        self.exited = threading.Event()
+
+        now = time.time()
+        stamp = f"{time.strftime('%Y%m%d-%H%M%S', time.localtime(now))}.{int(now * 1000) % 1000:03d}"
+        label = instance or version
+        self.log_path = os.path.join(log_dir, f"game-{stamp}-{re.sub(r'[^A-Za-z0-9_.-]', '_', label)}.log")
+        os.makedirs(log_dir, exist_ok=True)
+        self.log_file = open(self.log_path, "w", encoding="utf-8", buffering=1)
+        self.log_size = 0
+
+        self.started = time.monotonic()
+        placed_command, placement, leftover = process_placement(command, affinity, nice)
+        try:
+            self.process = subprocess.Popen(placed_command, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                            stderr=subprocess.PIPE, **placement)
+        except BaseException:
+            self.log_file.close()
+            raise
+        self.pid = self.process.pid
+        if any(leftover):
+            place_running_process(self.pid, *leftover)
+        self.readers = [threading.Thread(target=self.read_stream, args=(stream, name), daemon=True,
+                                         name=f"game-{self.pid}-{name}")
+                        for stream, name in ((self.process.stdout, "stdout"), (self.process.stderr, "stderr"))]
+        for thread in self.readers:
+            thread.start()
+        self.write_summary()
+        threading.Thread(target=self.sample_loop, daemon=True, name=f"game-{self.pid}-sampler").start()
+        threading.Thread(target=self.watch, daemon=True, name=f"game-{self.pid}-watcher").start()
+
+    def poll(self):
+        return self.process.poll()
+
+    def wait(self, timeout=None):
+        """Block until the game has exited and its summary is written; returns the exit code."""
+        self.exited.wait(timeout)
+        return self.exit_code
+
+    def read_stream(self, stream, name):
+        for raw in iter(stream.readline, b""):
+            self.add_line(name, raw.decode("utf-8", "replace").rstrip("\r\n"))
+        stream.close()
+
+    def add_line(self, name, line):
+        """Record one output line: ring buffer, log file, milestones and crash clues."""
+        elapsed = time.monotonic() - self.started
+        with self.lock:
+            self.lines.append((name, line))
+            self.line_count += 1
+            self.milestones.setdefault("first_output", elapsed)
+            for milestone, pattern in GAME_MILESTONES:
+                if milestone not in self.milestones and pattern.search(line):
+                    self.milestones[milestone] = elapsed
+                    print(f"🎮 CatClientHDR: Game reached {milestone.replace('_', ' ')} after {elapsed:.1f}s")
+            if self.cause is None:
+                for pattern, cause in CRASH_CAUSES:
+                    if pattern.search(line):
+                        self.cause = cause
+                        break
+            report = CRASH_REPORT_LINE.search(line)
+            if report:
+                self.crash_report = report.group(1)
+            self.write_log(line + "\n" if name == "stdout" else f"[stderr] {line}\n")
+
+    def write_log(self, text):
+        """Append to the log file, rolling it over to .1, .2, ... once it passes GAME_LOG_MAX_BYTES (lock held)."""
+        self.log_file.write(text)
+        self.log_size += len(text.encode("utf-8"))  # The limit is in bytes; one character may take up to four
+        if self.log_size < GAME_LOG_MAX_BYTES:
+            return
+        self.log_file.close()
+        for index in range(GAME_LOG_BACKUPS - 1, 0, -1):
+            if os.path.exists(f"{self.log_path}.{index}"):
+                os.replace(f"{self.log_path}.{index}", f"{self.log_path}.{index + 1}")
+        os.replace(self.log_path, f"{self.log_path}.1")
+        self.log_file = open(self.log_path, "w", encoding="utf-8", buffering=1)
+        self.log_size = 0
+
+    def sample_loop(self):
+        """Sample memory and CPU until the game exits; warns once if it starts swapping."""
+        last = None
+        while not self.exited.wait(GAME_SAMPLE_SECONDS if last else 0.5):
+            sample = sample_process(self.pid)
+            if sample is None:
+                continue
+            now = time.monotonic()
+            rss, swap, cpu_seconds = sample
+            cpu_percent = (cpu_seconds - last[1]) / (now - last[0]) * 100 if last else None
+            last = (now, cpu_seconds)
+            with self.lock:
+                self.samples.append((now - self.started, rss, swap, cpu_percent))
+                self.peak_rss = max(self.peak_rss, rss)
+                warn = bool(swap) and swap > 64 * 1024 * 1024 and not self.swap_warned
+                self.swap_warned = self.swap_warned or warn
+            if warn:
+                print(f"⚠️ CatClientHDR: The game is swapping ({swap / (1024 * 1024):.0f} MB in swap); "
+                      f"lower the RAM setting or close other programs")
+
+    def watch(self):
+        """Wait for the game to exit, drain its output, diagnose the exit and write the JSON summary."""
+        import signal
+        code = self.process.wait()
+        for thread in self.readers:
+            thread.join(5)
+        with self.lock:
+            self.exit_code = code
+            self.ended = time.monotonic()
+            if code == 0:
+                self.cause = None
+            elif code < 0:
+                name = signal.Signals(-code).name if -code in signal.valid_signals() else str(-code)
+                self.cause = self.cause or (f"Killed by {name}" + (" (the system may have run out of memory)"
+                                                                   if name == "SIGKILL" else ""))
+            elif self.cause is None:
+                self.cause = (f"Exited with code {code}" if "first_frame" in self.milestones
+                              else f"Exited with code {code} before the first frame")
+            self.log_file.close()
+        self.write_summary()
+        if code == 0:
+            print(f"✅ CatClientHDR: Game closed after {self.ended - self.started:.0f}s. {self.describe()}")
+        else:
+            print(f"💥 CatClientHDR: Game crashed: {self.cause}." + (f" Crash report: {self.crash_report}"
+                                                                    if self.crash_report else ""))
+            print(f"📝 CatClientHDR: Game log: {self.log_path}")
+        if self.on_exit is not None:
+            try:
+                self.on_exit(self)
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Game exit hook failed: {e}")
+        self.exited.set()
+
+    def write_summary(self):
+        """Write status() next to the log file."""
+        try:
+            atomic_write_json(self.log_path[:-len(".log")] + ".json", self.status())
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Could not write game summary: {e}")
+
+    def status(self):
+        """Return a JSON-ready snapshot of the session."""
+        with self.lock:
+            latest = self.samples[-1] if self.samples else None
+            end = self.ended if self.ended is not None else time.monotonic()
+            if self.exit_code is None:
+                state = "running" if "first_frame" in self.milestones else "starting"
+            else:
+                state = "exited" if self.exit_code == 0 else "crashed"
+            return {
+                "pid": self.pid,
+                "version": self.version,
+                "instance": self.instance,
+                "state": state,
+                "uptime": round(end - self.started, 3),
+                "rss": latest[1] if latest else None,
+                "swap": latest[2] if latest else None,
+                "cpu_percent": round(latest[3], 1) if latest and latest[3] is not None else None,
+                "peak_rss": self.peak_rss,
+                "milestones": {name: round(seconds, 3) for name, seconds in self.milestones.items()},
+                "exit_code": self.exit_code,
+                "cause": self.cause,
+                "crash_report": self.crash_report,
+                "log_path": self.log_path,
+                "command": self.command,
+            }
+
+    def describe(self):
+        """One status line for the window and CLI: state, uptime, memory, CPU and time to first frame."""
+        status = self.status()
+        parts = [f"PID {status['pid']} {status['state']} {status['uptime']:.0f}s"]
+        if status["instance"]:
+            parts.insert(0, status["instance"])
+        if status["rss"] is not None:
+            parts.append(f"RSS {status['rss'] / (1024 ** 3):.2f} GB (peak {status['peak_rss'] / (1024 ** 3):.2f})")
+        if status["swap"]:
+            parts.append(f"swap {status['swap'] / (1024 * 1024):.0f} MB")
+        if status["cpu_percent"] is not None and status["exit_code"] is None:
+            parts.append(f"CPU {status['cpu_percent']:.0f}%")
+        if "first_frame" in status["milestones"]:
+            parts.append(f"first frame {status['milestones']['first_frame']:.1f}s")
+        if status["cause"]:
+            parts.append(status["cause"])
+        return " · ".join(parts)
+
+    def tail(self, count=200):
+        """Return the last count (stream, line) pairs."""
+        with self.lock:
+            return list(self.lines)[-count:]
+
+
+class GameSupervisor:
+    """Launch games as GameSessions and keep track of them; old session logs are pruned on each launch."""
+
+    def __init__(self):
+        self.sessions = []
+        self.lock = threading.Lock()
+
+    def launch(self, command, version, cwd=None, on_exit=None, instance=None, affinity=None, nice=0):
+        """Start command under supervision and return its GameSession."""
+        logs_dir = os.path.join(CATCLIENT_DIR, "logs")
+        self.prune_logs(logs_dir)
+        session = GameSession(command, version, logs_dir, cwd, on_exit, instance, affinity, nice)
+        with self.lock:
+            self.sessions = [s for s in self.sessions if s.exit_code is None] + [session]
+        return session
+
+    def latest(self):
+        with self.lock:
+            return self.sessions[-1] if self.sessions else None
+
+    def running(self):
+        with self.lock:
+            return [session for session in self.sessions if session.exit_code is None]
+
+    def running_instance(self, name):
+        """Return the running session of the named instance, if any."""
+        return next((session for session in self.running() if session.instance == name), None)
+
+    @staticmethod
+    def running_summaries(logs_dir):
+        """Return the summaries of games still running, whichever launcher process started them."""
+        summaries = []
+        if not os.path.isdir(logs_dir):
+            return summaries
+        for name in os.listdir(logs_dir):
+            if not (name.startswith("game-") and name.endswith(".json")):
+                continue
+            try:
+                with open(os.path.join(logs_dir, name), "r") as f:
+                    summary = json.load(f)
+            except (OSError, ValueError):
+                continue
+            # A launcher killed mid-game never writes the exit summary; its game is gone once the PID is
+            if summary.get("exit_code") is None and summary.get("pid") and process_alive(summary["pid"]):
+                summaries.append(summary)
+        return summaries
+
+    @staticmethod
+    def prune_logs(logs_dir):
+        """Keep the files of the newest GAME_LOG_HISTORY - 1 finished game sessions, making room for the next one.
+
+        Logs of games still running, in this or another launcher process, are never pruned.
+        """
+        if not os.path.isdir(logs_dir):
+            return
+        running = {os.path.basename(summary.get("log_path") or "")[:-len(".log")]
+                   for summary in GameSupervisor.running_summaries(logs_dir)}
+        stems = {}
+        for name in os.listdir(logs_dir):
+            stem = re.sub(r"\.(log(\.\d+)?|json)$", "", name)
+            if name.startswith("game-") and stem not in running:
+                stems.setdefault(stem, []).append(name)
+        for stem in sorted(stems)[:-(GAME_LOG_HISTORY - 1) or None]:
+            for name in stems[stem]:
+                try:
+                    os.remove(os.path.join(logs_dir, name))
+                except OSError:
+                    pass  # Still open by a running game on Windows
+
+
+def parse_cpu_list(text):
+    """Parse a CPU list like "0-3,6" into sorted CPU numbers; raises ValueError for CPUs this machine lacks."""
+    cpus = set()
+    for part in text.replace(" ", "").split(","):
+        first, _, last = part.partition("-")
+        cpus.update(range(int(first), int(last or first) + 1))
+    if not cpus or max(cpus) >= (os.cpu_count() or 1):
+        raise ValueError(f"CPU list {text!r} does not fit this machine's {os.cpu_count()} CPUs")
+    return sorted(cpus)
+
+
+def process_placement(command, affinity, nice):
+    """Return (command, popen_kwargs, leftover) that start command pinned to the affinity CPUs at the nice level.
+
+    On POSIX the command is wrapped in `taskset -c` and `nice -n`, so every JVM
+    thread inherits both from the first instruction. Nothing runs in the forked
+    child, which is unsafe in a launcher full of threads. Windows maps nice to
+    a priority class. leftover is the (affinity, nice) that could not be applied
+    this way, either because the tool is missing (macOS has no taskset) or
+    because this is Windows affinity; place_running_process sets it after start.
+    """
+    import subprocess
+    if platform.system() == "Windows":
+        if nice >= 15:
+            flags = {"creationflags": subprocess.IDLE_PRIORITY_CLASS}
+        elif nice > 0:
+            flags = {"creationflags": subprocess.BELOW_NORMAL_PRIORITY_CLASS}
+        elif nice < 0:
+            flags = {"creationflags": subprocess.ABOVE_NORMAL_PRIORITY_CLASS}
+        else:
+            flags = {}
+        return command, flags, (affinity, 0)
+    prefix = []
+    if affinity and shutil.which("taskset"):
+        prefix += ["taskset", "-c", ",".join(str(cpu) for cpu in affinity)]
+        affinity = None
+    if nice and shutil.which("nice"):
+        prefix += ["nice", "-n", str(nice)]
+        nice = 0
+    return prefix + list(command), {}, (affinity, nice)
+
+
+def place_running_process(pid, affinity, nice):
+    """Pin an already started process (every thread it has so far, on Linux) to the affinity CPUs at the nice level."""
+    if platform.system() == "Windows":
+        if affinity:
+            set_windows_affinity(pid, affinity)
+        return
+    task_dir = f"/proc/{pid}/task"
+    try:
+        threads = [int(tid) for tid in os.listdir(task_dir)] if os.path.isdir(task_dir) else [pid]
+        for tid in threads:
+            if affinity and hasattr(os, "sched_setaffinity"):
+                os.sched_setaffinity(tid, affinity)
+            if nice:
+                os.setpriority(os.PRIO_PROCESS, tid, nice)
+    except OSError as e:
+        print(f"⚠️ CatClientHDR: Could not set CPU affinity or priority of PID {pid}: {e}")
+
+
+def set_windows_affinity(pid, affinity):
+    """Pin a running Windows process to the affinity CPUs."""
+    import ctypes
+    mask = sum(1 << cpu for cpu in affinity)
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.OpenProcess(0x0200 | 0x0400, False, pid)  # PROCESS_SET_INFORMATION | PROCESS_QUERY_INFORMATION
+    if not handle or not kernel32.SetProcessAffinityMask(handle, ctypes.c_size_t(mask)):
+        print(f"⚠️ CatClientHDR: Could not pin PID {pid} to CPUs {affinity}")
+    if handle:
+        kernel32.CloseHandle(handle)
+
+
+class InstanceStore:
+    """Named instances under INSTANCES_DIR, each with its own game folder, options and launch settings.
+
+    An instance is instances/<name>/instance.json plus the game folder
+    instances/<name>/minecraft (saves, options.txt, resource packs, game
+    logs). Versions, libraries, assets and Java stay in the shared store.
+    """
+
+    NAME_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,31}$")
+    DEFAULTS = {"username": "CatGamer", "ram": 4, "profile": "auto", "cds": True, "affinity": None, "nice": 0}
+
+    def __init__(self, root):
+        self.root = root
+
+    def config_path(self, name):
+        return os.path.join(self.root, name, "instance.json")
+
+    def game_dir(self, name):
+        return os.path.join(self.root, name, "minecraft")
+
+    def names(self):
+        """Return the names of every instance, sorted."""
+        if not os.path.isdir(self.root):
+            return []
+        return sorted(name for name in os.listdir(self.root) if os.path.isfile(self.config_path(name)))
+
+    def get(self, name):
+        """Return the named instance's settings with defaults filled in, or None if it does not exist."""
+        try:
+            with open(self.config_path(name), "r") as f:
+                instance = dict(self.DEFAULTS, **json.load(f))
+        except FileNotFoundError:
+            return None
+        instance["name"] = name
+        return instance
+
+    def save(self, name, **settings):
+        """Create or update an instance; unknown names must be valid, and affinity must fit this machine."""
+        if not self.NAME_PATTERN.match(name):
+            raise ValueError(f"Instance names are 1-32 letters, digits, '.', '_' or '-': {name!r}")
+        with FileLock(self.config_path(name)):
+            instance = self.get(name) or dict(self.DEFAULTS)
+            instance.update(settings)
+            instance.pop("name", None)
+            if not instance.get("version"):
+                raise ValueError(f"Instance {name} needs a version")
+            if instance["profile"] not in JVM_PROFILES:
+                raise ValueError(f"Unknown JVM profile {instance['profile']!r}")
+            if instance["affinity"]:
+                instance["affinity"] = parse_cpu_list(",".join(str(cpu) for cpu in instance["affinity"]))
+            if instance["nice"] < 0 and hasattr(os, "geteuid") and os.geteuid() != 0:
+                raise ValueError("Only root can start a game with a negative nice level")
+            os.makedirs(self.game_dir(name), exist_ok=True)
+            atomic_write_json(self.config_path(name), instance, indent=2)
+            return self.get(name)
+
+    def is_running(self, name):
+        """Return whether a game of the named instance is running, started by this or any other launcher process."""
+        return any(summary.get("instance") == name
+                   for summary in GameSupervisor.running_summaries(os.path.join(CATCLIENT_DIR, "logs")))
+
+    def delete(self, name, delete_files=False):
+        """Forget an instance; its game folder (saves included) is only removed when delete_files is set.
+
+        Raises ValueError while a game of the instance is running.
+        """
+        if self.is_running(name):
+            raise ValueError(f"Instance {name} is running; close the game first")
+        if delete_files:
+            shutil.rmtree(os.path.join(self.root, name))
+        else:
+            os.remove(self.config_path(name))
+
+
+class LauncherCore:
+    def __init__(self):
+        """Set up the launcher state shared by the window and the headless CLI."""
+        self.versions = {}  # Dictionary to store version IDs and their URLs
+        self.progress = ProgressReporter()  # Replaced per job by the window or CLI
+        self.job_thread = None
+        self.java_probes = JavaProbeCache(os.path.join(CATCLIENT_DIR, "java_probe.json"))
+        self.java_runtime = None  # Probe record of the Java chosen for this session
+        self.version_index = VersionIndex({})
+        self.background_jobs = []  # Threads finishing asset downloads after a launch
+        self.games = GameSupervisor()
+        self.hardware = None  # detect_hardware(), read on first use
+        self.instances = InstanceStore(INSTANCES_DIR)
+
+    def show_error(self, title, message):
+        """Report an error; the window overrides this with a dialog."""
+        print(f"❌ {title}: {message}", file=sys.stderr)
+
+    def show_warning(self, title, message):
+        """Report a warning; the window overrides this with a dialog."""
+        print(f"⚠️ {title}: {message}", file=sys.stderr)
+
+    def export_trace(self, label):
+        """Write the spans recorded since the last export to CATCLIENT_DIR/logs and start a fresh trace."""
+        try:
+            trace_path = TRACER.export(label)
+            print(f"⏱️ CatClientHDR: Timing trace written to {trace_path}")
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Could not write timing trace: {e}")
+        TRACER.reset()
+
+    def read_manifest_cache(self):
+        """Return the cached (manifest, meta) pair, or (None, {}) when there is no usable cache."""
+        with TRACER.span("manifest.cache_read") as span:
+            try:
+                with open(MANIFEST_CACHE_PATH, "r") as f:
+                    manifest = json.load(f)
+                with open(MANIFEST_META_PATH, "r") as f:
+                    meta = json.load(f)
+                span["cache_hit"] = True
+                return manifest, meta
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Ignoring unreadable manifest cache: {e}")
+            span["cache_hit"] = False
+            return None, {}
+
+    def fetch_version_manifest(self, meta):
+        """Conditionally re-fetch the manifest and update the cache; returns (manifest, meta), or None if unchanged."""
+        import urllib.error
+        with TRACER.span("manifest.fetch") as span:
+            headers = {'Accept': 'application/json'}
+            if meta.get("etag"):
+                headers['If-None-Match'] = meta["etag"]
+            if meta.get("last_modified"):
+                headers['If-Modified-Since'] = meta["last_modified"]
+            try:
+                with HTTP.open(VERSION_MANIFEST_URL, headers=headers, timeout=10) as url:
+                    body = url.read()
+                    span["bytes"] = len(body)
+                    manifest = json.loads(body.decode())
+                    new_meta = {"etag": url.headers.get("ETag"), "last_modified": url.headers.get("Last-Modified")}
+            except urllib.error.HTTPError as e:
+                if e.code == 304:
+                    span["cache_hit"] = True
+                    return None
+                raise
+            atomic_write_json(MANIFEST_CACHE_PATH, manifest)
+            atomic_write_json(MANIFEST_META_PATH, new_meta)
+            return manifest, new_meta
+
+    def index_manifest(self, manifest):
+        """Record the JSON URL of every version in a parsed manifest and rebuild the search index."""
+        for v in manifest["versions"]:
+            self.versions[v["id"]] = v["url"]
+        self.version_index = VersionIndex(manifest)
+
+    def ensure_version_manifest(self):
+        """Load the version manifest for headless use: revalidate the cache, falling back to it when offline."""
+        manifest, meta = self.read_manifest_cache()
+        try:
+            fetched = self.fetch_version_manifest(meta if manifest is not None else {})
+            if fetched is not None:
+                manifest = fetched[0]
+        except Exception as e:
+            if manifest is None:
+                print(f"❌ CatClientHDR: Error loading version manifest: {e}")
+                self.show_error("CatClientHDR Error", f"Failed to load version manifest.\n\nError: {str(e)}")
+                return False
+            print(f"⚠️ CatClientHDR: Could not refresh version manifest, using cached copy: {e}")
+        self.index_manifest(manifest)
+        return True
+
+    def get_latest_java_url(self):
+        """Fetch the latest OpenJDK 21 package from Adoptium; returns (url, version, sha256, size)."""
+        try:
+            releases = HTTP.get_json(ADOPTIUM_API_URL, timeout=10)  # Origin only: it carries the JDK's SHA256
+            system = platform.system()
+            arch = "x64"
+            os_map = {"Windows": "windows", "Linux": "linux", "Darwin": "mac"}
+            os_name = os_map.get(system, None)
+            if not os_name:
+                return None, None, None, None
+            for release in releases:
+                if release["binary"]["os"] == os_name and release["binary"]["architecture"] == arch:
+                    package = release["binary"]["package"]
+                    return (package["link"], release["version"]["openjdk_version"],
+                            package.get("checksum"), package.get("size"))
+            return None, None, None, None
+        except Exception as e:
+            print(f"❌ CatClientHDR: Failed to fetch latest Java version: {e}")
+            return None, None, None, None
+
+    def find_java(self, required_version="21"):
+        """Return the probe record of the first Java >= required_version (system Java first, then local JDKs)."""
+        required = int(required_version)
+        if self.java_runtime is not None and self.java_runtime["major"] >= required:
+            return self.java_runtime
+        for java_bin in self.java_probes.candidates():
+            record = self.java_probes.probe(java_bin)
+            if record is not None and record["major"] >= required:
+                self.java_runtime = record
+                return record
+        return None
+
+    def is_java_installed(self, required_version="21"):
+        """Check if a compatible Java version (21 or higher) is installed."""
+        return self.find_java(required_version) is not None
+
+    def get_local_java_dir(self):
+        """Find the extracted Java directory dynamically."""
+        for dir_name in sorted(os.listdir(JAVA_DIR)) if os.path.isdir(JAVA_DIR) else []:
+            if dir_name.startswith("jdk-") and os.path.isdir(os.path.join(JAVA_DIR, dir_name)):
+                return dir_name
+        return "jdk-21.0.5+11"  # Fallback to default if not found
+
+    def install_java_if_needed(self):
+        """Install the latest OpenJDK 21 if a compatible Java version is not found."""
+        import ssl
+        import tempfile
+        import zipfile
+        with TRACER.span("java.install") as span, contextlib.ExitStack() as held:
+            span["cache_hit"] = self.is_java_installed()
+            if span["cache_hit"]:
+                print("✅ CatClientHDR: Java is already installed!")
+                return
+            # Another launcher process may be installing the same JDK right now; wait and reuse it
+            if held.enter_context(FileLock(JAVA_DIR, self.progress)).contended and self.is_java_installed():
+                span["cache_hit"] = True
+                print("✅ CatClientHDR: Java was installed by another launcher!")
+                return
+            print("🐱 CatClientHDR: Installing OpenJDK 21... (meow)")
+            java_url, java_version, java_sha256, java_size = self.get_latest_java_url()
+            span["bytes"] = java_size
+            if not java_url:
+                self.show_error("CatClientHDR Error", "Unsupported OS or failed to fetch Java URL - this cat can't run here!")
+                return
+
+            os.makedirs(JAVA_DIR, exist_ok=True)
+            import tarfile
+
+            try:
+                self.progress.phase("Installing Java", 1, java_size or 0)
+                if platform.system() == "Windows":
+                    # Zip archives keep their directory at the end, so they cannot be unpacked mid-download
+                    archive_path = os.path.join(JAVA_DIR, "openjdk.zip")
+                    stream_download(java_url, archive_path, expected_size=java_size, timeout=30, progress=self.progress)
+                    try:
+                        if java_sha256 and sha1_file(archive_path, "sha256") != java_sha256:
+                            raise DownloadError("Checksum mismatch")
+                        staging_dir = tempfile.mkdtemp(prefix=".staging-", dir=JAVA_DIR)
+                        try:
+                            with zipfile.ZipFile(archive_path, "r") as zip_ref:
+                                zip_ref.extractall(staging_dir)
+                            promote_staging_dir(staging_dir, JAVA_DIR)
+                        except BaseException:
+                            shutil.rmtree(staging_dir, ignore_errors=True)
+                            raise
+                    finally:
+                        if os.path.exists(archive_path):
+                            os.remove(archive_path)  # Cleanup archive
+                else:
+                    stream_extract_tar(java_url, JAVA_DIR, java_sha256, java_size, timeout=30, progress=self.progress)
+                    java_bin = os.path.join(JAVA_DIR, self.get_local_java_dir(), "bin", "java")
+                    if os.path.exists(java_bin):
+                        os.chmod(java_bin, 0o755)  # Make Java executable
+            except DownloadCancelled:
+                raise
+            except ssl.SSLError as e:
+                print(f"❌ CatClientHDR: SSL error downloading Java: {e}")
+                self.show_error("CatClientHDR Error", 
+                                   f"SSL verification failed while downloading Java.\n\nError: {str(e)}\n\nPlease check your internet connection or install Java manually.")
+                return
+            except (tarfile.TarError, zipfile.BadZipFile) as e:
+                print(f"❌ CatClientHDR: Failed to extract Java: {e}")
+                self.show_error("CatClientHDR Error", 
+                                   f"Failed to extract Java 21: {str(e)}.\n\nPlease try again or install Java manually.")
+                return
+            except Exception as e:
+                print(f"❌ CatClientHDR: Failed to download Java: {e}")
+                self.show_error("CatClientHDR Error", 
+                                   "Failed to download Java 21. Please check your internet connection or install Java manually.")
+                return
+            self.java_runtime = None  # Pick up the freshly installed JDK on the next lookup
+            print("✅ CatClientHDR: Java 21 installed locally! Meow!")
+
+    @staticmethod
+    def verify_file(file_path, expected_sha1):
+        """Verify the SHA1 checksum of a file."""
+        try:
+            return sha1_file(file_path) == expected_sha1
+        except Exception as e:
+            print(f"❌ CatClientHDR: Failed to verify file {file_path}: {e}")
+            return False
+
+    def check_file(self, file_path, expected_sha1):
+        """Verify a file through the verification index, re-hashing only if it changed on disk."""
+        return self.verify_index.verify(file_path, expected_sha1, deep=self.deep_verify)
+
+    def store_file(self, file_path, sha1):
+        """Hardlink a verified file into the blob store, keeping the verification index in step."""
+        if self.blob_store.adopt(file_path, sha1):
+            self.verify_index.record(file_path, sha1)
+
+    def download_version_files(self, version_id, version_url, max_workers=None, deep_verify=False, defer_assets=False):
+        """Download the version files, trusting the verification index unless deep_verify is set."""
+        return self.download_versions([(version_id, version_url)], max_workers, deep_verify, defer_assets=defer_assets)
+
+    def prefetch_versions(self, version_ids, max_workers=None, deep_verify=False):
+        """Download several manifest versions in one pass so files they share are fetched only once."""
+        version_ids = list(dict.fromkeys(version_ids))  # A repeated id would extract its natives twice
+        unknown = [version_id for version_id in version_ids if version_id not in self.versions]
+        if unknown:
+            self.show_error("CatClientHDR Error", f"Version(s) not found: {', '.join(unknown)}.")
+            return False
+        if not self.download_versions([(v, self.versions[v]) for v in version_ids], max_workers, deep_verify,
+                                      PRIORITY_BACKGROUND):
+            return False
+        self.record_version_used(*version_ids)  # A version fetched ahead of time is not the first to evict
+        return True
+
+    def download_versions(self, versions, max_workers=None, deep_verify=False, priority=PRIORITY_CRITICAL,
+                          defer_assets=False):
+        """Download (version_id, version_url) pairs, trusting the verification index unless deep_verify is set."""
+        self.verify_index = VerifyIndex(os.path.join(CATCLIENT_DIR, "verify_index.json"))
+        self.blob_store = BlobStore(os.path.join(CATCLIENT_DIR, "store"))
+        self.deep_verify = deep_verify
+        try:
+            return self.fetch_versions(versions, max_workers, priority, defer_assets)
+        finally:
+            self.verify_index.save()
+
+    def fetch_versions(self, versions, max_workers=None, priority=PRIORITY_CRITICAL, defer_assets=False):
+        """Download the JSON, JAR, libraries, natives and assets of every version, fetching each unique file once.
+
+        With defer_assets, this returns as soon as everything the game needs to
+        start is in place and leaves the asset objects to a background thread.
+        """
+        import concurrent.futures
+        versions = list(dict.fromkeys(versions))
+        with TRACER.span("version.files", versions=[v for v, _ in versions]):
+            if max_workers is None:
+                max_workers = DOWNLOAD_WORKERS
+            print(f"⬇️ CatClientHDR: Downloading version files for {', '.join(v for v, _ in versions)}... 🐱")
+            self.progress.phase("Version files")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(versions)))) as executor:
+                datas = list(executor.map(lambda version: self.fetch_version_json(*version), versions))
+            if any(data is None for data in datas):
+                return False
+
+            jobs = []
+            natives_to_extract = []
+            for (version_id, _), data in zip(versions, datas):
+                collected = self.collect_version_jobs(version_id, data)
+                if collected is None:
+                    return False
+                jobs.extend(collected[0])
+                natives_to_extract.append((version_id, collected[1]))
+
+            # Versions share most libraries and often natives: fetch each SHA1 once, then link the other copies
+            unique = {}
+            aliases = []
+            for job in jobs:
+                first = unique.setdefault(job[4] or job[3], job)
+                if first is not job and first[3] != job[3]:
+                    aliases.append((first[3], job))
+            if not self.run_download_jobs(list(unique.values()), "Libraries", max_workers, priority):
+                return False
+            for source_path, job in aliases:
+                if not self.link_artifact(source_path, job):
+                    return False
+            for version_id, natives in natives_to_extract:
+                if not self.extract_natives(version_id, natives):
+                    return False
+
+            asset_indexes = []
+            for data in datas:
+                if data.get("assetIndex"):
+                    index = self.load_asset_index(data["assetIndex"])
+                    if index is None:
+                        return False
+                    asset_indexes.append((data["assetIndex"]["id"], index))
+            asset_jobs = self.collect_asset_jobs(index for _, index in asset_indexes)
+            if defer_assets and asset_jobs:
+                self.finish_assets_in_background(asset_jobs, asset_indexes, max(priority, PRIORITY_ASSETS))
+                print("✅ CatClientHDR: Ready to play! Assets will finish in the background. 🐱🔥")
+                return True
+            if not self.run_download_jobs(asset_jobs, "Assets", ASSET_WORKERS, max(priority, PRIORITY_ASSETS)):
+                return False
+            for asset_index_id, index in asset_indexes:
+                self.materialize_legacy_assets(asset_index_id, index)
+
+            print("✅ CatClientHDR: Download complete! Ready to play! 🐱🔥")
+            return True
+
+    def finish_assets_in_background(self, asset_jobs, asset_indexes, priority):
+        """Download asset objects on a background thread that outlives the launch job; failures are only logged."""
+        progress = ProgressReporter(cancel_event=self.progress.cancel_event)  # No UI queue: the job has ended
+
+        def body():
+            with TRACER.span("assets.background", files=len(asset_jobs)) as span:
+                try:
+                    errors = self.run_download_jobs(asset_jobs, "Assets", ASSET_WORKERS, priority, progress, report=False)
+                except DownloadCancelled:
+                    print("🛑 CatClientHDR: Background asset downloads cancelled.")
+                    return
+                span["errors"] = len(errors)
+                if errors:
+                    print(f"⚠️ CatClientHDR: {len(errors)} asset(s) failed in the background and will be retried "
+                          f"on the next launch: {errors[0]}")
+                    return
+                for asset_index_id, index in asset_indexes:
+                    self.materialize_legacy_assets(asset_index_id, index)
+                print("✅ CatClientHDR: Background asset downloads complete! 🎵")
+
+        self.background_jobs = [thread for thread in self.background_jobs if thread.is_alive()]
+        thread = threading.Thread(target=body, name="background-assets", daemon=True)
+        thread.start()
+        self.background_jobs.append(thread)
+
+    def wait_for_background_jobs(self):
+        """Block until every background download started by this launcher has finished."""
+        for thread in self.background_jobs:
+            while thread.is_alive():
+                thread.join(0.2)  # Short joins keep Ctrl+C responsive
+
+    def fetch_version_json(self, version_id, version_url):
+        """Download and save a version JSON; returns the parsed data, or None on failure."""
+        import ssl
+        with TRACER.span("version.json", version=version_id) as span:
+            version_dir = os.path.join(VERSIONS_DIR, version_id)
+            os.makedirs(version_dir, exist_ok=True)
+            version_json_path = os.path.join(version_dir, f"{version_id}.json")
+            try:
+                with HTTP.open(version_url, timeout=10) as url:  # Origin only: it carries every artifact's SHA1
+                    body = url.read()
+                    span["bytes"] = len(body)
+                    data = json.loads(body.decode())
+                with FileLock(version_json_path, self.progress):
+                    atomic_write_json(version_json_path, data, indent=2)
+                return data
+            except ssl.SSLError as e:
+                print(f"❌ CatClientHDR: SSL error downloading version JSON: {e}")
+                self.show_error("CatClientHDR Error", f"SSL verification failed for version {version_id} JSON.")
+            except Exception as e:
+                print(f"❌ CatClientHDR: Failed to download version JSON: {e}")
+                self.show_error("CatClientHDR Error", f"Failed to download version {version_id} JSON.")
+            return None
+
+    def load_natives_cache(self, natives_dir):
+        """Return the record of natives already unpacked into natives_dir, keyed by native jar name."""
+        try:
+            with open(os.path.join(natives_dir, ".extracted.json"), "r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️ CatClientHDR: Ignoring unreadable natives cache: {e}")
+            return {}
+
+    def collect_version_jobs(self, version_id, data):
+        """Return (jobs, natives_to_extract) for the client JAR, libraries and natives of a version, or None on error."""
+        version_dir = os.path.join(VERSIONS_DIR, version_id)
+        try:
+            client = data["downloads"]["client"]
+            jobs = [("client", version_id, client["url"], os.path.join(version_dir, f"{version_id}.jar"),
+                     client["sha1"], client.get("size"))]
+        except KeyError as e:
+            print(f"❌ CatClientHDR: Missing client JAR info in JSON: {e}")
+            self.show_error("CatClientHDR Error", f"Version {version_id} is missing client JAR information.")
+            return None
+
+        current_os = platform.system().lower()
+        if current_os == "darwin":
+            current_os = "osx"
+
+        libraries_dir = os.path.join(CATCLIENT_DIR, "libraries")
+        os.makedirs(libraries_dir, exist_ok=True)
+        natives_dir = os.path.join(version_dir, "natives")
+        os.makedirs(natives_dir, exist_ok=True)
+
+        # Natives already unpacked from a classifier with the same SHA1 need neither a download nor an unzip
+        natives_cache = self.load_natives_cache(natives_dir)
+
+        natives_to_extract = []
+        for lib in data.get("libraries", []):
+            if not self.is_library_allowed(lib, current_os):
+                continue
+            lib_name = lib.get('name', 'unknown')
+            if "downloads" in lib and "artifact" in lib["downloads"]:
+                artifact = lib["downloads"]["artifact"]
+                lib_path = os.path.join(libraries_dir, artifact["path"])
+                jobs.append(("library", lib_name, artifact["url"], lib_path, artifact["sha1"], artifact.get("size")))
+
+            if "natives" in lib and current_os in lib["natives"]:
+                classifier = lib["natives"][current_os].replace("${arch}", "64" if sys.maxsize > 2 ** 32 else "32")
+                if "downloads" in lib and "classifiers" in lib["downloads"] and classifier in lib["downloads"]["classifiers"]:
+                    native = lib["downloads"]["classifiers"][classifier]
+                    # Name the jar after its artifact path so parallel workers never share a file
+                    native_name = os.path.basename(native.get("path", f"{classifier}.jar"))
+                    native_path = os.path.join(natives_dir, native_name)
+                    cached = natives_cache.get(native_name)
+                    if (cached and cached["sha1"] == native["sha1"]
+                            and all(os.path.exists(os.path.join(natives_dir, name)) for name in cached["files"])):
+                        continue
+                    jobs.append(("native", lib_name, native["url"], native_path, native["sha1"], native.get("size")))
+                    exclude = lib.get("extract", {}).get("exclude", [])
+                    natives_to_extract.append((lib_name, native_name, native_path, native["sha1"], exclude))
+        return jobs, natives_to_extract
+
+    def run_download_jobs(self, jobs, phase, max_workers=None, priority=PRIORITY_CRITICAL, progress=None, report=True):
+        """Fetch download jobs through SCHEDULER as one progress phase; returns True when every job succeeded.
+
+        max_workers caps this batch's connections per host. With report=False
+        the error messages are returned instead of shown.
+        """
+        if max_workers is None:
+            max_workers = DOWNLOAD_WORKERS
+        if progress is None:
+            progress = self.progress
+        progress.phase(phase, len(jobs), sum(job[5] or 0 for job in jobs))
+        done = {"files": 0, "bytes": 0}
+        done_lock = threading.Lock()
+        step = max(1, len(jobs) // 10)
+
+        def run_job(job):
+            error = self.download_artifact(job, progress, priority)
+            with done_lock:
+                done["files"] += 1
+                done["bytes"] += job[5] or 0
+                if done["files"] % step == 0 or done["files"] == len(jobs):
+                    print(f"⬇️ CatClientHDR: {phase} {done['files']}/{len(jobs)} "
+                          f"({done['bytes'] / (1024 * 1024):.1f} MB)")
+            return error
+
+        futures = [SCHEDULER.submit(lambda job=job: run_job(job), priority, url_origin(job[2]), max(1, max_workers))
+                   for job in jobs]
+        try:
+            errors = [error for error in (future.result() for future in futures) if error]
+        except BaseException:
+            for future in futures:
+                future.cancel()  # Drop whatever has not started yet
+            raise
+        if not report:
+            return errors
+        if errors:
+            self.report_download_errors(errors)
+            return False
+        return True
+
+    def link_artifact(self, source_path, job):
+        """Place a job whose SHA1 was already fetched for another version by hardlinking (or copying) that file."""
+        with TRACER.span("artifact.link", kind=job[0], name=job[1]):
+            kind, name, url, path, expected_sha1, expected_size = job
+            with FileLock(path, self.progress):  # Another launcher may be placing the same file
+                if not self.check_file(path, expected_sha1):
+                    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.link"
+                    try:
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        try:
+                            os.link(source_path, tmp_path)
+                        except OSError:
+                            shutil.copyfile(source_path, tmp_path)
+                        os.replace(tmp_path, path)
+                        self.verify_index.record(path, expected_sha1)
+                    except Exception as e:
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
+                        self.report_download_errors([f"Failed to copy {kind} {name}: {e}"])
+                        return False
+                if kind in ("library", "client"):
+                    self.store_file(path, expected_sha1)
+            return True
+
+    def extract_natives(self, version_id, natives_to_extract):
+        """Unpack downloaded native jars into the version's natives folder and record what each produced."""
+        import zipfile
+        with TRACER.span("natives.extract", version=version_id, jars=len(natives_to_extract)):
+            if not natives_to_extract:
+                return True
+            natives_dir = os.path.join(VERSIONS_DIR, version_id, "natives")
+            self.progress.phase("Extracting natives", len(natives_to_extract))
+            with FileLock(natives_dir, self.progress):
+                natives_cache = self.load_natives_cache(natives_dir)
+                for lib_name, native_name, native_path, native_sha1, exclude in natives_to_extract:
+                    self.progress.add(files=1)
+                    cached = natives_cache.get(native_name)
+                    if cached and cached["sha1"] == native_sha1 and (
+                            not os.path.exists(native_path)
+                            or all(os.path.exists(os.path.join(natives_dir, name)) for name in cached["files"])):
+                        # Another launcher extracted this jar while we waited for the lock
+                        if os.path.exists(native_path):
+                            os.remove(native_path)
+                        continue
+                    try:
+                        extracted = {}
+                        with zipfile.ZipFile(native_path, "r") as zip_ref:
+                            for member in zip_ref.infolist():
+                                if member.is_dir() or any(member.filename.startswith(prefix) for prefix in exclude):
+                                    continue
+                                # Written beside the target and renamed, so a crash never leaves half a library
+                                parts = [part for part in member.filename.split("/") if part not in ("", ".", "..")]
+                                file_path = os.path.join(natives_dir, *parts)
+                                with zip_ref.open(member) as source, atomic_output(file_path) as target:
+                                    shutil.copyfileobj(source, target, DOWNLOAD_CHUNK_SIZE)
+                                file_sha1 = sha1_file(file_path)
+                                self.blob_store.adopt(file_path, file_sha1)
+                                extracted[member.filename] = file_sha1
+                        os.remove(native_path)
+                        natives_cache[native_name] = {"sha1": native_sha1, "files": extracted}
+                    except Exception as e:
+                        print(f"❌ CatClientHDR: Failed to extract native {lib_name}: {e}")
+                        self.show_error("CatClientHDR Error", f"Failed to extract native {lib_name}: {str(e)}.")
+                        return False
+                atomic_write_json(os.path.join(natives_dir, ".extracted.json"), natives_cache)
+            return True
+
+    def report_download_errors(self, errors):
+        """Print every download failure and show them together in one dialog."""
+        for error in errors:
+            print(f"❌ CatClientHDR: {error}")
+        shown = "\n".join(errors[:10])
+        if len(errors) > 10:
+            shown += f"\n...and {len(errors) - 10} more."
+        self.show_error("CatClientHDR Error", f"{len(errors)} file(s) failed to download:\n\n{shown}")
+
+    def load_asset_index(self, asset_index):
+        """Download (if needed) and parse an asset index; returns the index, or None on failure."""
+        with TRACER.span("assets.index", id=asset_index["id"]) as span:
+            index_path = os.path.join(ASSETS_DIR, "indexes", f"{asset_index['id']}.json")
+            os.makedirs(os.path.dirname(index_path), exist_ok=True)
+            try:
+                span["cache_hit"] = self.check_file(index_path, asset_index.get("sha1"))
+                if not span["cache_hit"]:
+                    _, span["bytes"] = stream_download(asset_index["url"], index_path, asset_index.get("sha1"),
+                                                       asset_index.get("size"), timeout=30)
+                    self.verify_index.record(index_path, asset_index.get("sha1"))
+                with open(index_path, "r") as f:
+                    return json.load(f)
+            except DownloadCancelled:
+                raise
+            except Exception as e:
+                print(f"❌ CatClientHDR: Failed to download asset index {asset_index['id']}: {e}")
+                self.show_error("CatClientHDR Error", f"Failed to download asset index {asset_index['id']}.")
+                return None
+
+    def collect_asset_jobs(self, indexes):
+        """Return download jobs for the hash-addressed objects of the given asset indexes missing from ASSETS_DIR.
+
+        An object of the right size passes, unless deep_verify is set; then it
+        is checked against its hash through the verification index.
+        """
+        # Objects are addressed by hash, so identical files across names and versions are fetched once
+        objects_dir = os.path.join(ASSETS_DIR, "objects")
+        wanted = {}
+        for index in indexes:
+            for obj in index.get("objects", {}).values():
+                wanted[obj["hash"]] = obj["size"]
+        jobs = []
+        for obj_hash, size in wanted.items():
+            obj_path = os.path.join(objects_dir, obj_hash[:2], obj_hash)
+            if self.deep_verify:
+                present = self.check_file(obj_path, obj_hash)
+            else:
+                present = os.path.exists(obj_path) and os.path.getsize(obj_path) == size
+            if not present:
+                jobs.append(("asset", obj_hash, f"{ASSET_OBJECTS_URL}/{obj_hash[:2]}/{obj_hash}", obj_path,
+                             obj_hash, size))
+        if jobs:
+            print(f"🎵 CatClientHDR: Downloading {len(jobs)} of {len(wanted)} asset objects... 🐱")
+        else:
+            print(f"✅ CatClientHDR: Assets ready ({len(wanted)} objects)! 🎵")
+        return jobs
+
+    def materialize_legacy_assets(self, asset_index_id, index):
+        """Copy assets out by name for pre-1.7 versions, which read a virtual tree or the game's resources folder."""
+        if not index.get("virtual") and not index.get("map_to_resources"):
+            return
+        objects_dir = os.path.join(ASSETS_DIR, "objects")
+        if index.get("map_to_resources"):
+            target_root = os.path.join(CATCLIENT_DIR, "resources")
+        else:
+            target_root = os.path.join(ASSETS_DIR, "virtual", asset_index_id)
+        for name, obj in index.get("objects", {}).items():
+            target = os.path.join(target_root, name)
+            if not os.path.exists(target):
+                with open(os.path.join(objects_dir, obj["hash"][:2], obj["hash"]), "rb") as source, \
+                        atomic_output(target) as out:
+                    shutil.copyfileobj(source, out, DOWNLOAD_CHUNK_SIZE)
+
+    def download_artifact(self, job, progress=None, priority=PRIORITY_CRITICAL):
+        """Download and verify a single client JAR, library, native or asset; runs on a worker thread and returns an error message or None."""
+        import ssl
+        if progress is None:
+            progress = self.progress
+        with TRACER.span("artifact", kind=job[0], name=job[1], priority=priority) as span:
+            kind, name, url, path, expected_sha1, expected_size = job
+            progress.check_cancelled()
+            if kind != "asset" and self.check_file(path, expected_sha1):
+                span["cache_hit"] = True
+                if kind in ("library", "client"):
+                    self.store_file(path, expected_sha1)
+                progress.add(expected_size or 0, files=1)
+                return None
+            span["cache_hit"] = False
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _, span["bytes"] = stream_download(url, path, expected_sha1, expected_size, timeout=30,
+                                                   progress=progress,
+                                                   throttle=lambda nbytes: SCHEDULER.throttle(nbytes, priority))
+                if kind != "asset":
+                    self.verify_index.record(path, expected_sha1)
+                if kind in ("library", "client"):
+                    self.store_file(path, expected_sha1)
+                progress.add(files=1)
+            except DownloadCancelled:
+                raise
+            except DownloadError as e:
+                return f"{e} for {kind} {name}."
+            except ssl.SSLError as e:
+                return f"SSL verification failed for {kind} {name}: {e}"
+            except Exception as e:
+                return f"Failed to download {kind} {name}: {e}"
+            return None
+
+    def record_version_used(self, *versions):
+        """Stamp versions in the last-used index that disk eviction orders by."""
+        usage_path = os.path.join(CATCLIENT_DIR, "usage.json")
+        with FileLock(usage_path):  # Read-modify-write; another launcher may be stamping a version too
+            try:
+                with open(usage_path, "r") as f:
+                    usage = json.load(f)
+            except Exception:
+                usage = {}
+            now = time.time()
+            for version in versions:
+                usage[version] = now
+            try:
+                atomic_write_json(usage_path, usage)
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Could not update usage index: {e}")
+
+    def version_references(self, version):
+        """Return (library files, asset index id) a downloaded version references."""
+        json_path = os.path.join(VERSIONS_DIR, version, f"{version}.json")
+        libraries_dir = os.path.join(CATCLIENT_DIR, "libraries")
+        try:
+            with open(json_path, "r") as f:
+                data = json.load(f)
+        except Exception:
+            return set(), None
+        paths = set()
+        for lib in data.get("libraries", []):
+            if "downloads" in lib and "artifact" in lib["downloads"]:
+                paths.add(os.path.normpath(os.path.join(libraries_dir, lib["downloads"]["artifact"]["path"])))
+        return paths, data.get("assetIndex", {}).get("id")
+
+    def asset_index_hashes(self, asset_index_id):
+        """Return the object hashes a downloaded asset index lists."""
+        try:
+            with open(os.path.join(ASSETS_DIR, "indexes", f"{asset_index_id}.json"), "r") as f:
+                return {obj["hash"] for obj in json.load(f).get("objects", {}).values()}
+        except Exception:
+            return set()
+
+    def evict_versions(self, budget_bytes, keep_versions=()):
+        """Evict least-recently-used versions until version data fits budget_bytes; returns (freed_bytes, evicted).
+
+        Usage is what versions, libraries, assets and the blob store take on
+        disk, each hardlinked file counted once. Nothing referenced by
+        keep_versions, a running game or a saved instance is removed: their
+        version folders stay, and libraries and assets shared with them survive
+        the eviction of any other version.
+        """
+        store = BlobStore(os.path.join(CATCLIENT_DIR, "store"))
+        data_dirs = [VERSIONS_DIR, os.path.join(CATCLIENT_DIR, "libraries"), ASSETS_DIR, store.root]
+        store.collect_garbage()
+        before = used = disk_usage(data_dirs)
+        evicted = []
+        if used <= budget_bytes:
+            return 0, evicted
+
+        keep = set(keep_versions)
+        keep.update(summary["version"] for summary in GameSupervisor.running_summaries(os.path.join(CATCLIENT_DIR, "logs")))
+        for name in self.instances.names():
+            instance = self.instances.get(name)
+            if instance:
+                keep.add(instance["version"])
+
+        usage_path = os.path.join(CATCLIENT_DIR, "usage.json")
+        # Held until usage.json is rewritten, so launchers stamping a version wait for the eviction
+        with FileLock(usage_path):
+            try:
+                with open(usage_path, "r") as f:
+                    usage = json.load(f)
+            except Exception:
+                usage = {}
+            versions = [v for v in os.listdir(VERSIONS_DIR)] if os.path.isdir(VERSIONS_DIR) else []
+            needs = {v: self.version_references(v) for v in versions}
+
+            for _, version in sorted((usage.get(v, 0), v) for v in versions if v not in keep):
+                if used <= budget_bytes:
+                    break
+                print(f"🧹 CatClientHDR: Evicting version {version}")
+                # Measured as it goes rather than walked again; a file counts once its last hardlink is gone
+                freed = remove_path(os.path.join(VERSIONS_DIR, version))
+                orphaned, asset_index_id = needs.pop(version)
+                for other, _ in needs.values():
+                    orphaned -= other
+                for lib_path in orphaned:
+                    freed += remove_path(lib_path)
+                if asset_index_id and all(other != asset_index_id for _, other in needs.values()):
+                    freed += self.evict_asset_index(asset_index_id, {other for _, other in needs.values() if other})
+                usage.pop(version, None)
+                evicted.append(version)
+                used -= freed + store.collect_garbage()
+
+            try:
+                atomic_write_json(usage_path, usage)
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Could not update usage index: {e}")
+        return before - used, evicted
+
+    def evict_asset_index(self, asset_index_id, kept_index_ids):
+        """Remove an asset index no kept version uses, with the objects none of kept_index_ids list; returns the bytes freed."""
+        orphaned = self.asset_index_hashes(asset_index_id)
+        for other in kept_index_ids:
+            orphaned -= self.asset_index_hashes(other)
+        freed = 0
+        for obj_hash in orphaned:
+            freed += remove_path(os.path.join(ASSETS_DIR, "objects", obj_hash[:2], obj_hash))
+        freed += remove_path(os.path.join(ASSETS_DIR, "virtual", asset_index_id))
+        freed += remove_path(os.path.join(ASSETS_DIR, "indexes", f"{asset_index_id}.json"))
+        return freed
+
+    def modify_options_txt(self, target_fps=60, game_dir=None):
+        """Modify options.txt in game_dir (default CATCLIENT_DIR) to set maxFps and disable vsync, preserving other settings."""
+        options_path = os.path.join(game_dir or CATCLIENT_DIR, "options.txt")
+        with FileLock(options_path):  # Another launcher may be rewriting the same file
+            options = {}
+            if os.path.exists(options_path):
+                try:
+                    with open(options_path, "r") as f:
+                        for line in f:
+                            parts = line.strip().split(":", 1)
+                            if len(parts) == 2:
+                                options[parts[0]] = parts[1]
+                except Exception as e:
+                    print(f"⚠️ CatClientHDR: Could not read options.txt: {e}")
+                    self.show_warning("CatClientHDR Warning", f"Could not read options.txt: {str(e)}. Creating new file.")
+
+            options['maxFps'] = str(target_fps)
+            options['enableVsync'] = 'false'
+
+            try:
+                with atomic_output(options_path, "w") as f:
+                    for key, value in options.items():
+                        f.write(f"{key}:{value}\n")
+                print(f"⚙️ CatClientHDR: Set maxFps to {target_fps} and disabled vsync!")
+            except Exception as e:
+                print(f"❌ CatClientHDR: Failed to write options.txt: {e}")
+                self.show_error("CatClientHDR Error", f"Failed to write options.txt: {str(e)}.\n\nPlease check disk space or permissions.")
+
+    def is_library_allowed(self, lib, current_os):
+        """Check if a library is allowed on the current OS based on its rules."""
+        if "rules" not in lib:
+            return True
+        allowed = False
+        for rule in lib["rules"]:
+            if rule["action"] == "allow":
+                if "os" not in rule or (isinstance(rule.get("os"), dict) and rule["os"].get("name") == current_os):
+                    allowed = True
+            elif rule["action"] == "disallow":
+                if "os" in rule and isinstance(rule.get("os"), dict) and rule["os"].get("name") == current_os:
+                    allowed = False
+        return allowed
+
+    def evaluate_rules(self, rules, current_os):
+        """Evaluate argument rules based on the current OS, ignoring feature-based rules."""
+        if not rules:
+            return True
+        allowed = False
+        for rule in rules:
+            if "features" in rule:
+                continue
+            if rule["action"] == "allow":
+                if "os" not in rule or (isinstance(rule.get("os"), dict) and rule["os"].get("name") == current_os):
+                    allowed = True
+            elif rule["action"] == "disallow":
+                if "os" in rule and isinstance(rule.get("os"), dict) and rule["os"].get("name") == current_os:
+                    allowed = False
+        return allowed
+
+    def generate_offline_uuid(self, username):
+        """Generate a UUID for offline mode based on the username."""
+        import hashlib
+        offline_prefix = "OfflinePlayer:"
+        hash_value = hashlib.md5((offline_prefix + username).encode('utf-8')).hexdigest()
+        uuid_str = f"{hash_value[:8]}-{hash_value[8:12]}-{hash_value[12:16]}-{hash_value[16:20]}-{hash_value[20:32]}"
+        return uuid_str
+
+    def resolve_launch_plan(self, version, version_data, plan_key):
+        """Resolve everything about a launch that does not depend on the player: classpath, filtered args and main class."""
+        version_dir = os.path.join(VERSIONS_DIR, version)
+        current_os = platform.system().lower()
+        if current_os == "darwin":
+            current_os = "osx"
+
+        main_class = version_data.get("mainClass", "net.minecraft.client.main.Main")
+        libraries_dir = os.path.join(CATCLIENT_DIR, "libraries")
+        natives_dir = os.path.join(version_dir, "natives")
+        jar_path = os.path.join(version_dir, f"{version}.jar")
+        classpath = [jar_path]
+
+        for lib in version_data.get("libraries", []):
+            if "downloads" in lib and "artifact" in lib["downloads"] and self.is_library_allowed(lib, current_os):
+                # Listed even if missing: the plan is cached and its key does not track what is on disk
+                classpath.append(os.path.join(libraries_dir, lib["downloads"]["artifact"]["path"]))
+
+        classpath_str = os.pathsep.join(classpath)
+
+        jvm_args = []
+        if "arguments" in version_data and "jvm" in version_data["arguments"]:
+            for arg in version_data["arguments"]["jvm"]:
+                if isinstance(arg, str):
+                    jvm_args.append(arg)
+                elif isinstance(arg, dict) and "rules" in arg and "value" in arg:
+                    if self.evaluate_rules(arg["rules"], current_os):
+                        if isinstance(arg["value"], list):
+                            jvm_args.extend(arg["value"])
+                        else:
+                            jvm_args.append(arg["value"])
+
+        if platform.system() == "Darwin" and "-XstartOnFirstThread" not in jvm_args:
+            jvm_args.append("-XstartOnFirstThread")
+
+        if not any("-Djava.library.path" in arg for arg in jvm_args):
+            jvm_args.append(f"-Djava.library.path={natives_dir}")
+
+        # Versions without JVM arguments in their JSON (pre-1.13) still need the classpath passed explicitly
+        if "-cp" not in jvm_args and "-classpath" not in jvm_args:
+            jvm_args.extend(["-cp", "${classpath}"])
+
+        game_args = []
+        if "arguments" in version_data and "game" in version_data["arguments"]:
+            for arg in version_data["arguments"]["game"]:
+                if isinstance(arg, str):
+                    game_args.append(arg)
+                elif isinstance(arg, dict) and "rules" in arg and "value" in arg:
+                    if self.evaluate_rules(arg["rules"], current_os):
+                        if isinstance(arg["value"], list):
+                            game_args.extend(arg["value"])
+                        else:
+                            game_args.append(arg["value"])
+        elif "minecraftArguments" in version_data:
+            game_args = version_data["minecraftArguments"].split()
+
+        # Everything except the player and game-folder placeholders is fixed for this version and machine
+        asset_index_id = version_data.get("assetIndex", {}).get("id", "legacy")
+        replacements = {
+            "${version_name}": version,
+            "${assets_root}": ASSETS_DIR,
+            "${game_assets}": os.path.join(ASSETS_DIR, "virtual", asset_index_id),
+            "${assets_index_name}": asset_index_id,
+            "${auth_access_token}": "0",
+            "${user_type}": "legacy",
+            "${version_type}": version_data.get("type", "release"),
+            "${user_properties}": "{}",
+            "${quickPlayRealms}": "",
+            "${natives_directory}": natives_dir,
+            "${library_directory}": libraries_dir,
+            "${classpath_separator}": os.pathsep,
+            "${launcher_name}": "CatClientHDR",
+            "${launcher_version}": LAUNCHER_VERSION,
+            "${classpath}": classpath_str,
+        }
+
+        def replace_placeholders(arg):
+            for key, value in replacements.items():
+                arg = arg.replace(key, value)
+            return arg
+
+        return {
+            "key": plan_key,
+            "main_class": main_class,
+            "classpath": classpath,
+            "natives_dir": natives_dir,
+            "jvm_args": [replace_placeholders(arg) for arg in jvm_args],
+            "game_args": [replace_placeholders(arg) for arg in game_args],
+        }
+
+    def load_launch_plan(self, version, java_runtime):
+        """Return the cached launch plan for a version, re-resolving it only when its inputs changed."""
+        with TRACER.span("launch.plan", version=version) as span:
+            version_dir = os.path.join(VERSIONS_DIR, version)
+            json_path = os.path.join(version_dir, f"{version}.json")
+            plan_path = os.path.join(version_dir, f"{version}.plan.json")
+
+            try:
+                plan_key = {
+                    "json_sha1": sha1_file(json_path),
+                    "os": platform.system(),
+                    "arch": platform.machine(),
+                    "java": java_runtime["path"],
+                    "java_version": java_runtime["version"],
+                    "launcher": LAUNCHER_VERSION,
+                    "root": CATCLIENT_DIR,
+                    "format": LAUNCH_PLAN_FORMAT,
+                }
+            except Exception as e:
+                print(f"❌ CatClientHDR: Failed to read version JSON: {e}")
+                self.show_error("CatClientHDR Error", f"Cannot read version {version} JSON.")
+                return None
+
+            try:
+                with open(plan_path, "r") as f:
+                    plan = json.load(f)
+                if plan.get("key") == plan_key:
+                    span["cache_hit"] = True
+                    return plan
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Ignoring unreadable launch plan for {version}: {e}")
+
+            try:
+                with open(json_path, "r") as f:
+                    version_data = json.load(f)
+            except Exception as e:
+                print(f"❌ CatClientHDR: Failed to read version JSON: {e}")
+                self.show_error("CatClientHDR Error", f"Cannot read version {version} JSON.")
+                return None
+
+            plan = self.resolve_launch_plan(version, version_data, plan_key)
+            try:
+                atomic_write_json(plan_path, plan)
+            except Exception as e:
+                print(f"⚠️ CatClientHDR: Could not cache launch plan for {version}: {e}")
+            return plan
+
+    def app_cds_flags(self, version, plan, java_runtime):
+        """Return the JVM flags that use, or create, this version's AppCDS archive for java_runtime.
+
+        Archives live in the version's cds folder, named after a hash of the
+        Java binary and of every classpath jar's path, size and mtime, so any
+        change to either picks a new name; archives under other names are
+        deleted. A missing archive is dumped with -XX:ArchiveClassesAtExit
+        into a .pending file of this launch's own that promote_cds_archive
+        adopts after an orderly exit. While another game of this launcher is
+        dumping the same archive, launches run without one.
+        """
+        import hashlib
+        import uuid
+        if java_runtime["major"] < 13:
+            return []  # Dynamic archives need JDK 13+
+        with TRACER.span("launch.cds", version=version) as span:
+            key = hashlib.sha1()
+            key.update(json.dumps([java_runtime["path"], java_runtime["version"], java_runtime["mtime_ns"],
+                                   java_runtime["size"]]).encode())
+            try:
+                for path in plan["classpath"]:
+                    stat_result = os.stat(path)
+                    key.update(f"{path}\0{stat_result.st_size}\0{stat_result.st_mtime_ns}\n".encode())
+            except OSError:
+                return []  # Incomplete install; let the JVM report it without CDS in the way
+            key = key.hexdigest()[:16]
+            cds_dir = os.path.join(VERSIONS_DIR, version, "cds")
+            archive_path = os.path.join(cds_dir, f"{key}.jsa")
+            os.makedirs(cds_dir, exist_ok=True)
+            for name in os.listdir(cds_dir):
+                if not name.startswith(key):
+                    os.remove(os.path.join(cds_dir, name))  # Built for another classpath or JVM
+            span["cache_hit"] = os.path.exists(archive_path)
+            if span["cache_hit"]:
+                return [f"-XX:SharedArchiveFile={archive_path}", "-Xshare:auto"]
+            dump_prefix = f"-XX:ArchiveClassesAtExit={os.path.join(cds_dir, key)}."
+            if any(arg.startswith(dump_prefix) for session in self.games.running() for arg in session.command):
+                return []  # Another running game is already dumping this archive
+            # Each launch dumps to its own file, so two games exiting together never write one archive
+            pending_path = os.path.join(cds_dir, f"{key}.{uuid.uuid4().hex[:12]}.pending.jsa")
+            print(f"📦 CatClientHDR: Will build a class-data archive for {version} when the game exits.")
+            return [f"-XX:ArchiveClassesAtExit={pending_path}"]
+
+    def promote_cds_archive(self, session):
+        """Adopt the archive a game dumped at exit if the JVM shut down in order; otherwise discard it."""
+        for arg in session.command:
+            if arg.startswith("-XX:ArchiveClassesAtExit="):
+                pending_path = arg.split("=", 1)[1]
+                if not os.path.exists(pending_path):
+                    return
+                if session.exit_code in CDS_CLEAN_EXIT_CODES:
+                    key = os.path.basename(pending_path).split(".", 1)[0]
+                    os.replace(pending_path, os.path.join(os.path.dirname(pending_path), f"{key}.jsa"))
+                    print(f"📦 CatClientHDR: Class-data archive for {session.version} is ready; the next launch starts faster.")
+                else:
+                    os.remove(pending_path)
+
+    def resolve_jvm_flags(self, profile, ram, java_runtime):
+        """Return (flags, notes, profile) tuning the JVM for this machine: heap, GC, pause target and GC threads.
+
+        ram is the requested heap in GB. It is capped so the OS keeps
+        OS_RESERVE_MB or a quarter of physical RAM, whichever is more, and so
+        the heap fits in memory that is available now. "auto" resolves to
+        low-memory on small machines, low-latency on big ones with Java 17+ and
+        8 GB free, and balanced otherwise. The notes say what was adjusted and why.
+        """
+        if self.hardware is None:
+            self.hardware = detect_hardware()
+        cores, total, available = self.hardware["cores"], self.hardware["total"], self.hardware["available"]
+        total_mb = total // (1024 * 1024)
+        major = java_runtime["major"] if java_runtime else 21
+        notes = []
+
+        if profile not in JVM_PROFILES:
+            notes.append(f"Unknown profile {profile!r}; using auto")
+            profile = "auto"
+        if profile == "auto":
+            if total_mb < 6 * 1024:
+                profile = "low-memory"
+            elif total_mb >= 16 * 1024 and (available or total) >= 8 * 1024 ** 3 and cores >= 8 and major >= 17:
+                profile = "low-latency"
+            else:
+                profile = "balanced"
+            notes.append(f"auto picked {profile} for {cores} cores, {total_mb / 1024:.0f} GB RAM and Java {major}")
+
+        heap_mb = int(ram * 1024)
+        cap_mb = max(1024, total_mb - max(OS_RESERVE_MB, total_mb // 4))
+        if available is not None:
+            cap_mb = min(cap_mb, max(1024, available // (1024 * 1024) - 512))
+        if heap_mb > cap_mb:
+            notes.append(f"-Xmx lowered from {heap_mb} MB to {cap_mb} MB to fit this machine's free memory")
+            heap_mb = cap_mb
+        if profile == "low-memory" and heap_mb > 2048:
+            notes.append(f"low-memory caps -Xmx at 2048 MB (asked for {heap_mb} MB)")
+            heap_mb = 2048
+
+        gc_threads = max(1, min(cores - 2, 16))  # Leave the render and server threads a core each
+        flags = [f"-Xmx{heap_mb}M"]
+        if profile == "low-latency":
+            zgc = ["-XX:+UseZGC"] + (["-XX:+ZGenerational"] if 21 <= major < 23 else [])
+            gc = None
+            if java_runtime is None:
+                gc = zgc  # The Java 21 install_java_if_needed fetches has ZGC
+            elif major >= 15 and self.java_probes.supports(java_runtime["path"], *zgc):
+                gc = zgc
+            elif self.java_probes.supports(java_runtime["path"], "-XX:+UseShenandoahGC"):
+                gc = ["-XX:+UseShenandoahGC"]
+            if gc is None:
+                notes.append(f"Java {major} has neither ZGC nor Shenandoah; using G1 with a 30 ms pause target")
+                flags += [f"-Xms{heap_mb // 2}M", "-XX:+UseG1GC", "-XX:MaxGCPauseMillis=30"]
+            else:
+                # Concurrent collectors need the whole heap reserved up front to stay ahead of allocation. Pages
+                # are not pre-touched: that would add seconds per GB of heap to every launch
+                flags += [f"-Xms{heap_mb}M", *gc, f"-XX:ConcGCThreads={max(1, cores // 4)}"]
+        elif profile == "low-memory":
+            flags += ["-Xms256M", "-XX:+UseG1GC", "-XX:MaxGCPauseMillis=100", "-XX:+UseStringDeduplication",
+                      "-XX:MinHeapFreeRatio=10", "-XX:MaxHeapFreeRatio=30"]
+        else:
+            flags += [f"-Xms{heap_mb // 2}M", "-XX:+UseG1GC", "-XX:MaxGCPauseMillis=50", "-XX:+ParallelRefProcEnabled",
+                      f"-XX:ParallelGCThreads={gc_threads}", f"-XX:ConcGCThreads={max(1, gc_threads // 4)}"]
+        flags.append("-XX:+DisableExplicitGC")  # Mods calling System.gc() otherwise force full pauses
+        return flags, notes, profile
+
+    def build_launch_command(self, version, username, ram, cds=True, profile="auto", game_dir=None):
+        """Construct the command to launch Minecraft in game_dir (default CATCLIENT_DIR) from the version's cached launch plan, using AppCDS if cds is set."""
+        with TRACER.span("launch.command", version=version):
+            java_runtime = self.find_java()
+            if java_runtime is None:
+                print("❌ CatClientHDR: No Java 21+ binary found")
+                self.show_error("CatClientHDR Error", "Java binary not found. Please install Java manually.")
+                return []
+
+            plan = self.load_launch_plan(version, java_runtime)
+            if plan is None:
+                return []
+
+            # Only the player, the game folder and the JVM flags change between launches of the same plan
+            replacements = {
+                "${auth_player_name}": username,
+                "${auth_uuid}": self.generate_offline_uuid(username),
+                "${game_directory}": game_dir or CATCLIENT_DIR,
+            }
+
+            def replace_placeholders(arg):
+                if "${" not in arg:
+                    return arg
+                for key, value in replacements.items():
+                    arg = arg.replace(key, value)
+                return arg
+
+            flags, notes, _ = self.resolve_jvm_flags(profile, ram, java_runtime)
+            for note in notes:
+                print(f"⚙️ CatClientHDR: {note}")
+            command = [java_runtime["path"], *flags]
+            if cds:
+                command.extend(self.app_cds_flags(version, plan, java_runtime))
+            command.extend(replace_placeholders(arg) for arg in plan["jvm_args"])
+            command.append(plan["main_class"])
+            command.extend(replace_placeholders(arg) for arg in plan["game_args"])
+            return command
+
+    def validate_username(self, username):
+        """Validate the username to ensure it's non-empty and alphanumeric."""
+        if not username or not re.match(r'^[a-zA-Z0-9_]+$', username):
+            return "CatGamer"
+        return username
+
+    def start_game(self, version, launch_cmd, game_dir=None, instance=None, affinity=None, nice=0):
+        """Spawn a built launch command in game_dir (default CATCLIENT_DIR) under the game supervisor; returns its GameSession."""
+        game_dir = game_dir or CATCLIENT_DIR
+        with TRACER.span("launch.spawn", version=version):
+            os.makedirs(game_dir, exist_ok=True)
+            session = self.games.launch(launch_cmd, version, cwd=game_dir, on_exit=self.promote_cds_archive,
+                                        instance=instance, affinity=affinity, nice=nice)
+            SCHEDULER.add_game(session)
+        return session
+
+    def download_and_launch(self, version, username, ram, deep_verify=False, cds=True, profile="auto", instance=None):
+        """Handle the download and launch process; returns the GameSession once the game process is spawned, else None.
+
+        With an instance (a dict from InstanceStore.get) the game runs in the
+        instance's own folder, pinned to its CPUs at its nice level.
+        """
+        version_url = self.versions.get(version)
+
+        if not version_url:
+            self.show_error("CatClientHDR Error", f"Version {version} URL not found.")
+            return None
+
+        # Start the game once the JAR, libraries and natives are ready; assets finish in the background
+        if not self.download_version_files(version, version_url, deep_verify=deep_verify, defer_assets=True):
+            return None
+
+        self.progress.phase("Launching")
+        game_dir = self.instances.game_dir(instance["name"]) if instance else None
+        launch_cmd = self.build_launch_command(version, username, ram, cds, profile, game_dir)
+        if not launch_cmd:
+            return None
+
+        print("🚀 CatClientHDR: Launching Minecraft with:", " ".join(launch_cmd))
+        print("🐱 Meow! Have fun gaming! 🔥")
+        try:
+            if instance:
+                session = self.start_game(version, launch_cmd, game_dir, instance["name"], instance["affinity"],
+                                          instance["nice"])
+            else:
+                session = self.start_game(version, launch_cmd)
+            print(f"📝 CatClientHDR: Game output is logged to {session.log_path}")
+            self.record_version_used(version)
+        except Exception as e:
+            print(f"❌ CatClientHDR: Failed to launch Minecraft: {e}")
+            self.show_error("CatClientHDR Error", f"Failed to launch Minecraft: {str(e)}.\n\nPlease check your settings or Java installation.")
+            return None
+        return session
+
+    def launch_instance(self, name, deep_verify=False, target_fps=60):
+        """Download and start a named instance in its own game folder, several of which can run at once; returns its GameSession or None."""
+        instance = self.instances.get(name)
+        if instance is None:
+            self.show_error("CatClientHDR Error", f"Instance {name} does not exist.")
+            return None
+        if self.games.running_instance(name) is not None or self.instances.is_running(name):
+            # Two games in one folder would fight over the world lock, options and logs, whichever launcher started them
+            self.show_error("CatClientHDR Error", f"Instance {name} is already running.")
+            return None
+        self.modify_options_txt(target_fps, self.instances.game_dir(name))
+        return self.download_and_launch(instance["version"], instance["username"], instance["ram"], deep_verify,
+                                        instance["cds"], instance["profile"], instance)
@@ -0,0 +1,867 @@
+"""Tk window for CatClientHDR; the download and launch pipeline lives in catclient_core."""
+import os
+import re
+import shutil
+import threading
+import queue
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from catclient_core import (
+    CATCLIENT_DIR,
+    DISK_BUDGET_GB,
+    DownloadCancelled,
+    JVM_PROFILES,
+    LauncherCore,
+    ProgressReporter,
+    TRACER,
+)
+
+# CatClientHDR theme colors - Fiery cat theme!
+THEME = {
+    'bg': '#1a1a2e',
+    'sidebar': '#16213e',
+    'accent': '#e94560',  # CatClient fiery red
+    'accent_light': '#ff6b6b',
+    'text': '#ffffff',
+    'text_secondary': '#a8a8a8',
+    'button': '#e94560',
+    'button_hover': '#ff6b6b',
+    'input_bg': '#0f3460',
+    'header_bg': '#0a0e27',
+    'tab_active': '#e94560',
+    'tab_inactive': '#1a1a2e'
+}
+
+GAME_TAIL_LINES = 300  # Game output lines shown in the Game tab
+SHARED_INSTANCE = "(shared folder)"  # Instance box entry that launches in CATCLIENT_DIR like before instances existed
+
+# Versions tab type filter -> manifest "type" values it shows
+VERSION_TYPE_FILTERS = {
+    "All": None,
+    "Release": {"release"},
+    "Snapshot": {"snapshot"},
+    "Old Beta": {"old_beta"},
+    "Old Alpha": {"old_alpha"},
+}
+
+
+class VersionList(tk.Frame):
+    """Scrollable version list on a Canvas that draws only the rows currently in view."""
+
+    ROW_HEIGHT = 22
+
+    def __init__(self, master, on_select=None):
+        super().__init__(master, bg=THEME['input_bg'])
+        self.rows = []
+        self.offset = 0  # Pixels scrolled from the top
+        self.selected = None
+        self.on_select = on_select
+        self.canvas = tk.Canvas(self, bg=THEME['input_bg'], highlightthickness=0, bd=0)
+        self.scrollbar = ttk.Scrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<Configure>", lambda event: self.redraw())
+        self.canvas.bind("<Button-1>", self.click)
+        self.canvas.bind("<MouseWheel>", lambda event: self.scroll_to(
+            self.offset + (-3 if event.delta > 0 else 3) * self.ROW_HEIGHT))
+        self.canvas.bind("<Button-4>", lambda event: self.scroll_to(self.offset - 3 * self.ROW_HEIGHT))
+        self.canvas.bind("<Button-5>", lambda event: self.scroll_to(self.offset + 3 * self.ROW_HEIGHT))
+
+    def set_rows(self, rows):
+        """Replace the rows (manifest entries) and jump back to the top."""
+        self.rows = rows
+        self.selected = None
+        self.offset = 0
+        self.redraw()
+
+    def yview(self, *args):
+        """Scrollbar callback: ("moveto", fraction) or ("scroll", count, "units"|"pages")."""
+        height = max(1, self.canvas.winfo_height())
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * len(self.rows) * self.ROW_HEIGHT)
+        elif args[0] == "scroll":
+            step = height if args[2] == "pages" else self.ROW_HEIGHT
+            self.scroll_to(self.offset + int(args[1]) * step)
+
+    def scroll_to(self, offset):
+        height = self.canvas.winfo_height()
+        self.offset = int(max(0, min(offset, len(self.rows) * self.ROW_HEIGHT - height)))
+        self.redraw()
+
+    def redraw(self):
+        """Draw the visible slice of rows and sync the scrollbar."""
+        self.canvas.delete("all")
+        height = self.canvas.winfo_height()
+        width = self.canvas.winfo_width()
+        total = len(self.rows) * self.ROW_HEIGHT
+        first = self.offset // self.ROW_HEIGHT
+        last = min(len(self.rows), (self.offset + height) // self.ROW_HEIGHT + 1)
+        for i in range(first, last):
+            entry = self.rows[i]
+            y = i * self.ROW_HEIGHT - self.offset
+            if i == self.selected:
+                self.canvas.create_rectangle(0, y, width, y + self.ROW_HEIGHT, fill=THEME['accent'], width=0)
+            middle = y + self.ROW_HEIGHT // 2
+            self.canvas.create_text(8, middle, text=entry["id"], anchor="w", fill=THEME['text'], font=("Arial", 10))
+            self.canvas.create_text(width - 100, middle, text=entry.get("type", ""), anchor="e",
+                                    fill=THEME['text_secondary'], font=("Arial", 9))
+            self.canvas.create_text(width - 8, middle, text=entry.get("releaseTime", "")[:10], anchor="e",
+                                    fill=THEME['text_secondary'], font=("Arial", 9))
+        if total > height > 0:
+            self.scrollbar.set(self.offset / total, (self.offset + height) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def click(self, event):
+        i = (self.offset + event.y) // self.ROW_HEIGHT
+        if 0 <= i < len(self.rows):
+            self.selected = i
+            self.redraw()
+            if self.on_select:
+                self.on_select(self.rows[i])
+
+
+class CatClientHDRLauncher(LauncherCore, tk.Tk):
+    def __init__(self):
+        """Initialize the CatClientHDR launcher window and UI."""
+        tk.Tk.__init__(self)
+        LauncherCore.__init__(self)
+        self.title("CatClientHDR v1.0 🐱🔥")
+        self.geometry("900x550")
+        self.minsize(800, 500)
+        self.configure(bg=THEME['bg'])
+        self.version_categories = {
+            "Latest Release": [],
+            "Latest Snapshot": [],
+            "Release": [],
+            "Snapshot": [],
+            "Old Beta": [],
+            "Old Alpha": []
+        }
+        
+        # Configure styles
+        self.style = ttk.Style()
+        self.style.theme_use('clam')
+        
+        # Configure styles for CatClientHDR look
+        self.style.configure("TFrame", background=THEME['bg'])
+        self.style.configure("TLabel", background=THEME['bg'], foreground=THEME['text'])
+        self.style.configure("TButton", 
+                           background=THEME['button'],
+                           foreground=THEME['text'],
+                           borderwidth=0,
+                           focuscolor='none')
+        self.style.map("TButton",
+                      background=[('active', THEME['button_hover']),
+                                 ('pressed', THEME['accent'])])
+        
+        self.style.configure("TCombobox", 
+                           fieldbackground=THEME['input_bg'],
+                           background=THEME['input_bg'],
+                           foreground=THEME['text'],
+                           arrowcolor=THEME['text'],
+                           borderwidth=0)
+        
+        self.style.configure("TScale", 
+                           background=THEME['bg'],
+                           troughcolor=THEME['input_bg'])
+        
+        self.style.configure("TNotebook", 
+                           background=THEME['header_bg'],
+                           borderwidth=0)
+        self.style.configure("TNotebook.Tab", 
+                           background=THEME['tab_inactive'],
+                           foreground=THEME['text_secondary'],
+                           padding=[15, 5],
+                           borderwidth=0)
+        self.style.map("TNotebook.Tab",
+                      background=[('selected', THEME['tab_active'])],
+                      foreground=[('selected', THEME['text'])])
+        
+        self.init_ui()
+
+    def init_ui(self):
+        """Set up the graphical user interface with CatClientHDR styling."""
+        # Header
+        header = tk.Frame(self, bg=THEME['header_bg'], height=40)
+        header.pack(fill="x", side="top")
+        header.pack_propagate(False)
+        
+        # Header title with cat emoji
+        title = tk.Label(header, text="🐱 CatClientHDR 🔥", font=("Arial", 14, "bold"), 
+                        bg=THEME['header_bg'], fg=THEME['accent'])
+        title.pack(side="left", padx=15, pady=10)
+        
+        # Header version
+        version = tk.Label(header, text="v1.0", font=("Arial", 10), 
+                          bg=THEME['header_bg'], fg=THEME['text_secondary'])
+        version.pack(side="right", padx=15, pady=10)
+        
+        # Main container
+        main_container = tk.Frame(self, bg=THEME['bg'])
+        main_container.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # Left panel - Game settings
+        left_panel = tk.Frame(main_container, bg=THEME['sidebar'], width=300)
+        left_panel.pack(side="left", fill="y", padx=(0, 10))
+        left_panel.pack_propagate(False)
+
+        # Named instance: its own game folder plus remembered version, account, RAM and JVM profile
+        instance_frame = tk.Frame(left_panel, bg=THEME['sidebar'])
+        instance_frame.pack(fill="x", padx=15, pady=(15, 0))
+
+        tk.Label(instance_frame, text="INSTANCE", font=("Arial", 9, "bold"),
+                bg=THEME['sidebar'], fg=THEME['text_secondary']).pack(anchor="w")
+        instance_row = tk.Frame(instance_frame, bg=THEME['sidebar'])
+        instance_row.pack(fill="x", pady=(5, 0))
+        self.instance_combo = ttk.Combobox(instance_row, state="readonly", font=("Arial", 10),
+                                           values=[SHARED_INSTANCE] + self.instances.names())
+        self.instance_combo.set(SHARED_INSTANCE)
+        self.instance_combo.bind("<<ComboboxSelected>>", self.select_instance)
+        self.instance_combo.pack(side="left", fill="x", expand=True)
+        tk.Button(instance_row, text="💾", font=("Arial", 9), bg=THEME['button'], fg=THEME['text'], bd=0, padx=6,
+                  command=self.save_instance).pack(side="right", padx=(5, 0))
+
+        # Game version selection
+        version_frame = tk.Frame(left_panel, bg=THEME['sidebar'])
+        version_frame.pack(fill="x", padx=15, pady=15)
+        
+        tk.Label(version_frame, text="VERSION", font=("Arial", 9, "bold"), 
+                bg=THEME['sidebar'], fg=THEME['text_secondary']).pack(anchor="w")
+        
+        self.category_combo = ttk.Combobox(version_frame, values=list(self.version_categories.keys()),
+                                         state="readonly", font=("Arial", 10))
+        self.category_combo.pack(fill="x", pady=(5, 0))
+        self.category_combo.set("Latest Release")
+        self.category_combo.bind("<<ComboboxSelected>>", self.update_version_list)
+
+        self.version_combo = ttk.Combobox(version_frame, state="readonly", font=("Arial", 10))
+        self.version_combo.pack(fill="x", pady=5)
+
+        # Account settings
+        account_frame = tk.Frame(left_panel, bg=THEME['sidebar'])
+        account_frame.pack(fill="x", padx=15, pady=10)
+        
+        tk.Label(account_frame, text="ACCOUNT", font=("Arial", 9, "bold"), 
+                bg=THEME['sidebar'], fg=THEME['text_secondary']).pack(anchor="w")
+        
+        self.username_input = tk.Entry(account_frame, font=("Arial", 10), bg=THEME['input_bg'],
+                                     fg=THEME['text'], insertbackground=THEME['text'], bd=0, relief="flat")
+        self.username_input.pack(fill="x", pady=(5, 0))
+        self.username_input.insert(0, "CatGamer")
+        self.username_input.bind("<FocusIn>", lambda e: self.username_input.delete(0, tk.END) 
+                               if self.username_input.get() == "CatGamer" else None)
+
+        # RAM settings
+        ram_frame = tk.Frame(left_panel, bg=THEME['sidebar'])
+        ram_frame.pack(fill="x", padx=15, pady=10)
+        
+        ram_header = tk.Frame(ram_frame, bg=THEME['sidebar'])
+        ram_header.pack(fill="x")
+        
+        tk.Label(ram_header, text="RAM", font=("Arial", 9, "bold"),
+                bg=THEME['sidebar'], fg=THEME['text_secondary']).pack(side="left")
+        
+        self.ram_value_label = tk.Label(ram_header, text="4 GB", font=("Arial", 9),
+                                      bg=THEME['sidebar'], fg=THEME['text'])
+        self.ram_value_label.pack(side="right")
+
+        self.ram_scale = tk.Scale(ram_frame, from_=1, to=16, orient="horizontal",
+                                bg=THEME['sidebar'], fg=THEME['text'],
+                                activebackground=THEME['accent'],
+                                highlightthickness=0, bd=0,
+                                troughcolor=THEME['input_bg'],
+                                sliderrelief="flat",
+                                command=self.on_ram_change)
+        self.ram_scale.set(4)
+        self.ram_scale.pack(fill="x")
+
+        # Skin button
+        skin_button = tk.Button(left_panel, text="🎨 Change Skin", font=("Arial", 10),
+                              bg=THEME['button'], fg=THEME['text'],
+                              bd=0, padx=20, pady=8, command=self.select_skin)
+        skin_button.pack(padx=15, pady=10, fill="x")
+
+        # Launch button
+        self.launch_button = tk.Button(left_panel, text="🚀 PLAY NOW", font=("Arial", 12, "bold"),
+                                     bg=THEME['accent'], fg=THEME['text'],
+                                     bd=0, padx=20, pady=12, command=self.prepare_and_launch)
+        self.launch_button.pack(side="bottom", padx=15, pady=15, fill="x")
+
+        # Job progress, shown while Java/version files are being prepared
+        progress_frame = tk.Frame(left_panel, bg=THEME['sidebar'])
+        progress_frame.pack(side="bottom", fill="x", padx=15)
+
+        status_row = tk.Frame(progress_frame, bg=THEME['sidebar'])
+        status_row.pack(fill="x")
+        self.status_label = tk.Label(status_row, text="Ready to play! 🐱", font=("Arial", 9),
+                                   bg=THEME['sidebar'], fg=THEME['text_secondary'], anchor="w")
+        self.status_label.pack(side="left", fill="x", expand=True)
+        self.cancel_button = tk.Button(status_row, text="✖ Cancel", font=("Arial", 8),
+                                     bg=THEME['input_bg'], fg=THEME['text'], bd=0, padx=6,
+                                     state="disabled", command=self.cancel_job)
+        self.cancel_button.pack(side="right")
+
+        self.progress_bar = ttk.Progressbar(progress_frame, mode="determinate", maximum=1000)
+        self.progress_bar.pack(fill="x", pady=(5, 0))
+
+        # Right panel - Tabs and content
+        right_panel = tk.Frame(main_container, bg=THEME['bg'])
+        right_panel.pack(side="left", fill="both", expand=True)
+
+        # Create notebook for tabs
+        notebook = ttk.Notebook(right_panel)
+        notebook.pack(fill="both", expand=True)
+
+        # News tab
+        news_tab = ttk.Frame(notebook)
+        notebook.add(news_tab, text="News")
+
+        # Versions tab
+        versions_tab = ttk.Frame(notebook)
+        notebook.add(versions_tab, text="Versions")
+
+        # Settings tab
+        settings_tab = ttk.Frame(notebook)
+        notebook.add(settings_tab, text="Settings")
+        notebook.bind("<<NotebookTabChanged>>",
+                      lambda event: notebook.select() == str(settings_tab) and self.schedule_jvm_flags(0))
+
+        # Game tab: status and recent output of the last launched game
+        game_tab = ttk.Frame(notebook)
+        notebook.add(game_tab, text="Game")
+
+        # Populate news tab with CatClientHDR content
+        news_content = tk.Frame(news_tab, bg=THEME['bg'])
+        news_content.pack(fill="both", expand=True, padx=10, pady=10)
+
+        # News title
+        news_title = tk.Label(news_content, text="🐱 CATCLIENTHDR - MEOW EDITION 🔥", 
+                             font=("Arial", 16, "bold"), bg=THEME['bg'], fg=THEME['accent'])
+        news_title.pack(anchor="w", pady=(0, 15))
+
+        # News items with cat-themed messaging
+        news_items = [
+            "🐾 Custom Minecraft Launcher with fiery cat-powered interface",
+            "🎮 Support for all Minecraft versions (even the ancient ones!)",
+            "☕ Automatic Java installation - no hairballs included",
+            "🎨 Easy skin changing - dress your cat character",
+            "⚡ Optimized performance settings for smooth gameplay",
+            "🪶 Lightweight and fast - purrs along nicely",
+            "🔄 Regular updates and improvements from the cat crew",
+            "🔥 SAMSOFT CO powered technology"
+        ]
+
+        for item in news_items:
+            item_frame = tk.Frame(news_content, bg=THEME['bg'])
+            item_frame.pack(fill="x", pady=2)
+            tk.Label(item_frame, text=item, font=("Arial", 10),
+                    bg=THEME['bg'], fg=THEME['text'], justify="left", anchor="w").pack(fill='x')
+
+        # Version list in versions tab
+        versions_content = tk.Frame(versions_tab, bg=THEME['bg'])
+        versions_content.pack(fill="both", expand=True, padx=10, pady=10)
+
+        versions_title = tk.Label(versions_content, text="AVAILABLE VERSIONS", 
+                                 font=("Arial", 12, "bold"), bg=THEME['bg'], fg=THEME['text'])
+        versions_title.pack(anchor="w", pady=(0, 10))
+
+        # Search and filters; every keystroke re-queries the in-memory version index
+        filter_frame = tk.Frame(versions_content, bg=THEME['bg'])
+        filter_frame.pack(fill="x", pady=(0, 8))
+        self.version_search_var = tk.StringVar()
+        self.version_type_var = tk.StringVar(value="All")
+        self.version_since_var = tk.StringVar()
+        tk.Label(filter_frame, text="🔎", bg=THEME['bg'], fg=THEME['text']).pack(side="left")
+        tk.Entry(filter_frame, textvariable=self.version_search_var, font=("Arial", 10), bg=THEME['input_bg'],
+                 fg=THEME['text'], insertbackground=THEME['text'], bd=0).pack(side="left", fill="x", expand=True, padx=5)
+        ttk.Combobox(filter_frame, textvariable=self.version_type_var, values=list(VERSION_TYPE_FILTERS),
+                     state="readonly", width=10).pack(side="left", padx=5)
+        tk.Label(filter_frame, text="Since", bg=THEME['bg'], fg=THEME['text_secondary']).pack(side="left")
+        tk.Entry(filter_frame, textvariable=self.version_since_var, width=10, bg=THEME['input_bg'], fg=THEME['text'],
+                 insertbackground=THEME['text'], bd=0).pack(side="left", padx=5)
+        for var in (self.version_search_var, self.version_type_var, self.version_since_var):
+            var.trace_add("write", lambda *args: self.refresh_version_search())
+
+        self.version_count_label = tk.Label(versions_content, text="", font=("Arial", 9),
+                                            bg=THEME['bg'], fg=THEME['text_secondary'])
+        self.version_count_label.pack(anchor="w")
+
+        # Only the rows in view are drawn, so long snapshot lists cost nothing to show or filter
+        self.version_list = VersionList(versions_content, on_select=lambda entry: self.version_combo.set(entry["id"]))
+        self.version_list.pack(fill="both", expand=True)
+
+        # Settings tab content
+        settings_content = tk.Frame(settings_tab, bg=THEME['bg'])
+        settings_content.pack(fill="both", expand=True, padx=10, pady=10)
+
+        settings_title = tk.Label(settings_content, text="CATCLIENTHDR SETTINGS", 
+                                 font=("Arial", 12, "bold"), bg=THEME['bg'], fg=THEME['text'])
+        settings_title.pack(anchor="w", pady=(0, 10))
+
+        # Settings options
+        self.deep_verify_var = tk.BooleanVar(value=False)
+        self.cds_var = tk.BooleanVar(value=True)
+        settings_options = [
+            ("Auto-update CatClientHDR", tk.BooleanVar(value=True)),
+            ("Close launcher when game starts", tk.BooleanVar(value=False)),
+            ("Keep launcher open (recommended)", tk.BooleanVar(value=True)),
+            ("Check for Java updates", tk.BooleanVar(value=True)),
+            ("Enable cat mode (extra meows)", tk.BooleanVar(value=True)),
+            ("Force deep verify (re-hash every file)", self.deep_verify_var),
+            ("Class data sharing (faster game start after the first launch)", self.cds_var)
+        ]
+
+        for text, var in settings_options:
+            cb = tk.Checkbutton(settings_content, text=text, variable=var,
+                              bg=THEME['bg'], fg=THEME['text'], selectcolor=THEME['sidebar'],
+                              activebackground=THEME['bg'], activeforeground=THEME['text'])
+            cb.pack(anchor="w", pady=5)
+
+        # JVM tuning profile; the flags it resolves to depend on this machine, so show them
+        profile_frame = tk.Frame(settings_content, bg=THEME['bg'])
+        profile_frame.pack(fill="x", pady=10)
+
+        tk.Label(profile_frame, text="JVM profile:", bg=THEME['bg'], fg=THEME['text']).pack(side="left")
+        self.profile_var = tk.StringVar(value="auto")
+        profile_combo = ttk.Combobox(profile_frame, textvariable=self.profile_var, values=list(JVM_PROFILES),
+                                     state="readonly", width=12)
+        profile_combo.pack(side="left", padx=5)
+        profile_combo.bind("<<ComboboxSelected>>", lambda event: self.schedule_jvm_flags(0))
+        self.jvm_flags_label = tk.Label(settings_content, text="", font=("Courier", 8), bg=THEME['bg'],
+                                        fg=THEME['text_secondary'], anchor="w", justify="left", wraplength=560)
+        self.jvm_flags_label.pack(fill="x")
+        self.jvm_flags_after = None  # Pending schedule_jvm_flags timer
+        self.jvm_flags_queue = queue.Queue()
+        self.jvm_flags_pending = 0  # Resolutions started but not yet shown
+
+        # Game directory setting
+        dir_frame = tk.Frame(settings_content, bg=THEME['bg'])
+        dir_frame.pack(fill="x", pady=10)
+
+        tk.Label(dir_frame, text="Game Directory:", bg=THEME['bg'], fg=THEME['text']).pack(anchor="w")
+        dir_entry = tk.Entry(dir_frame, bg=THEME['input_bg'], fg=THEME['text'], 
+                           insertbackground=THEME['text'], bd=0)
+        dir_entry.insert(0, CATCLIENT_DIR)
+        dir_entry.pack(fill="x", pady=(5, 0))
+
+        # Disk budget for downloaded versions, libraries and assets
+        budget_frame = tk.Frame(settings_content, bg=THEME['bg'])
+        budget_frame.pack(fill="x", pady=10)
+
+        tk.Label(budget_frame, text="Disk budget (GB):", bg=THEME['bg'], fg=THEME['text']).pack(side="left")
+        self.disk_budget_var = tk.StringVar(value=str(DISK_BUDGET_GB))
+        tk.Entry(budget_frame, textvariable=self.disk_budget_var, width=6, bg=THEME['input_bg'], fg=THEME['text'],
+                 insertbackground=THEME['text'], bd=0).pack(side="left", padx=5)
+        tk.Button(budget_frame, text="🧹 Free disk space", font=("Arial", 9),
+                  bg=THEME['button'], fg=THEME['text'], bd=0, padx=10,
+                  command=self.free_disk_space).pack(side="left", padx=5)
+
+        # Game tab content
+        game_content = tk.Frame(game_tab, bg=THEME['bg'])
+        game_content.pack(fill="both", expand=True, padx=10, pady=10)
+        self.game_status_label = tk.Label(game_content, text="No game running. 🐱", font=("Arial", 10),
+                                          bg=THEME['bg'], fg=THEME['text'], anchor="w", justify="left")
+        self.game_status_label.pack(fill="x", pady=(0, 8))
+        log_frame = tk.Frame(game_content, bg=THEME['bg'])
+        log_frame.pack(fill="both", expand=True)
+        self.game_log_text = tk.Text(log_frame, font=("Courier", 9), bg=THEME['input_bg'], fg=THEME['text'],
+                                     bd=0, wrap="none", state="disabled")
+        log_scrollbar = ttk.Scrollbar(log_frame, command=self.game_log_text.yview)
+        self.game_log_text.config(yscrollcommand=log_scrollbar.set)
+        log_scrollbar.pack(side="right", fill="y")
+        self.game_log_text.pack(side="left", fill="both", expand=True)
+        self.game_log_text.tag_config("stderr", foreground=THEME['accent_light'])
+        self.game_lines_shown = None  # (session, line_count) last drawn, to skip redraws when nothing changed
+        self.game_poll_pending = False
+
+        # Load versions once the first frame has painted, so reading the cache never delays the window
+        self.after_idle(self.load_version_manifest)
+
+    def update_version_list(self, event=None):
+        """Update the version list based on the selected category."""
+        category = self.category_combo.get()
+        if self.version_categories[category]:
+            self.version_combo['values'] = self.version_categories[category]
+            self.version_combo.current(0)
+        else:
+            self.version_combo['values'] = []
+            self.version_combo.set("")  # Clear selection if category is empty
+            self.category_combo.set("Latest Release")  # Fallback to Latest Release
+            if self.version_categories["Latest Release"]:
+                self.version_combo['values'] = self.version_categories["Latest Release"]
+                self.version_combo.current(0)
+
+    def refresh_version_search(self):
+        """Show the versions matching the Versions tab's search text, type and date filters."""
+        since = self.version_since_var.get().strip()
+        if not re.match(r'^\d{4}(-\d{2}(-\d{2})?)?$', since):
+            since = None  # Ignore partly typed dates
+        rows = self.version_index.search(self.version_search_var.get(),
+                                         types=VERSION_TYPE_FILTERS.get(self.version_type_var.get()), since=since)
+        self.version_list.set_rows(rows)
+        self.version_count_label.config(text=f"{len(rows)} of {len(self.version_index)} versions")
+
+    def load_version_manifest(self):
+        """Show the cached version manifest immediately, then revalidate it with Mojang in the background."""
+        self.manifest_queue = queue.Queue()
+        cached_manifest, self.manifest_meta = self.read_manifest_cache()
+        self.manifest_cached = cached_manifest is not None
+        if cached_manifest is not None:
+            self.apply_version_manifest(cached_manifest)
+            print("✅ CatClientHDR: Version manifest loaded from cache! 🐱")
+
+        # Only revalidate conditionally when there is a cached body to fall back on
+        meta = dict(self.manifest_meta) if self.manifest_cached else {}
+        threading.Thread(target=self.refresh_version_manifest, args=(meta,), daemon=True).start()
+        self.after(100, self.poll_version_manifest)
+
+    def refresh_version_manifest(self, meta):
+        """Conditionally re-fetch the manifest on a worker thread and queue the outcome for the UI."""
+        try:
+            fetched = self.fetch_version_manifest(meta)
+            if fetched is None:
+                self.manifest_queue.put(("not_modified", None))
+            else:
+                self.manifest_queue.put(("updated", fetched))
+        except Exception as e:
+            self.manifest_queue.put(("error", e))
+
+    def poll_version_manifest(self):
+        """Apply the background manifest refresh once it finishes (runs on the Tk thread)."""
+        import ssl
+        import urllib.error
+        try:
+            status, payload = self.manifest_queue.get_nowait()
+        except queue.Empty:
+            self.after(100, self.poll_version_manifest)
+            return
+
+        if status == "updated":
+            manifest, self.manifest_meta = payload
+            self.apply_version_manifest(manifest)
+            print("✅ CatClientHDR: Version manifest loaded successfully! 🐱")
+        elif status == "not_modified":
+            print("✅ CatClientHDR: Cached version manifest is up to date! 🐱")
+        elif self.manifest_cached:
+            print(f"⚠️ CatClientHDR: Could not refresh version manifest, using cached copy: {payload}")
+        elif isinstance(payload, ssl.SSLError):
+            print(f"❌ CatClientHDR: SSL error loading version manifest: {payload}")
+            self.show_error("CatClientHDR Error", 
+                               f"SSL verification failed.\n\nError: {str(payload)}\n\nPlease check your internet connection.")
+        elif isinstance(payload, urllib.error.URLError):
+            print(f"❌ CatClientHDR: Network error loading version manifest: {payload}")
+            self.show_error("CatClientHDR Error", 
+                               f"Failed to load version manifest.\n\nNetwork Error: {str(payload)}\n\nPlease check your internet connection and firewall settings.")
+        else:
+            print(f"❌ CatClientHDR: Error loading version manifest: {payload}")
+            self.show_error("CatClientHDR Error", 
+                               f"Failed to load version manifest.\n\nError: {str(payload)}\n\nPlease check your internet connection.")
+
+    def apply_version_manifest(self, manifest):
+        """Populate version_categories from a parsed manifest and refresh the version widgets."""
+        # Clear existing categories
+        for category in self.version_categories:
+            self.version_categories[category] = []
+        
+        # Categorize versions
+        latest_release = None
+        latest_snapshot = None
+        
+        self.index_manifest(manifest)
+        for v in self.version_index.entries:
+            # Track latest versions
+            if v["id"] == manifest["latest"]["release"]:
+                latest_release = v["id"]
+                self.version_categories["Latest Release"].append(v["id"])
+            elif v["id"] == manifest["latest"]["snapshot"]:
+                latest_snapshot = v["id"]
+                self.version_categories["Latest Snapshot"].append(v["id"])
+            
+            # Categorize by type
+            if v["type"] == "release":
+                if v["id"] != latest_release:
+                    self.version_categories["Release"].append(v["id"])
+            elif v["type"] == "snapshot":
+                if v["id"] != latest_snapshot:
+                    self.version_categories["Snapshot"].append(v["id"])
+            elif v["type"] == "old_beta":
+                self.version_categories["Old Beta"].append(v["id"])
+            elif v["type"] == "old_alpha":
+                self.version_categories["Old Alpha"].append(v["id"])
+        
+        # Update the version combo box, keeping the user's pick across background refreshes
+        selected = self.version_combo.get()
+        self.update_version_list()
+        if selected and selected in self.version_combo['values']:
+            self.version_combo.set(selected)
+        self.refresh_version_search()
+
+    def select_instance(self, event=None):
+        """Fill the launch settings from the selected instance."""
+        instance = self.instances.get(self.instance_combo.get())
+        if instance is None:
+            return
+        self.version_combo.set(instance["version"])
+        self.username_input.delete(0, tk.END)
+        self.username_input.insert(0, instance["username"])
+        self.ram_scale.set(instance["ram"])
+        self.profile_var.set(instance["profile"])
+        self.cds_var.set(instance["cds"])
+
+    def save_instance(self):
+        """Save the current launch settings as a named instance with its own game folder."""
+        from tkinter import simpledialog
+        current = self.instance_combo.get()
+        name = simpledialog.askstring("CatClientHDR", "Instance name:", parent=self,
+                                      initialvalue="" if current == SHARED_INSTANCE else current)
+        if not name:
+            return
+        try:
+            self.instances.save(name.strip(), version=self.version_combo.get(),
+                                username=self.validate_username(self.username_input.get()),
+                                ram=int(self.ram_scale.get()), profile=self.profile_var.get(), cds=self.cds_var.get())
+        except (ValueError, OSError) as e:
+            messagebox.showerror("CatClientHDR Error", f"Could not save instance: {e}")
+            return
+        self.instance_combo['values'] = [SHARED_INSTANCE] + self.instances.names()
+        self.instance_combo.set(name.strip())
+        self.status_label.config(text=f"Saved instance {name.strip()}. 🐱")
+
+    def select_skin(self):
+        """Allow the user to select and apply a custom skin PNG file."""
+        from tkinter import filedialog
+        file_path = filedialog.askopenfilename(filetypes=[("PNG Files", "*.png")])
+        if file_path:
+            skin_dest = os.path.join(CATCLIENT_DIR, "skins")
+            os.makedirs(skin_dest, exist_ok=True)
+            try:
+                shutil.copy(file_path, os.path.join(skin_dest, "custom_skin.png"))
+                messagebox.showinfo("CatClientHDR", "🎨 Skin applied successfully! Note: This may require a mod to apply in-game. Meow! 🐱")
+            except Exception as e:
+                print(f"❌ CatClientHDR: Failed to apply skin: {e}")
+                self.show_error("CatClientHDR Error", f"Failed to apply skin: {str(e)}.\n\nPlease check file permissions or try another file.")
+
+    def free_disk_space(self):
+        """Settings action: evict versions until downloads fit the disk budget, keeping the selected version."""
+        if self.job_thread is not None and self.job_thread.is_alive():
+            messagebox.showinfo("CatClientHDR", "Wait for the current job to finish first. 🐱")
+            return
+        try:
+            budget_gb = float(self.disk_budget_var.get())
+        except ValueError:
+            messagebox.showerror("CatClientHDR Error", "Disk budget must be a number of GB.")
+            return
+        selected = self.version_combo.get()
+        self.status_label.config(text="Freeing disk space... 🧹")
+        # Walking and deleting version data can take seconds; the eviction runs as a job like a launch
+        self.start_job(self.run_evict_job, int(budget_gb * 1024 ** 3), {selected} if selected else (), cancellable=False)
+
+    def run_evict_job(self, budget_bytes, keep_versions):
+        """Worker-thread body of a disk-space job; posts its summary as a dialog and a final ("done", status) event."""
+        status = "free_failed"
+        try:
+            freed, evicted = self.evict_versions(budget_bytes, keep_versions=keep_versions)
+            summary = f"Freed {freed / (1024 * 1024):.1f} MB."
+            if evicted:
+                summary += "\n\nRemoved versions: " + ", ".join(evicted)
+            print(f"🧹 CatClientHDR: {summary}")
+            self.progress.events.put(("dialog", "info", "CatClientHDR", f"🧹 {summary}"))
+            status = "freed"
+        except Exception as e:
+            print(f"❌ CatClientHDR: Freeing disk space failed: {e}")
+            self.show_error("CatClientHDR Error", f"Freeing disk space failed: {str(e)}.")
+        self.progress.events.put(("done", status))
+
+    def show_error(self, title, message):
+        """Show an error dialog, routing it through the job queue when called from a worker thread."""
+        if threading.current_thread() is threading.main_thread() or self.progress.events is None:
+            messagebox.showerror(title, message)
+        else:
+            self.progress.events.put(("dialog", "error", title, message))
+
+    def show_warning(self, title, message):
+        """Show a warning dialog, routing it through the job queue when called from a worker thread."""
+        if threading.current_thread() is threading.main_thread() or self.progress.events is None:
+            messagebox.showwarning(title, message)
+        else:
+            self.progress.events.put(("dialog", "warning", title, message))
+
+    def prepare_and_launch(self):
+        """Read the launch settings and run setup, downloads and launch on a background job."""
+        if self.job_thread is not None and self.job_thread.is_alive():
+            return
+        version = self.version_combo.get()
+        if not version:
+            messagebox.showerror("CatClientHDR Error", "No version selected. Meow!")
+            return
+        # Tk variables are only safe to read here, on the UI thread
+        settings = {
+            "version": version,
+            "username": self.validate_username(self.username_input.get()),
+            "ram": int(self.ram_scale.get()),
+            "deep_verify": self.deep_verify_var.get(),
+            "cds": self.cds_var.get(),
+            "profile": self.profile_var.get(),
+            "instance": self.instance_combo.get() if self.instance_combo.get() != SHARED_INSTANCE else None,
+        }
+
+        self.status_label.config(text="Preparing... 🐱")
+        self.start_job(self.run_launch_job, settings)
+
+    def start_job(self, target, *args, cancellable=True):
+        """Run target(*args) as the background job; drain_job_events applies its events until it posts "done"."""
+        self.progress = ProgressReporter(queue.Queue())
+        self.launch_button.config(state="disabled")
+        self.cancel_button.config(state="normal" if cancellable else "disabled")
+        self.progress_bar['value'] = 0
+        self.job_thread = threading.Thread(target=target, args=args, daemon=True)
+        self.job_thread.start()
+        self.after(50, self.drain_job_events)
+
+    def run_launch_job(self, settings):
+        """Worker-thread body of a launch job; posts a final ("done", status) event."""
+        status = "failed"
+        with TRACER.span("launch.job", version=settings["version"]) as span:
+            try:
+                self.progress.phase("Checking Java")
+                self.install_java_if_needed()
+                instance = settings.pop("instance")
+                if instance:
+                    # The instance remembers what it was last launched with
+                    self.instances.save(instance, **{key: settings[key] for key in
+                                                     ("version", "username", "ram", "cds", "profile")})
+                    launched = self.launch_instance(instance, deep_verify=settings["deep_verify"])
+                else:
+                    self.modify_options_txt(target_fps=60)
+                    launched = self.download_and_launch(**settings)
+                if launched:
+                    status = "launched"
+            except DownloadCancelled:
+                status = "cancelled"
+                print("🛑 CatClientHDR: Launch cancelled.")
+            except Exception as e:
+                print(f"❌ CatClientHDR: Launch job failed: {e}")
+                self.show_error("CatClientHDR Error", f"Launch failed: {str(e)}.")
+            span["status"] = status
+        self.export_trace(f"launch-{settings['version']}")
+        self.progress.events.put(("done", status))
+
+    def cancel_job(self):
+        """Ask the running job to stop; in-flight downloads abort at their next chunk."""
+        self.progress.cancel_event.set()
+        self.cancel_button.config(state="disabled")
+        self.status_label.config(text="Cancelling...")
+
+    def drain_job_events(self):
+        """Apply queued job events to the UI, rescheduling itself until the job finishes."""
+        done = False
+        while True:
+            try:
+                event = self.progress.events.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "progress":
+                _, phase, files_done, files_total, bytes_done, bytes_total = event
+                if bytes_total:
+                    self.progress_bar['value'] = 1000 * min(bytes_done, bytes_total) / bytes_total
+                elif files_total:
+                    self.progress_bar['value'] = 1000 * files_done / files_total
+                text = phase
+                if files_total:
+                    text += f" {files_done}/{files_total}"
+                if bytes_done:
+                    text += f" · {bytes_done / (1024 * 1024):.1f} MB"
+                self.status_label.config(text=text)
+            elif event[0] == "dialog":
+                _, kind, title, message = event
+                if kind == "error":
+                    messagebox.showerror(title, message)
+                elif kind == "info":
+                    messagebox.showinfo(title, message)
+                else:
+                    messagebox.showwarning(title, message)
+            elif event[0] == "done":
+                done = True
+                messages = {"launched": "Game launched! Meow! 🔥", "freed": "Disk space freed. 🧹", "cancelled": "Cancelled.",
+                            "failed": "Launch failed. 😿", "free_failed": "Freeing disk space failed. 😿"}
+                self.status_label.config(text=messages[event[1]])
+                self.progress_bar['value'] = 1000 if event[1] in ("launched", "freed") else 0
+
+        if done:
+            self.launch_button.config(state="normal")
+            self.cancel_button.config(state="disabled")
+            if not self.game_poll_pending and self.games.latest() is not None:
+                self.game_poll_pending = True
+                self.after(500, self.refresh_game_tab)
+        else:
+            self.after(50, self.drain_job_events)
+
+    def on_ram_change(self, value):
+        """Show the new RAM slider value and re-resolve the JVM flags once the slider settles."""
+        self.ram_value_label.config(text=f"{int(float(value))} GB")
+        self.schedule_jvm_flags(300)
+
+    def schedule_jvm_flags(self, delay_ms):
+        """Resolve the JVM flags for the current profile and RAM after delay_ms, replacing any pending request."""
+        if self.jvm_flags_after is not None:
+            self.after_cancel(self.jvm_flags_after)
+        self.jvm_flags_after = self.after(delay_ms, self.start_jvm_flags)
+
+    def start_jvm_flags(self):
+        """Resolve the JVM flags on a worker thread; probing Java spawns processes, which must not block the window."""
+        self.jvm_flags_after = None
+        profile, ram = self.profile_var.get(), int(self.ram_scale.get())
+
+        def resolve():
+            try:
+                self.jvm_flags_queue.put(self.resolve_jvm_flags(profile, ram, self.find_java()))
+            except Exception as e:
+                self.jvm_flags_queue.put(([], [f"Could not resolve JVM flags: {e}"], profile))
+
+        self.jvm_flags_label.config(text="Resolving JVM flags...")
+        threading.Thread(target=resolve, daemon=True).start()
+        self.jvm_flags_pending += 1
+        if self.jvm_flags_pending == 1:
+            self.after(100, self.poll_jvm_flags)
+
+    def poll_jvm_flags(self):
+        """Show the resolved JVM flags once the worker finishes (runs on the Tk thread)."""
+        while self.jvm_flags_pending:
+            try:
+                flags, notes, profile = self.jvm_flags_queue.get_nowait()
+            except queue.Empty:
+                self.after(100, self.poll_jvm_flags)
+                return
+            self.jvm_flags_pending -= 1
+            if not self.jvm_flags_pending:  # Skip results a newer request has already replaced
+                self.jvm_flags_label.config(text="\n".join([f"{profile}: {' '.join(flags)}"] + notes))
+
+    def refresh_game_tab(self):
+        """Show the latest game's status and output tail, once a second while any game is running."""
+        self.game_poll_pending = False
+        session = self.games.latest()
+        if session is None:
+            return
+        # Every running game gets a status line; the output shown is the newest game's
+        self.game_status_label.config(text="\n".join(f"{game.version}: {game.describe()}"
+                                                     for game in self.games.running() or [session]))
+        shown = (session, session.line_count)
+        if shown != self.game_lines_shown:
+            self.game_lines_shown = shown
+            at_bottom = self.game_log_text.yview()[1] >= 0.999
+            self.game_log_text.config(state="normal")
+            self.game_log_text.delete("1.0", tk.END)
+            for stream, line in session.tail(GAME_TAIL_LINES):
+                self.game_log_text.insert(tk.END, line + "\n", stream)
+            self.game_log_text.config(state="disabled")
+            if at_bottom:
+                self.game_log_text.see(tk.END)  # Follow new output unless the user scrolled up to read
+        if self.games.running():
+            self.game_poll_pending = True
+            self.after(1000, self.refresh_game_tab)
+        elif session.exit_code:
+            self.status_label.config(text="Game crashed. 😿")
+            messagebox.showwarning("CatClientHDR", f"The game crashed: {session.cause}.\n\nLog: {session.log_path}"
+                                   + (f"\nCrash report: {session.crash_report}" if session.crash_report else ""))
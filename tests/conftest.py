@@ -0,0 +1,58 @@
+"""Shared fixtures: the benchmarks' stand-in for Mojang and Adoptium, and a launcher pointed at it from a scratch home."""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import catclient_core as core  # noqa: E402
+from stand_in import ADOPTIUM_PATH, StandInServer  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def server():
+    server = StandInServer(versions=2, libraries=5, assets=20, client_size=64 * 1024, jdk_size=64 * 1024).start()
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def home(tmp_path, server, monkeypatch):
+    """Point every launcher path and endpoint at a scratch data folder and the stand-in; undone after the test."""
+    home = str(tmp_path / "catclient")
+    for name, value in (("CATCLIENT_DIR", home),
+                        ("VERSIONS_DIR", os.path.join(home, "versions")),
+                        ("JAVA_DIR", os.path.join(home, "java")),
+                        ("ASSETS_DIR", os.path.join(home, "assets")),
+                        ("INSTANCES_DIR", os.path.join(home, "instances")),
+                        ("MANIFEST_CACHE_PATH", os.path.join(home, "version_manifest.json")),
+                        ("MANIFEST_META_PATH", os.path.join(home, "version_manifest.meta.json")),
+                        ("VERSION_MANIFEST_URL", f"{server.base_url}/meta/version_manifest.json"),
+                        ("ASSET_OBJECTS_URL", f"{server.base_url}/files/objects"),
+                        ("ADOPTIUM_API_URL", f"{server.base_url}{ADOPTIUM_PATH}"),
+                        ("MIRRORS", core.MirrorList(os.path.join(home, "mirrors.json")))):
+        monkeypatch.setattr(core, name, value)
+    # Hide any system Java so the stand-in's JDK is the one found
+    monkeypatch.setenv("PATH", os.pathsep.join(d for d in os.environ.get("PATH", "").split(os.pathsep)
+                                                if not os.path.exists(os.path.join(d, "java"))))
+    server.reset_stats()
+    return home
+
+
+@pytest.fixture
+def launcher(home):
+    launcher = core.LauncherCore()
+    assert launcher.ensure_version_manifest()
+    return launcher
+
+
+@pytest.fixture
+def installed(launcher):
+    """A launcher with the stand-in's JDK and bench-1 installed."""
+    launcher.install_java_if_needed()
+    assert launcher.find_java() is not None
+    assert launcher.download_version_files("bench-1", launcher.versions["bench-1"])
+    return launcher
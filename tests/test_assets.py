@@ -0,0 +1,23 @@
+import json
+import os
+
+import catclient_core as core
+
+
+def objects(server):
+    return json.loads(server.files["/meta/assets/bench.json"])["objects"]
+
+
+def object_path(obj_hash):
+    return os.path.join(core.ASSETS_DIR, "objects", obj_hash[:2], obj_hash)
+
+
+def test_deep_verify_replaces_a_corrupt_object_of_the_right_size(installed, server):
+    obj = next(iter(objects(server).values()))
+    with open(object_path(obj["hash"]), "r+b") as f:
+        f.write(b"\0" * 16)
+    assert installed.download_version_files("bench-1", installed.versions["bench-1"])
+    assert core.sha1_file(object_path(obj["hash"])) != obj["hash"]  # Same size, so a normal launch trusts it
+
+    assert installed.download_version_files("bench-1", installed.versions["bench-1"], deep_verify=True)
+    assert core.sha1_file(object_path(obj["hash"])) == obj["hash"]
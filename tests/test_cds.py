@@ -0,0 +1,62 @@
+import os
+
+import catclient_core as core
+
+
+def cds_flags(command):
+    return [arg for arg in command if arg.startswith(("-XX:ArchiveClassesAtExit=", "-XX:SharedArchiveFile="))]
+
+
+def cds_files(home):
+    return sorted(os.listdir(os.path.join(core.VERSIONS_DIR, "bench-1", "cds")))
+
+
+def launch(launcher):
+    command = launcher.build_launch_command("bench-1", "CatGamer", 1)
+    session = launcher.start_game("bench-1", command)
+    assert session.wait(10) == 0
+    return command
+
+
+def test_archive_is_promoted_after_a_clean_exit(installed, home):
+    command = launch(installed)
+    [dump] = cds_flags(command)
+    assert dump.startswith("-XX:ArchiveClassesAtExit=") and dump.endswith(".pending.jsa")
+    key = os.path.basename(dump).split(".", 1)[0]
+    assert cds_files(home) == [f"{key}.jsa"]
+
+    command = installed.build_launch_command("bench-1", "CatGamer", 1)
+    archive_path = os.path.join(core.VERSIONS_DIR, "bench-1", "cds", f"{key}.jsa")
+    assert cds_flags(command) == [f"-XX:SharedArchiveFile={archive_path}"]
+
+
+def test_a_changed_classpath_jar_invalidates_the_archive(installed, home):
+    launch(installed)
+    [archive] = cds_files(home)
+    plan = installed.load_launch_plan("bench-1", installed.find_java())
+    os.utime(plan["classpath"][0], ns=(0, 1))
+    command = installed.build_launch_command("bench-1", "CatGamer", 1)
+    [dump] = cds_flags(command)
+    assert dump.startswith("-XX:ArchiveClassesAtExit=")
+    assert archive not in cds_files(home)
+
+
+def test_a_crashed_dump_is_discarded(installed, home):
+    [dump] = cds_flags(installed.build_launch_command("bench-1", "CatGamer", 1))
+    pending_path = dump.split("=", 1)[1]
+    # The archive flag rides along as $0, where promote_cds_archive finds it
+    session = installed.games.launch(["sh", "-c", f"printf partial > '{pending_path}'; exit 1", dump], "bench-1",
+                                     on_exit=installed.promote_cds_archive)
+    assert session.wait(10) == 1
+    assert cds_files(home) == []
+
+
+def test_only_one_running_game_dumps_an_archive(installed, home):
+    [dump] = cds_flags(installed.build_launch_command("bench-1", "CatGamer", 1))
+    session = installed.games.launch(["sh", "-c", "exec sleep 30", dump], "bench-1")
+    try:
+        assert cds_flags(installed.build_launch_command("bench-1", "CatGamer", 1)) == []
+    finally:
+        session.process.kill()
+        session.wait(10)
+    assert len(cds_flags(installed.build_launch_command("bench-1", "CatGamer", 1))) == 1
@@ -0,0 +1,38 @@
+import json
+import os
+
+import catclient_cli as cli
+import catclient_core as core
+
+
+def test_prefetch_fetches_a_repeated_version_once(home, monkeypatch):
+    fetched = []
+    fetch_version_json = core.LauncherCore.fetch_version_json
+
+    def counting_fetch(self, version_id, version_url):
+        fetched.append(version_id)
+        return fetch_version_json(self, version_id, version_url)
+
+    monkeypatch.setattr(core.LauncherCore, "fetch_version_json", counting_fetch)
+    assert cli.main(["prefetch", "bench-1", "bench-1"]) == 0
+    assert fetched == ["bench-1"]
+    assert os.path.exists(os.path.join(core.VERSIONS_DIR, "bench-1", "natives", "liblwjgl.so"))
+
+
+def test_prefetch_of_an_unknown_version_fails(home):
+    assert cli.main(["prefetch", "bench-1", "no-such-version"]) == 1
+    assert not os.path.exists(os.path.join(core.VERSIONS_DIR, "bench-1"))
+
+
+def test_launch_of_a_game_that_exits_cleanly_succeeds(home, server):
+    assert cli.main(["launch", "--version", "bench-1", "--ram", "1"]) == 0
+    # Deferred assets finished before the command returned, and the exit hook adopted the class-data archive
+    objects = json.loads(server.files["/meta/assets/bench.json"])["objects"].values()
+    assert all(os.path.exists(os.path.join(core.ASSETS_DIR, "objects", obj["hash"][:2], obj["hash"])) for obj in objects)
+    [archive] = os.listdir(os.path.join(core.VERSIONS_DIR, "bench-1", "cds"))
+    assert not archive.endswith(".pending.jsa")
+
+
+def test_launch_returns_the_games_exit_code(home, monkeypatch):
+    monkeypatch.setattr(core.LauncherCore, "build_launch_command", lambda self, *args: ["sh", "-c", "exit 3"])
+    assert cli.main(["launch", "--version", "bench-1", "--no-cds"]) == 1
@@ -0,0 +1,116 @@
+import json
+import os
+import time
+
+import catclient_core as core
+
+
+def library_paths(launcher, version):
+    return launcher.version_references(version)[0]
+
+
+def data_dirs(home):
+    return [core.VERSIONS_DIR, os.path.join(home, "libraries"), core.ASSETS_DIR, os.path.join(home, "store")]
+
+
+def install(launcher, *versions):
+    for version in versions:
+        assert launcher.download_version_files(version, launcher.versions[version])
+
+
+def stamp(home, **used_at):
+    with open(os.path.join(home, "usage.json"), "w") as f:
+        json.dump(used_at, f)
+
+
+def test_shared_libraries_are_hardlinked_into_the_store(launcher):
+    install(launcher, "bench-1", "bench-2")
+    for lib_path in library_paths(launcher, "bench-1"):
+        assert os.stat(lib_path).st_nlink == 2  # The library path and its blob
+
+
+def test_disk_usage_counts_hardlinked_files_once(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "lib.jar").write_bytes(b"x" * 1000)
+    os.link(tmp_path / "a" / "lib.jar", tmp_path / "b" / "lib.jar")
+    (tmp_path / "b" / "other.jar").write_bytes(b"y" * 10)
+    assert core.disk_usage([str(tmp_path / "a"), str(tmp_path / "b"), str(tmp_path / "missing")]) == 1010
+
+
+def test_removing_a_hardlinked_file_frees_nothing_until_its_last_link(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "lib.jar").write_bytes(b"x" * 1000)
+    (tmp_path / "a" / "other.jar").write_bytes(b"y" * 10)
+    os.link(tmp_path / "a" / "lib.jar", tmp_path / "lib.jar")
+    assert core.remove_path(str(tmp_path / "a")) == 10
+    assert not os.path.exists(tmp_path / "a")
+    assert core.remove_path(str(tmp_path / "lib.jar")) == 1000
+    assert core.remove_path(str(tmp_path / "missing")) == 0
+
+
+def test_eviction_measures_what_it_frees_instead_of_rewalking(launcher, home, monkeypatch):
+    install(launcher, "bench-1", "bench-2")
+    used = core.disk_usage(data_dirs(home))
+    walks = []
+    disk_usage = core.disk_usage
+    monkeypatch.setattr(core, "disk_usage", lambda paths: walks.append(paths) or disk_usage(paths))
+    freed, evicted = launcher.evict_versions(0)
+    assert sorted(evicted) == ["bench-1", "bench-2"]
+    assert len(walks) == 1
+    assert freed == used and disk_usage(data_dirs(home)) == 0
+
+
+def test_least_recently_used_version_goes_first(launcher, home):
+    install(launcher, "bench-1", "bench-2")
+    stamp(home, **{"bench-1": time.time(), "bench-2": time.time() - 3600})
+    used = core.disk_usage(data_dirs(home))
+    freed, evicted = launcher.evict_versions(used - 1)
+    assert evicted == ["bench-2"]
+    assert freed > 0 and core.disk_usage(data_dirs(home)) == used - freed
+    assert sorted(os.listdir(core.VERSIONS_DIR)) == ["bench-1"]
+    # Libraries and assets bench-1 still uses survive
+    assert all(os.path.exists(lib_path) for lib_path in library_paths(launcher, "bench-1"))
+    assert os.listdir(os.path.join(core.ASSETS_DIR, "indexes")) == ["bench.json"]
+    with open(os.path.join(home, "usage.json"), "r") as f:
+        assert list(json.load(f)) == ["bench-1"]
+
+
+def test_last_version_takes_its_libraries_and_assets_along(launcher, home):
+    install(launcher, "bench-1")
+    freed, evicted = launcher.evict_versions(0)
+    assert evicted == ["bench-1"]
+    assert core.disk_usage(data_dirs(home)) == 0
+
+
+def test_kept_versions_and_a_fitting_store_are_left_alone(launcher, home):
+    install(launcher, "bench-1", "bench-2")
+    assert launcher.evict_versions(10 * 1024 ** 3) == (0, [])
+    freed, evicted = launcher.evict_versions(0, keep_versions={"bench-1"})
+    assert evicted == ["bench-2"]
+    assert os.listdir(core.VERSIONS_DIR) == ["bench-1"]
+
+
+def test_prefetched_versions_count_as_used(launcher, home):
+    stamp(home, **{"bench-1": time.time() - 3600})
+    assert launcher.prefetch_versions(["bench-2"])
+    with open(os.path.join(home, "usage.json"), "r") as f:
+        assert json.load(f)["bench-2"] > time.time() - 60
+
+
+def test_versions_of_running_games_are_kept(launcher, home):
+    install(launcher, "bench-1", "bench-2")
+    session = launcher.games.launch(["sleep", "30"], "bench-1")  # Summaries let other processes see it too
+    try:
+        freed, evicted = core.LauncherCore().evict_versions(0)
+    finally:
+        session.process.kill()
+        session.wait(5)
+    assert evicted == ["bench-2"]
+
+
+def test_versions_of_instances_are_kept(launcher, home):
+    install(launcher, "bench-1", "bench-2")
+    launcher.instances.save("pvp", version="bench-2")
+    freed, evicted = launcher.evict_versions(0)
+    assert evicted == ["bench-1"]
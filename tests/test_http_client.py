@@ -0,0 +1,48 @@
+import urllib.error
+
+import pytest
+
+import catclient_core as core
+
+CLIENT_PATH = "/files/versions/bench-1/client.jar"
+
+
+@pytest.fixture
+def client():
+    client = core.HttpClient()
+    yield client
+    client.close()
+
+
+def test_keep_alive_connections_are_reused(server, client):
+    server.reset_stats()
+    for _ in range(5):
+        with client.open(server.base_url + CLIENT_PATH) as response:
+            assert response.read() == server.files[CLIENT_PATH]
+    assert server.reset_stats()["connections"] == 1
+
+
+def test_a_half_read_response_is_not_reused(server, client):
+    server.reset_stats()
+    with client.open(server.base_url + CLIENT_PATH) as response:
+        response.read(100)
+    assert client.get_json(server.base_url + "/meta/assets/bench.json")["objects"]
+    assert server.reset_stats()["connections"] == 2
+
+
+def test_redirects_are_followed(server, client, monkeypatch):
+    monkeypatch.setitem(server.redirects, "/moved/client.jar", CLIENT_PATH)
+    monkeypatch.setitem(server.redirects, "/moved/twice.jar", "/moved/client.jar")
+    with client.open(server.base_url + "/moved/twice.jar") as response:
+        assert response.status == 200
+        assert response.url == server.base_url + CLIENT_PATH
+        assert response.read() == server.files[CLIENT_PATH]
+
+
+def test_redirect_loops_and_errors_raise(server, client, monkeypatch):
+    monkeypatch.setitem(server.redirects, "/loop", "/loop")
+    with pytest.raises(urllib.error.URLError):
+        client.open(server.base_url + "/loop")
+    with pytest.raises(urllib.error.HTTPError) as error:
+        client.open(server.base_url + "/files/missing.jar")
+    assert error.value.code == 404
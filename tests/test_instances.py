@@ -0,0 +1,79 @@
+import os
+import shutil
+
+import pytest
+
+import catclient_cli as cli
+import catclient_core as core
+
+
+def test_parse_cpu_list(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    assert core.parse_cpu_list("0-3,6") == [0, 1, 2, 3, 6]
+    assert core.parse_cpu_list(" 5, 1-2,2 ") == [1, 2, 5]
+    for text in ("8", "6-9", "", "a-b"):
+        with pytest.raises(ValueError):
+            core.parse_cpu_list(text)
+
+
+def test_instance_store_validates_settings(home, monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    store = core.InstanceStore(core.INSTANCES_DIR)
+    instance = store.save("pvp", version="1.21.1", affinity=[3, 1, 1])
+    assert instance == dict(core.InstanceStore.DEFAULTS, name="pvp", version="1.21.1", affinity=[1, 3])
+    assert store.names() == ["pvp"]
+    assert store.save("pvp", ram=6)["affinity"] == [1, 3]
+
+    for name, settings in (("../escape", {"version": "1.21.1"}),
+                           ("x" * 33, {"version": "1.21.1"}),
+                           ("no-version", {}),
+                           ("bad-profile", {"version": "1.21.1", "profile": "turbo"}),
+                           ("bad-cpus", {"version": "1.21.1", "affinity": [4]})):
+        with pytest.raises(ValueError):
+            store.save(name, **settings)
+    assert store.names() == ["pvp"]
+
+
+def test_only_root_may_set_a_negative_nice(home, monkeypatch):
+    if not hasattr(os, "geteuid"):
+        pytest.skip("nice levels are POSIX only")
+    store = core.InstanceStore(core.INSTANCES_DIR)
+    monkeypatch.setattr(os, "geteuid", lambda: 1000)
+    with pytest.raises(ValueError):
+        store.save("bot", version="1.21.1", nice=-5)
+    assert store.save("bot", version="1.21.1", nice=5)["nice"] == 5
+    monkeypatch.setattr(os, "geteuid", lambda: 0)
+    assert store.save("bot", nice=-5)["nice"] == -5
+
+
+def test_placement_wraps_the_command_in_taskset_and_nice(monkeypatch):
+    monkeypatch.setattr(core.platform, "system", lambda: "Linux")
+    monkeypatch.setattr(shutil, "which", lambda tool: f"/usr/bin/{tool}")
+    command, popen_kwargs, leftover = core.process_placement(["java", "-jar", "game.jar"], [1, 3], 5)
+    assert command == ["taskset", "-c", "1,3", "nice", "-n", "5", "java", "-jar", "game.jar"]
+    assert (popen_kwargs, leftover) == ({}, (None, 0))
+
+    monkeypatch.setattr(shutil, "which", lambda tool: None if tool == "taskset" else f"/usr/bin/{tool}")
+    command, _, leftover = core.process_placement(["java"], [1, 3], 0)
+    assert command == ["java"]
+    assert leftover == ([1, 3], 0)  # No taskset on macOS; pinned after start instead
+
+
+def test_a_running_instance_is_neither_launched_again_nor_deleted(home):
+    other = core.LauncherCore()  # Stands in for another launcher process; only its game's summary is shared
+    other.instances.save("pvp", version="bench-1")
+    session = other.games.launch(["sh", "-c", "exec sleep 30"], "bench-1", instance="pvp")
+    try:
+        launcher = core.LauncherCore()
+        assert launcher.instances.is_running("pvp")
+        assert launcher.launch_instance("pvp") is None
+        assert launcher.games.running() == []
+        with pytest.raises(ValueError):
+            launcher.instances.delete("pvp", delete_files=True)
+        assert cli.main(["instance", "delete", "pvp"]) == 1
+        assert launcher.instances.names() == ["pvp"]
+    finally:
+        session.process.kill()
+        session.wait(10)
+    assert cli.main(["instance", "delete", "pvp", "--delete-files"]) == 0
+    assert core.InstanceStore(core.INSTANCES_DIR).names() == []
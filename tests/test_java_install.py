@@ -0,0 +1,43 @@
+import json
+import os
+
+import catclient_core as core
+from stand_in import ADOPTIUM_PATH, JDK_DIR_NAME
+
+
+def leftovers():
+    return [name for name in os.listdir(core.JAVA_DIR) if name.startswith(".staging-") or name.endswith(".part")]
+
+
+def test_jdk_is_unpacked_and_verified(launcher):
+    launcher.install_java_if_needed()
+    java_runtime = launcher.find_java()
+    assert java_runtime["path"] == os.path.join(core.JAVA_DIR, JDK_DIR_NAME, "bin", "java")
+    assert java_runtime["major"] == 21
+    assert os.path.exists(os.path.join(core.JAVA_DIR, JDK_DIR_NAME, "lib", "modules"))
+    assert leftovers() == []
+
+
+def test_jdk_with_a_bad_sha256_is_never_installed(launcher, server, monkeypatch):
+    releases = json.loads(server.files[ADOPTIUM_PATH])
+    for release in releases:
+        release["binary"]["package"]["checksum"] = "0" * 64
+    monkeypatch.setitem(server.files, ADOPTIUM_PATH, json.dumps(releases).encode())
+    launcher.install_java_if_needed()
+    assert launcher.find_java() is None
+    assert not os.path.exists(os.path.join(core.JAVA_DIR, JDK_DIR_NAME))
+    assert leftovers() == []
+
+
+def test_interrupted_jdk_download_resumes_from_its_part(launcher, server):
+    url = json.loads(server.files[ADOPTIUM_PATH])[0]["binary"]["package"]["link"]
+    archive = server.files[url[len(server.base_url):]]
+    os.makedirs(core.JAVA_DIR)
+    with open(os.path.join(core.JAVA_DIR, os.path.basename(url) + ".part"), "wb") as f:
+        f.write(archive[:len(archive) // 2])
+    server.reset_stats()
+    launcher.install_java_if_needed()
+    assert launcher.find_java() is not None
+    # The release list, then only the half of the archive that was missing
+    assert server.reset_stats()["bytes"] == len(server.files[ADOPTIUM_PATH]) + len(archive) - len(archive) // 2
+    assert leftovers() == []
@@ -0,0 +1,59 @@
+import catclient_core as core
+
+GB = 1024 ** 3
+
+
+def hardware(cores, total_gb, available_gb=None):
+    return {"cores": cores, "total": total_gb * GB, "available": available_gb * GB if available_gb else None}
+
+
+def test_auto_profile_follows_the_machine(home):
+    launcher = core.LauncherCore()
+    launcher.hardware = hardware(4, 4)
+    flags, _, profile = launcher.resolve_jvm_flags("auto", 4, None)
+    assert profile == "low-memory"
+    assert "-Xmx2048M" in flags
+
+    launcher.hardware = hardware(16, 32, 24)
+    flags, _, profile = launcher.resolve_jvm_flags("auto", 8, None)
+    assert profile == "low-latency"
+    assert {"-Xmx8192M", "-Xms8192M", "-XX:+UseZGC", "-XX:+ZGenerational"} <= set(flags)
+    assert "-XX:+AlwaysPreTouch" not in flags
+
+    launcher.hardware = hardware(8, 16, 6)
+    assert launcher.resolve_jvm_flags("auto", 4, None)[2] == "balanced"
+
+
+def test_heap_is_capped_to_leave_the_os_room(home):
+    launcher = core.LauncherCore()
+    launcher.hardware = hardware(8, 8)
+    flags, notes, _ = launcher.resolve_jvm_flags("balanced", 16, None)
+    assert "-Xmx6144M" in flags  # 8 GB less the 2 GB OS_RESERVE_MB
+    assert any("lowered" in note for note in notes)
+
+    launcher.hardware = hardware(8, 16, 3)
+    assert "-Xmx2560M" in launcher.resolve_jvm_flags("balanced", 8, None)[0]  # Free memory less 512 MB
+
+
+def test_low_latency_falls_back_to_g1_without_a_concurrent_collector(home, monkeypatch):
+    launcher = core.LauncherCore()
+    launcher.hardware = hardware(16, 32, 24)
+    monkeypatch.setattr(launcher.java_probes, "supports", lambda java_bin, *flags: False)
+    flags, notes, profile = launcher.resolve_jvm_flags("low-latency", 4, {"major": 11, "path": "/usr/bin/java"})
+    assert profile == "low-latency"
+    assert "-XX:+UseG1GC" in flags and "-XX:MaxGCPauseMillis=30" in flags
+    assert any("neither ZGC nor Shenandoah" in note for note in notes)
+
+
+def test_collectors_are_probed_with_the_flags_the_launch_passes(home, tmp_path):
+    java_bin = tmp_path / "java"
+    # Like a JDK where the flag only works behind -XX:+UnlockExperimentalVMOptions
+    java_bin.write_text('#!/bin/sh\necho "$*" >> "$0.log"\n'
+                        'case "$*" in *-XX:+UnlockExperimentalVMOptions*) exit 0 ;; *-XX:+UseZGC*) exit 1 ;; esac\n')
+    java_bin.chmod(0o755)
+    launcher = core.LauncherCore()
+    launcher.hardware = hardware(16, 32, 24)
+    flags, _, _ = launcher.resolve_jvm_flags("low-latency", 4, {"major": 21, "path": str(java_bin)})
+    assert "-XX:+UseZGC" not in flags and "-XX:+UseShenandoahGC" in flags
+    with open(f"{java_bin}.log", "r") as f:
+        assert f.read().splitlines() == ["-XX:+UseZGC -XX:+ZGenerational -version", "-XX:+UseShenandoahGC -version"]
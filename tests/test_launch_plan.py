@@ -0,0 +1,65 @@
+import json
+import os
+
+import catclient_core as core
+
+
+def plan_path(version):
+    return os.path.join(core.VERSIONS_DIR, version, f"{version}.plan.json")
+
+
+def test_cached_plan_is_reused(installed, monkeypatch):
+    command = installed.build_launch_command("bench-1", "Cat", 1, cds=False)
+    assert os.path.exists(plan_path("bench-1"))
+    monkeypatch.setattr(core.LauncherCore, "resolve_launch_plan", None)  # Any re-resolve would raise
+    assert core.LauncherCore().build_launch_command("bench-1", "Cat", 1, cds=False) == command
+    assert installed.build_launch_command("bench-1", "Kitty", 1, cds=False) != command  # Player args still vary
+
+
+def test_plan_is_resolved_again_when_its_inputs_change(installed, monkeypatch):
+    java_runtime = installed.find_java()
+    plan = installed.load_launch_plan("bench-1", java_runtime)
+    resolved = []
+    resolve_launch_plan = installed.resolve_launch_plan
+
+    def counting_resolve(*args):
+        resolved.append(args[0])
+        return resolve_launch_plan(*args)
+
+    monkeypatch.setattr(installed, "resolve_launch_plan", counting_resolve)
+    assert installed.load_launch_plan("bench-1", java_runtime) == plan
+    assert resolved == []
+
+    installed.load_launch_plan("bench-1", dict(java_runtime, version="21.0.6"))  # Java updated in place
+    assert len(resolved) == 1
+
+    json_path = os.path.join(core.VERSIONS_DIR, "bench-1", "bench-1.json")
+    with open(json_path, "r") as f:
+        data = json.load(f)
+    data["mainClass"] = "net.minecraft.client.main.Other"
+    with open(json_path, "w") as f:
+        json.dump(data, f)
+    assert installed.load_launch_plan("bench-1", java_runtime)["main_class"] == "net.minecraft.client.main.Other"
+
+    monkeypatch.setattr(core, "LAUNCH_PLAN_FORMAT", core.LAUNCH_PLAN_FORMAT + 1)
+    installed.load_launch_plan("bench-1", java_runtime)
+    assert len(resolved) == 3
+
+
+def test_unreadable_plan_is_replaced(installed):
+    command = installed.build_launch_command("bench-1", "Cat", 1, cds=False)
+    with open(plan_path("bench-1"), "w") as f:
+        f.write("{not json")
+    assert core.LauncherCore().build_launch_command("bench-1", "Cat", 1, cds=False) == command
+    with open(plan_path("bench-1"), "r") as f:
+        assert json.load(f)["main_class"] == "net.minecraft.client.main.Main"
+
+
+def test_a_library_missing_at_resolve_time_stays_on_the_classpath(installed):
+    classpath = installed.load_launch_plan("bench-1", installed.find_java())["classpath"]
+    os.remove(plan_path("bench-1"))
+    os.remove(classpath[1])
+    assert installed.load_launch_plan("bench-1", installed.find_java())["classpath"] == classpath
+    # Once the download puts the jar back, the cached plan already has it
+    assert installed.download_version_files("bench-1", installed.versions["bench-1"])
+    assert all(os.path.exists(path) for path in classpath)
@@ -0,0 +1,37 @@
+import json
+import os
+
+import catclient_core as core
+from stand_in import sha1
+
+MANIFEST_PATH = "/meta/version_manifest.json"
+
+
+def test_revalidation_gets_304_and_keeps_the_cache(launcher, server):
+    server.reset_stats()
+    assert core.LauncherCore().ensure_version_manifest()
+    assert server.reset_stats()["bytes"] == 0  # Answered 304 Not Modified, with no body
+    with open(core.MANIFEST_META_PATH, "r") as f:
+        assert json.load(f)["etag"] == server.etags[MANIFEST_PATH]
+
+
+def test_changed_manifest_replaces_the_cache(launcher, server, monkeypatch):
+    manifest = json.loads(server.files[MANIFEST_PATH])
+    manifest["versions"].insert(0, dict(manifest["versions"][0], id="bench-new"))
+    body = json.dumps(manifest).encode()
+    monkeypatch.setitem(server.files, MANIFEST_PATH, body)
+    monkeypatch.setitem(server.etags, MANIFEST_PATH, f'"{sha1(body)}"')
+
+    refreshed = core.LauncherCore()
+    assert refreshed.ensure_version_manifest()
+    assert "bench-new" in refreshed.versions
+    with open(core.MANIFEST_CACHE_PATH, "r") as f:
+        assert json.load(f) == manifest
+
+
+def test_offline_start_uses_the_cache(launcher, monkeypatch):
+    monkeypatch.setattr(core, "VERSION_MANIFEST_URL", "http://127.0.0.1:9/version_manifest.json")
+    offline = core.LauncherCore()
+    assert offline.ensure_version_manifest()
+    assert offline.versions == launcher.versions
+    assert os.path.exists(core.MANIFEST_CACHE_PATH)
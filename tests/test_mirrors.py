@@ -0,0 +1,59 @@
+import json
+import os
+
+import pytest
+
+import catclient_core as core
+from stand_in import StandInServer
+
+
+@pytest.fixture
+def mirror(server, home):
+    """Start a second stand-in with the same artifacts and list it in mirrors.json; call with its fail rate."""
+    started = []
+
+    def start(fail_rate=0.0, prefix="/files"):
+        mirror = StandInServer(fail_rate=fail_rate, versions=2, libraries=5, assets=20, client_size=64 * 1024,
+                               jdk_size=64 * 1024).start()
+        started.append(mirror)
+        os.makedirs(home, exist_ok=True)
+        with open(os.path.join(home, "mirrors.json"), "w") as f:
+            json.dump({"mirrors": [{"name": "stand-in", "rewrite": {server.base_url + prefix: mirror.base_url + prefix}}]}, f)
+        return mirror
+
+    yield start
+    for mirror in started:
+        mirror.shutdown()
+
+
+def download(launcher):
+    return launcher.download_version_files("bench-1", launcher.versions["bench-1"])
+
+
+def test_the_fastest_host_serves_artifacts(launcher, server, mirror, monkeypatch):
+    fast = mirror()
+    monkeypatch.setattr(server, "latency", 0.05)
+    server.reset_stats()
+    assert download(launcher)
+    metadata = server.files["/meta/versions/bench-1.json"] + server.files["/meta/assets/bench.json"]
+    assert server.reset_stats()["bytes"] == len(metadata)  # Everything else came from the mirror
+    assert fast.stats["bytes"] > 64 * 1024
+
+
+def test_a_failing_mirror_falls_back_to_upstream(launcher, server, mirror, monkeypatch):
+    broken = mirror(fail_rate=1.0)
+    monkeypatch.setattr(server, "latency", 0.05)
+    assert download(launcher)
+    assert broken.stats["failures"] > 0
+    assert core.url_origin(broken.base_url) in core.MIRRORS.failed
+    # Once marked failed, the mirror goes behind upstream until the next probe
+    client_url = f"{server.base_url}/files/versions/bench-1/client.jar"
+    assert core.MIRRORS.candidates(client_url)[0] == client_url
+
+
+def test_metadata_only_comes_from_upstream(home, server, mirror):
+    everything = mirror(prefix="")
+    launcher = core.LauncherCore()
+    assert launcher.ensure_version_manifest()
+    assert launcher.fetch_version_json("bench-1", launcher.versions["bench-1"]) is not None
+    assert everything.stats["requests"] == 0
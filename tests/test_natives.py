@@ -0,0 +1,67 @@
+import json
+import os
+import threading
+
+import catclient_core as core
+
+
+def version_data(version):
+    with open(os.path.join(core.VERSIONS_DIR, version, f"{version}.json"), "r") as f:
+        return json.load(f)
+
+
+def natives_dir(version):
+    return os.path.join(core.VERSIONS_DIR, version, "natives")
+
+
+def test_natives_are_extracted_without_excluded_files(installed):
+    assert sorted(os.listdir(natives_dir("bench-1"))) == [".extracted.json", "liblwjgl.so"]
+
+
+def test_extracted_natives_are_not_fetched_again(installed):
+    jobs, natives = installed.collect_version_jobs("bench-1", version_data("bench-1"))
+    assert natives == [] and all(job[0] != "native" for job in jobs)
+
+    os.remove(os.path.join(natives_dir("bench-1"), "liblwjgl.so"))
+    jobs, natives = installed.collect_version_jobs("bench-1", version_data("bench-1"))
+    assert len(natives) == 1 and any(job[0] == "native" for job in jobs)
+
+
+def test_a_new_native_jar_is_extracted_again(installed):
+    data = version_data("bench-1")
+    for lib in data["libraries"]:
+        for native in lib["downloads"].get("classifiers", {}).values():
+            native["sha1"] = "0" * 40
+    jobs, natives = installed.collect_version_jobs("bench-1", data)
+    assert [native[3] for native in natives] == ["0" * 40]
+
+
+def test_natives_another_launcher_already_extracted(launcher, home):
+    launcher.verify_index = core.VerifyIndex(os.path.join(home, "verify_index.json"))
+    launcher.blob_store = core.BlobStore(os.path.join(home, "store"))
+    launcher.deep_verify = False
+    data = launcher.fetch_version_json("bench-1", launcher.versions["bench-1"])
+    jobs, natives = launcher.collect_version_jobs("bench-1", data)
+    assert launcher.run_download_jobs([job for job in jobs if job[0] == "native"], "natives")
+    # The second call stands in for a launcher that collected the same jobs, then waited on the natives lock
+    assert launcher.extract_natives("bench-1", natives)
+    assert launcher.extract_natives("bench-1", natives)
+    assert sorted(os.listdir(natives_dir("bench-1"))) == [".extracted.json", "liblwjgl.so"]
+
+
+def test_two_launchers_installing_one_version_at_once(home):
+    results = []
+
+    def install():
+        launcher = core.LauncherCore()
+        launcher.ensure_version_manifest()
+        results.append(launcher.download_version_files("bench-1", launcher.versions["bench-1"]))
+
+    threads = [threading.Thread(target=install) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True, True]
+    assert sorted(os.listdir(natives_dir("bench-1"))) == [".extracted.json", "liblwjgl.so"]
+    assert os.listdir(os.path.join(home, "locks")) == []
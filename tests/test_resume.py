@@ -0,0 +1,60 @@
+import hashlib
+import os
+
+import pytest
+
+import catclient_core as core
+from stand_in import StandInServer
+
+CLIENT_PATH = "/files/versions/bench-1/client.jar"
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_fetch_resumes_from_a_partial_file(server, tmp_path):
+    body = server.files[CLIENT_PATH]
+    part_path = str(tmp_path / "client.jar.part")
+    write(part_path, body[:1000])
+    server.reset_stats()
+    hasher, size = core.fetch_into_part(server.base_url + CLIENT_PATH, part_path, len(body))
+    assert (hasher.hexdigest(), size) == (hashlib.sha1(body).hexdigest(), len(body))
+    assert server.reset_stats()["bytes"] == len(body) - 1000
+    with open(part_path, "rb") as f:
+        assert f.read() == body
+
+
+def test_fetch_accepts_a_complete_part_of_unknown_size(server, tmp_path):
+    body = server.files[CLIENT_PATH]
+    part_path = str(tmp_path / "client.jar.part")
+    for stale in (body, body + b"left over from another file"):
+        write(part_path, stale)
+        hasher, size = core.fetch_into_part(server.base_url + CLIENT_PATH, part_path)
+        assert (hasher.hexdigest(), size) == (hashlib.sha1(body).hexdigest(), len(body))
+        with open(part_path, "rb") as f:
+            assert f.read() == body
+
+
+def test_stream_download_retries_cut_off_transfers(home, tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "RETRY_BACKOFF", 0.01)
+    flaky = StandInServer(fail_rate=0.5, seed=3, libraries=1, assets=1, client_size=256 * 1024, jdk_size=1024).start()
+    try:
+        body = flaky.files[CLIENT_PATH]
+        dest_path = str(tmp_path / "client.jar")
+        digest, size = core.stream_download(flaky.base_url + CLIENT_PATH, dest_path, hashlib.sha1(body).hexdigest(),
+                                            len(body), retries=20)
+        assert flaky.stats["failures"] > 0
+    finally:
+        flaky.shutdown()
+    assert (digest, size) == (hashlib.sha1(body).hexdigest(), len(body))
+    assert not os.path.exists(dest_path + ".part")
+
+
+def test_stream_download_rejects_a_bad_checksum(home, server, tmp_path):
+    dest_path = str(tmp_path / "client.jar")
+    with pytest.raises(core.DownloadError):
+        core.stream_download(server.base_url + CLIENT_PATH, dest_path, "0" * 40)
+    assert not os.path.exists(dest_path)
+    assert not os.path.exists(dest_path + ".part")
@@ -0,0 +1,39 @@
+import threading
+import time
+
+import catclient_core as core
+
+
+def test_scheduler_runs_higher_priority_first():
+    scheduler = core.DownloadScheduler(workers=1)
+    gate = threading.Event()
+    order = []
+    blocker = scheduler.submit(gate.wait, core.PRIORITY_CRITICAL, "a")
+    jobs = [scheduler.submit(lambda name=name: order.append(name), priority, "a")
+            for name, priority in (("background", core.PRIORITY_BACKGROUND), ("assets", core.PRIORITY_ASSETS),
+                                   ("critical", core.PRIORITY_CRITICAL))]
+    gate.set()
+    for future in [blocker] + jobs:
+        future.result(5)
+    assert order == ["critical", "assets", "background"]
+
+
+def test_scheduler_holds_each_host_to_its_limit():
+    scheduler = core.DownloadScheduler(workers=6, host_limit=2)
+    lock = threading.Lock()
+    running = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    def job(host):
+        with lock:
+            running[host] += 1
+            peak[host] = max(peak[host], running[host])
+        time.sleep(0.05)
+        with lock:
+            running[host] -= 1
+
+    futures = [scheduler.submit(lambda: job("a"), core.PRIORITY_CRITICAL, "a") for _ in range(6)]
+    futures += [scheduler.submit(lambda: job("b"), core.PRIORITY_CRITICAL, "b", limit=1) for _ in range(3)]
+    for future in futures:
+        future.result(5)
+    assert peak == {"a": 2, "b": 1}
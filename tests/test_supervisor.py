@@ -0,0 +1,70 @@
+import json
+import os
+
+import catclient_core as core
+
+
+def run(launcher, script, version="bench-1"):
+    session = launcher.games.launch(["sh", "-c", script], version)
+    assert session.wait(10) is not None
+    return session
+
+
+def summary(session):
+    with open(session.log_path[:-len(".log")] + ".json", "r") as f:
+        return json.load(f)
+
+
+def test_log_rolls_over_by_bytes(home, monkeypatch):
+    monkeypatch.setattr(core, "GAME_LOG_MAX_BYTES", 1000)
+    launcher = core.LauncherCore()
+    # 1000 lines of 3-byte characters: a limit counted in characters would roll over three times less often
+    session = run(launcher, "i=0; while [ $i -lt 1000 ]; do echo 'ねこ'; i=$((i + 1)); done")
+    assert session.exit_code == 0
+    parts = [session.log_path] + [f"{session.log_path}.{index}" for index in range(1, core.GAME_LOG_BACKUPS + 1)]
+    assert all(os.path.exists(path) for path in parts)
+    assert not os.path.exists(f"{session.log_path}.{core.GAME_LOG_BACKUPS + 1}")
+    for path in parts[1:]:
+        assert 1000 <= os.path.getsize(path) < 1000 + len("ねこ\n".encode("utf-8"))
+
+
+def test_crash_cause_is_read_from_the_output(home):
+    launcher = core.LauncherCore()
+    session = run(launcher, "echo 'Exception in thread \"main\" java.lang.OutOfMemoryError: Java heap space' >&2; exit 1")
+    assert session.exit_code == 1
+    assert session.cause == "The game ran out of memory; raise the RAM setting"
+    assert summary(session)["state"] == "crashed"
+    assert summary(session)["cause"] == session.cause
+
+    session = run(launcher, "echo 'Crash report saved to: #@!@# /tmp/crash-report.txt'; exit 2")
+    assert session.cause == "Exited with code 2 before the first frame"
+    assert session.crash_report == "/tmp/crash-report.txt"
+
+
+def test_other_processes_see_a_running_game(home):
+    launcher = core.LauncherCore()
+    session = launcher.games.launch(["sleep", "30"], "bench-1")
+    try:
+        logs_dir = os.path.join(home, "logs")
+        assert [s["pid"] for s in core.GameSupervisor.running_summaries(logs_dir)] == [session.pid]
+        assert summary(session)["state"] == "starting"
+    finally:
+        session.process.kill()
+    session.wait(10)
+    assert core.GameSupervisor.running_summaries(logs_dir) == []
+    assert summary(session)["exit_code"] == session.exit_code
+
+
+def test_pruning_keeps_the_logs_of_running_games(home, monkeypatch):
+    monkeypatch.setattr(core, "GAME_LOG_HISTORY", 2)
+    launcher = core.LauncherCore()
+    running = launcher.games.launch(["sleep", "30"], "bench-1")
+    try:
+        finished = [run(launcher, "exit 0") for _ in range(3)]
+        assert os.path.exists(running.log_path)
+        assert [os.path.exists(session.log_path) for session in finished] == [False, True, True]
+        run(launcher, "exit 0")  # Another launcher process would prune the same way
+        assert os.path.exists(running.log_path)
+    finally:
+        running.process.kill()
+        running.wait(10)
@@ -0,0 +1,53 @@
+import hashlib
+import os
+
+import catclient_core as core
+
+
+def write(path, data):
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def test_unchanged_file_is_trusted_without_rehashing(tmp_path, monkeypatch):
+    file_path = str(tmp_path / "lib.jar")
+    write(file_path, b"cat" * 100)
+    digest = hashlib.sha1(b"cat" * 100).hexdigest()
+    index = core.VerifyIndex(str(tmp_path / "verify_index.json"))
+    assert index.verify(file_path, digest)
+    index.save()
+
+    index = core.VerifyIndex(str(tmp_path / "verify_index.json"))
+    monkeypatch.setattr(core, "sha1_file", None)  # Any attempt to hash would raise
+    assert index.verify(file_path, digest)
+
+
+def test_changed_file_is_rehashed(tmp_path):
+    file_path = str(tmp_path / "lib.jar")
+    write(file_path, b"cat" * 100)
+    digest = hashlib.sha1(b"cat" * 100).hexdigest()
+    index = core.VerifyIndex(str(tmp_path / "verify_index.json"))
+    assert index.verify(file_path, digest)
+    write(file_path, b"dog" * 100)  # Same size; the new mtime alone must invalidate the record
+    os.utime(file_path, ns=(0, 1))
+    assert not index.verify(file_path, digest)
+    assert index.verify(file_path, hashlib.sha1(b"dog" * 100).hexdigest())
+
+
+def test_deep_verify_rehashes_an_unchanged_file(tmp_path):
+    file_path = str(tmp_path / "lib.jar")
+    write(file_path, b"cat")
+    index = core.VerifyIndex(str(tmp_path / "verify_index.json"))
+    index.record(file_path, "0" * 40)  # A stale record that matches the file's stat tuple
+    assert index.verify(file_path, "0" * 40)
+    assert not index.verify(file_path, "0" * 40, deep=True)
+
+
+def test_save_forgets_deleted_files(tmp_path):
+    file_path = str(tmp_path / "lib.jar")
+    write(file_path, b"cat")
+    index = core.VerifyIndex(str(tmp_path / "verify_index.json"))
+    index.record(file_path, hashlib.sha1(b"cat").hexdigest())
+    os.remove(file_path)
+    index.save()
+    assert core.VerifyIndex(str(tmp_path / "verify_index.json")).records == {}
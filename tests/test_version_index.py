@@ -0,0 +1,36 @@
+import catclient_core as core
+
+MANIFEST = {"latest": {"release": "1.21.1", "snapshot": "24w33a"}, "versions": [
+    {"id": "1.20.4", "type": "release", "releaseTime": "2023-12-07T12:56:20+00:00"},
+    {"id": "1.21.1", "type": "release", "releaseTime": "2024-08-08T12:24:45+00:00"},
+    {"id": "24w33a", "type": "snapshot", "releaseTime": "2024-08-15T12:39:34+00:00"},
+    {"id": "1.21", "type": "release", "releaseTime": "2024-06-13T08:24:03+00:00"},
+    {"id": "b1.7.3", "type": "old_beta", "releaseTime": "2011-07-07T22:00:00+00:00"},
+]}
+
+
+def ids(entries):
+    return [entry["id"] for entry in entries]
+
+
+def test_search_ranks_prefix_matches_first_then_newest():
+    index = core.VersionIndex(MANIFEST)
+    assert ids(index.search("")) == ["24w33a", "1.21.1", "1.21", "1.20.4", "b1.7.3"]
+    assert ids(index.search("1.2")) == ["1.21.1", "1.21", "1.20.4"]
+    assert ids(index.search("1.7")) == ["b1.7.3"]
+    assert ids(index.search(" 1.21.1 ")) == ["1.21.1"]
+
+
+def test_search_narrowing_query_matches_a_fresh_search():
+    index = core.VersionIndex(MANIFEST)
+    for query in ("1", "1.", "1.2", "1.21", "1.21."):
+        assert ids(index.search(query)) == ids(core.VersionIndex(MANIFEST).search(query))
+    assert ids(index.search("w")) == ["24w33a"]  # Not a narrowing of "1.21."; rescans everything
+
+
+def test_search_filters_by_type_and_date():
+    index = core.VersionIndex(MANIFEST)
+    assert ids(index.search("", types={"release"}, since="2024")) == ["1.21.1", "1.21"]
+    assert ids(index.search("", until="2023-12")) == ["1.20.4", "b1.7.3"]
+    assert ids(index.search("1.21", since="2024-07")) == ["1.21.1"]
+